@@ -0,0 +1,164 @@
+"""
+주요 화면/API 벤치마크 (manage.py benchmark hot_views)
+- 대시보드, 통계, 마이페이지, 태그 목록 조회와 시간 블록 저장/삭제, 태그 생성의
+  처리 시간(p50/p95)과 쿼리 수 측정 (뷰 직접 호출)
+- --user를 지정하면 seed_lifediary 등으로 만든 기존 사용자 데이터로, 생략하면
+  --years별 합성 사용자로 측정 (어느 쪽이든 측정 중 변경한 데이터는 롤백)
+"""
+
+import json
+from datetime import date, timedelta
+from itertools import count
+
+from django.contrib.auth.models import User
+from django.core.management.base import CommandError
+from django.test import RequestFactory
+
+from apps.dashboard.storage import copy_rows_to_day_logs, get_timeblock_storage
+from apps.dashboard.views import dashboard_view, time_block_api
+from apps.stats.views import index as stats_index
+from apps.tags.cache import expire_user_tags
+from apps.tags.models import Tag
+from apps.tags.views import tag_list_create
+from apps.users.views import mypage
+from .cache import expire_user_data_version
+from .synthetic import (
+    create_synthetic_goals_and_notes,
+    create_synthetic_user,
+    measure,
+    rolled_back,
+)
+
+# 조회 화면/API: (이름, 뷰, 경로)
+READ_VIEWS = [
+    ("dashboard", dashboard_view, "/dashboard/"),
+    ("stats", stats_index, "/stats/"),
+    ("mypage", mypage, "/accounts/mypage/"),
+    ("tag_list", tag_list_create, "/api/tags/"),
+]
+
+# 시간 블록 저장/삭제에 사용할 슬롯 구간 (09:00~17:50)
+WRITE_SLOTS = list(range(54, 108))
+
+
+def _call(view, user, method, path, payload=None):
+    factory = RequestFactory()
+    if payload is None:
+        request = getattr(factory, method)(path)
+    else:
+        request = getattr(factory, method)(
+            path, json.dumps(payload), content_type="application/json"
+        )
+    request.user = user
+    response = view(request)
+    if response.status_code >= 400:
+        raise RuntimeError(f"{path} {method}: {response.status_code}")
+    return response
+
+
+def _get_seeded_users(usernames):
+    users = list(User.objects.filter(username__in=usernames).order_by("username"))
+    missing = set(usernames) - {user.username for user in users}
+    if missing:
+        raise CommandError(f"존재하지 않는 사용자: {', '.join(sorted(missing))}")
+    return users
+
+
+def _measure_user(user, label, repeat):
+    """사용자 한 명에 대해 조회(warm/cold)와 쓰기 요청 측정"""
+    results = []
+    for name, view, path in READ_VIEWS:
+        for cache_state in ("warm", "cold"):
+
+            def load():
+                if cache_state == "cold":
+                    # 공유 캐시일 수 있으므로 측정 사용자의 캐시만 무효화
+                    expire_user_data_version(user.id)
+                    expire_user_tags(user.id)
+                _call(view, user, "get", path)
+
+            results.append(
+                {
+                    **label,
+                    "view": name,
+                    "cache": cache_state,
+                    **measure(load, repeat=repeat),
+                }
+            )
+
+    # 저장은 최근 날짜부터 하루씩 거슬러 올라가며 기존 기록을 덮어쓰고,
+    # 삭제는 같은 순서로 방금 저장한 슬롯을 지움 (빈 날짜를 삭제하지 않도록)
+    tag_id = Tag.objects.filter(user=user).values_list("id", flat=True).first()
+    end_date = date.today()
+    post_dates = (end_date - timedelta(days=offset) for offset in count())
+    delete_dates = (end_date - timedelta(days=offset) for offset in count())
+
+    def post_blocks():
+        _call(
+            time_block_api,
+            user,
+            "post",
+            "/api/time-blocks/",
+            {
+                "date": next(post_dates).isoformat(),
+                "slot_indexes": WRITE_SLOTS,
+                "tag_id": tag_id,
+            },
+        )
+
+    def delete_blocks():
+        _call(
+            time_block_api,
+            user,
+            "delete",
+            "/api/time-blocks/",
+            {"date": next(delete_dates).isoformat(), "slot_indexes": WRITE_SLOTS},
+        )
+
+    tag_numbers = count(1)
+
+    def create_tag():
+        _call(
+            tag_list_create,
+            user,
+            "post",
+            "/api/tags/",
+            {"name": f"bench-{next(tag_numbers)}", "color": "#336699"},
+        )
+
+    for name, send in (
+        ("time_block_post", post_blocks),
+        ("time_block_delete", delete_blocks),
+        ("tag_create", create_tag),
+    ):
+        results.append(
+            {**label, "view": name, "cache": "-", **measure(send, repeat=repeat)}
+        )
+    return results
+
+
+def hot_views(options):
+    """
+    화면/API별 측정 항목
+    - years 또는 user: 측정 데이터 (합성 사용자 기록 기간 / 기존 사용자명)
+    - view: 측정 대상, cache: warm(캐시 유지) / cold(요청마다 측정 사용자의 캐시 비움) / -(쓰기 요청)
+    - p50_ms 등: 요청 전체 처리 시간, queries: 마지막 요청의 쿼리 수
+    """
+    results = []
+    if options.get("usernames"):
+        for user in _get_seeded_users(options["usernames"]):
+            with rolled_back():
+                results.extend(
+                    _measure_user(user, {"user": user.username}, options["repeat"])
+                )
+        return results
+
+    to_day_logs = get_timeblock_storage().name == "daylog"
+    for years in options["years"]:
+        with rolled_back():
+            user = create_synthetic_user(f"bench_views_{years}y", years)
+            create_synthetic_goals_and_notes(user, years)
+            if to_day_logs:
+                copy_rows_to_day_logs(user.id)
+            results.extend(_measure_user(user, {"years": years}, options["repeat"]))
+    return results
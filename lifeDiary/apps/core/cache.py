@@ -0,0 +1,176 @@
+"""
+=================================================================================
+사용자별 데이터 버전 기반 캐시
+- 통계 등 계산 결과를 (사용자, 기간 종류, 기간 시작일) 단위로 캐시
+- 항목마다 저장 당시의 데이터 버전을 함께 보관하고, 조회 시 현재 버전과 다르면 무효
+- 시간 블록/태그가 변경되면 bump_data_version()으로 버전만 갱신 (항목 삭제 불필요)
+- 캐시 백엔드는 settings.CACHES의 STATS_CACHE_ALIAS(기본값: "default")를 사용
+=================================================================================
+"""
+
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import transaction
+
+GLOBAL_VERSION_KEY = "data-version:global"
+DEFAULT_TIMEOUT = 60 * 60 * 24 * 7  # 7일
+
+
+class CacheCounter:
+    """스레드 안전한 캐시 적중/실패 카운터"""
+
+    def __init__(self, name):
+        self.name = name
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def record(self, hits=0, misses=0):
+        with self._lock:
+            self.hits += hits
+            self.misses += misses
+
+    def snapshot(self):
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses}
+
+
+# 캐시 이름 → CacheCounter
+CACHE_COUNTERS = {}
+_counters_lock = threading.Lock()
+
+
+def get_cache_counter(name):
+    """이름별 CacheCounter (없으면 생성)"""
+    with _counters_lock:
+        if name not in CACHE_COUNTERS:
+            CACHE_COUNTERS[name] = CacheCounter(name)
+        return CACHE_COUNTERS[name]
+
+
+def get_cache_counter_snapshots():
+    """캐시 이름 → {"hits", "misses"} (이름순)"""
+    with _counters_lock:
+        counters = sorted(CACHE_COUNTERS.items())
+    return {name: counter.snapshot() for name, counter in counters}
+
+
+def get_cache():
+    return caches[getattr(settings, "STATS_CACHE_ALIAS", "default")]
+
+
+def is_shared_cache():
+    """
+    데이터 버전 캐시가 여러 워커 프로세스에서 공유되는지
+    (locmem/dummy는 프로세스별이므로 다른 워커의 버전 갱신이 보이지 않음)
+    """
+    return not isinstance(get_cache(), (LocMemCache, DummyCache))
+
+
+def _user_version_key(user_id):
+    return f"data-version:user:{user_id}"
+
+
+def _new_version():
+    return time.time_ns()
+
+
+def bump_data_version(user_id=None):
+    """
+    사용자 데이터 버전 갱신 (user_id가 없으면 모든 사용자에 영향을 주는 전역 버전)
+    - 트랜잭션 안에서 호출되면 커밋 후에 갱신하여, 커밋 전 데이터로 계산한 결과가
+      새 버전으로 저장되는 것을 방지
+    """
+    key = GLOBAL_VERSION_KEY if user_id is None else _user_version_key(user_id)
+    transaction.on_commit(lambda: get_cache().set(key, _new_version(), None))
+
+
+def expire_user_data_version(user_id):
+    """
+    사용자 데이터 버전을 즉시 갱신하여 해당 사용자의 캐시 항목만 무효화
+    - 커밋을 기다리지 않으므로 측정 후 롤백하는 벤치마크에서 사용 (캐시 전체를 비우지 않음)
+    """
+    get_cache().set(_user_version_key(user_id), _new_version(), None)
+
+
+def get_data_version(user_id):
+    """
+    현재 데이터 버전 (사용자 버전, 전역 버전)
+    - 응답 검증값(ETag/Last-Modified)처럼 데이터 변경 여부만 필요할 때 사용
+    - 사용자 버전이 없으면(캐시 만료 등) 새 버전을 저장하여 이전 검증값을 무효화
+    """
+    cache = get_cache()
+    user_version_key = _user_version_key(user_id)
+    found = cache.get_many([user_version_key, GLOBAL_VERSION_KEY])
+    if user_version_key not in found:
+        found[user_version_key] = _new_version()
+        cache.add(user_version_key, found[user_version_key], None)
+    return found[user_version_key], found.get(GLOBAL_VERSION_KEY)
+
+
+class VersionedCache:
+    """
+    데이터 버전으로 검증되는 사용자별 캐시
+
+    Args:
+        namespace (str): 캐시 키 접두사 겸 카운터 이름 (예: "stats")
+    """
+
+    def __init__(self, namespace, timeout=None):
+        self.namespace = namespace
+        self.timeout = timeout
+        self.counter = get_cache_counter(namespace)
+
+    def make_key(self, user_id, kind, period_start):
+        return f"{self.namespace}:{user_id}:{kind}:{period_start.isoformat()}"
+
+    def get_or_compute(self, user_id, periods, compute):
+        """
+        기간별 캐시를 한 번의 get_many로 조회하고, 없거나 오래된 항목만 계산 후 저장
+
+        Args:
+            user_id (int): 사용자 ID
+            periods (dict): 기간 종류 → 기간 시작일 (예: {"weekly": date(2025, 1, 6)})
+            compute (callable): 기간 종류를 받아 결과를 계산하는 함수
+
+        Returns:
+            dict: 기간 종류 → 결과
+        """
+        cache = get_cache()
+        user_version_key = _user_version_key(user_id)
+        keys = {
+            kind: self.make_key(user_id, kind, period_start)
+            for kind, period_start in periods.items()
+        }
+        found = cache.get_many([*keys.values(), user_version_key, GLOBAL_VERSION_KEY])
+
+        if user_version_key not in found:
+            found[user_version_key] = _new_version()
+            cache.add(user_version_key, found[user_version_key], None)
+        version = (found[user_version_key], found.get(GLOBAL_VERSION_KEY))
+
+        results = {}
+        to_store = {}
+        for kind, key in keys.items():
+            entry = found.get(key)
+            if entry is not None and entry[0] == version:
+                results[kind] = entry[1]
+            else:
+                results[kind] = compute(kind)
+                to_store[key] = (version, results[kind])
+
+        self.counter.record(hits=len(keys) - len(to_store), misses=len(to_store))
+        if to_store:
+            timeout = self.timeout or getattr(
+                settings, "STATS_CACHE_TIMEOUT", DEFAULT_TIMEOUT
+            )
+            cache.set_many(to_store, timeout)
+        return results
+
+
+stats_cache = VersionedCache("stats")
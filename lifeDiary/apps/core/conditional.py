@@ -0,0 +1,87 @@
+"""
+=================================================================================
+데이터 버전 기반 조건부 GET (ETag / Last-Modified)
+- 사용자 데이터 버전(apps.core.cache)은 시간 블록/태그/목표/메모가 바뀔 때마다 갱신
+- 읽기 화면/API에 버전으로 만든 검증값을 붙이고, 브라우저가 보낸 검증값과 같으면
+  뷰를 실행하지 않고(통계 계산, 템플릿 렌더링 없이) 바로 304 응답
+- ETag에는 데이터 버전 외에 응답 내용을 바꾸는 요소도 포함
+  - 요청 경로/쿼리, 오늘 날짜 (날짜를 지정하지 않으면 오늘 기준으로 표시)
+  - CSRF 쿠키 (페이지에 포함된 CSRF 토큰), 배포 버전 (settings.RELEASE_VERSION)
+- 표시할 메시지(django.contrib.messages)가 있으면 검증하지 않고 새로 렌더링
+- 데이터 버전 캐시가 워커 간에 공유되지 않으면(locmem 등) 적용하지 않음
+  (버전 갱신을 보지 못한 워커가 바뀐 데이터에 304를 응답하지 않도록)
+=================================================================================
+"""
+
+import hashlib
+from datetime import datetime, time, timezone as dt_timezone
+from functools import wraps
+
+from django.conf import settings
+from django.contrib.messages import get_messages
+from django.utils import timezone
+from django.utils.cache import patch_cache_control
+from django.views.decorators.http import condition
+
+from .cache import get_data_version, is_shared_cache
+
+
+def _get_request_data_version(request):
+    """요청 사용자의 데이터 버전 (ETag/Last-Modified 계산에 한 번만 조회)"""
+    if not hasattr(request, "_data_version"):
+        request._data_version = get_data_version(request.user.id)
+    return request._data_version
+
+
+def data_version_etag(request, *args, **kwargs):
+    key = "|".join(
+        str(part)
+        for part in (
+            request.user.id,
+            request.get_full_path(),
+            timezone.localdate(),
+            request.COOKIES.get(settings.CSRF_COOKIE_NAME, ""),
+            getattr(settings, "RELEASE_VERSION", ""),
+            _get_request_data_version(request),
+        )
+    )
+    return hashlib.md5(key.encode()).hexdigest()
+
+
+def data_version_last_modified(request, *args, **kwargs):
+    """
+    마지막 변경 시각 (데이터 버전은 변경 시각(ns)이므로 그대로 사용)
+    - 날짜가 바뀌면 오늘 기준 화면이 달라지므로 오늘 0시보다 이르지 않게 함
+    """
+    version = max(filter(None, _get_request_data_version(request)))
+    today_start = timezone.make_aware(datetime.combine(timezone.localdate(), time()))
+    return max(
+        datetime.fromtimestamp(version / 1e9, tz=dt_timezone.utc),
+        today_start.astimezone(dt_timezone.utc),
+    )
+
+
+def conditional_on_data_version(view_func):
+    """
+    로그인 사용자의 GET/HEAD 요청에 데이터 버전 기반 ETag/Last-Modified 적용
+    (login_required 안쪽에 사용, 다른 메서드는 그대로 뷰 실행)
+    """
+    conditional_view = condition(
+        etag_func=data_version_etag, last_modified_func=data_version_last_modified
+    )(view_func)
+
+    @wraps(view_func)
+    def wrapper(request, *args, **kwargs):
+        if (
+            request.method not in ("GET", "HEAD")
+            or not request.user.is_authenticated
+            or len(get_messages(request))
+            or not is_shared_cache()
+        ):
+            return view_func(request, *args, **kwargs)
+        response = conditional_view(request, *args, **kwargs)
+        # 매번 재검증하도록 (바뀌지 않았으면 304)
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
+
+    return wrapper
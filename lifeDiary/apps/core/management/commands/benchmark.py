@@ -0,0 +1,74 @@
+import json
+import subprocess
+from datetime import datetime
+
+from django.core.management.base import BaseCommand
+from django.utils.module_loading import import_string
+
+# 벤치마크 이름 → 실행 함수 (options dict를 받아 결과 dict 목록 반환)
+SUITES = {
+    "stats_backends": "apps.stats.benchmarks.stats_backends",
+    "timeblock_storage": "apps.dashboard.benchmarks.timeblock_storage",
+    "timeblock_batch": "apps.dashboard.benchmarks.timeblock_batch",
+    "dashboard_render": "apps.dashboard.benchmarks.dashboard_render",
+    "dashboard_range": "apps.dashboard.benchmarks.dashboard_range",
+    "hot_views": "apps.core.benchmarks.hot_views",
+}
+
+
+def _git_commit():
+    """현재 git 커밋 (결과 파일을 커밋별로 비교하기 위해 기록, 알 수 없으면 None)"""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+class Command(BaseCommand):
+    help = "합성 데이터로 성능 벤치마크를 실행합니다. (데이터는 실행 후 롤백)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("suite", choices=sorted(SUITES), help="실행할 벤치마크")
+        parser.add_argument(
+            "--years",
+            type=float,
+            nargs="+",
+            default=[1, 5],
+            help="합성 사용자의 기록 기간 (년, 여러 개 지정 가능)",
+        )
+        parser.add_argument("--repeat", type=int, default=5, help="측정 반복 횟수")
+        parser.add_argument(
+            "--user",
+            action="append",
+            dest="usernames",
+            help="합성 사용자 대신 측정할 기존 사용자명 (hot_views, 반복 가능)",
+        )
+        parser.add_argument("--output", help="결과를 저장할 JSON 파일 경로")
+
+    def handle(self, *args, **options):
+        suite = import_string(SUITES[options["suite"]])
+        results = suite(options)
+        for result in results:
+            self.stdout.write(
+                "  ".join(f"{key}={value}" for key, value in result.items())
+            )
+        if options["output"]:
+            with open(options["output"], "w", encoding="utf-8") as output:
+                json.dump(
+                    {
+                        "suite": options["suite"],
+                        "commit": _git_commit(),
+                        "created_at": datetime.now().isoformat(timespec="seconds"),
+                        "repeat": options["repeat"],
+                        "results": results,
+                    },
+                    output,
+                    ensure_ascii=False,
+                    indent=2,
+                )
+            self.stdout.write(self.style.SUCCESS(f"결과 저장: {options['output']}"))
@@ -0,0 +1,55 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.core.query_budgets import get_uncovered_url_names, run_query_budgets
+
+
+class Command(BaseCommand):
+    help = (
+        "모든 화면/API의 쿼리 수를 기록 기간이 다른 합성 사용자로 측정하여 "
+        "상한(apps.core.query_budgets.QUERY_BUDGETS)과 함께 출력합니다. "
+        "(데이터는 실행 후 롤백, 검사는 apps/core/tests/test_query_budgets.py)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--years",
+            type=float,
+            nargs="+",
+            default=[0.1, 1],
+            help="합성 사용자의 기록 기간 (년, 여러 개 지정 가능)",
+        )
+
+    def handle(self, *args, **options):
+        uncovered = get_uncovered_url_names()
+        if uncovered:
+            raise CommandError(
+                f"쿼리 수 상한이 정의되지 않은 URL: {', '.join(uncovered)}"
+            )
+
+        results = run_query_budgets(options["years"])
+        failed = [result for result in results if result["failures"]]
+        for result in results:
+            counts = ", ".join(
+                f"{years}년 {count}/{max_queries}"
+                for years, (count, max_queries) in result["queries"].items()
+            )
+            status = (
+                self.style.ERROR("FAIL")
+                if result["failures"]
+                else self.style.SUCCESS("OK  ")
+            )
+            self.stdout.write(f"{status} {result['label']}: {counts} (쿼리 수/상한)")
+
+        for result in failed:
+            for years, reason, sql in result["failures"]:
+                self.stdout.write(
+                    self.style.ERROR(f"\n{result['label']} ({years}년): {reason}")
+                )
+                for index, statement in enumerate(sql, 1):
+                    self.stdout.write(f"  {index}. {statement}")
+
+        if failed:
+            raise CommandError(f"쿼리 수 상한을 넘은 요청: {len(failed)}개")
+        self.stdout.write(
+            self.style.SUCCESS(f"{len(results)}개 요청 모두 상한 이내입니다.")
+        )
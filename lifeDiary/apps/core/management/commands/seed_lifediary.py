@@ -0,0 +1,73 @@
+import time
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from apps.core.synthetic import (
+    create_synthetic_goals_and_notes,
+    create_synthetic_user,
+)
+from apps.dashboard.models import TimeBlock
+from apps.dashboard.storage import copy_rows_to_day_logs, get_timeblock_storage
+
+
+class Command(BaseCommand):
+    help = (
+        "개발/성능 측정용 합성 데이터(태그, 시간 기록, 목표, 메모)를 생성합니다. "
+        "(benchmark 명령과 달리 데이터를 남김)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=1, help="생성할 사용자 수")
+        parser.add_argument(
+            "--years", type=float, default=1, help="사용자별 기록 기간 (년)"
+        )
+        parser.add_argument(
+            "--prefix", default="seed", help="사용자명 접두어 (예: seed001)"
+        )
+        parser.add_argument(
+            "--password", help="생성한 사용자의 비밀번호 (생략하면 로그인 불가)"
+        )
+        parser.add_argument(
+            "--seed", type=int, default=0, help="난수 시드 (사용자마다 1씩 증가)"
+        )
+
+    def handle(self, *args, **options):
+        if options["users"] < 1 or options["years"] <= 0:
+            raise CommandError("--users는 1 이상, --years는 0보다 커야 합니다.")
+
+        usernames = [
+            f"{options['prefix']}{number:03d}"
+            for number in range(1, options["users"] + 1)
+        ]
+        existing = User.objects.filter(username__in=usernames).values_list(
+            "username", flat=True
+        )
+        if existing:
+            raise CommandError(f"이미 존재하는 사용자: {', '.join(sorted(existing))}")
+
+        # 합성 데이터는 TimeBlock으로 생성하므로 daylog 저장소면 변환하여 저장
+        to_day_logs = get_timeblock_storage().name == "daylog"
+        for offset, username in enumerate(usernames):
+            started = time.perf_counter()
+            with transaction.atomic():
+                user = create_synthetic_user(
+                    username, options["years"], seed=options["seed"] + offset
+                )
+                if options["password"]:
+                    user.set_password(options["password"])
+                    user.save(update_fields=["password"])
+                goal_count, note_count = create_synthetic_goals_and_notes(
+                    user, options["years"], seed=options["seed"] + offset
+                )
+                if to_day_logs:
+                    copy_rows_to_day_logs(user.id)
+                    TimeBlock.objects.filter(user=user).delete()
+            self.stdout.write(
+                f"{username}: 목표 {goal_count}개, 메모 {note_count}개 "
+                f"({time.perf_counter() - started:.1f}초)"
+            )
+        self.stdout.write(
+            self.style.SUCCESS(f"합성 사용자 {len(usernames)}명을 생성했습니다.")
+        )
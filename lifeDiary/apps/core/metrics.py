@@ -0,0 +1,183 @@
+"""
+=================================================================================
+요청 처리 지표 (프로세스 메모리)
+- RequestMetricsMiddleware가 기록한 요청의 처리 시간/쿼리 수를 뷰별로 누적
+  - 처리 시간: 모든 요청, 쿼리 수/DB/템플릿 시간: 샘플링된 요청만
+- 뷰별로 최근 ROLLING_WINDOW개 요청의 처리 시간(p50/p95 계산용)과
+  전체 누적 구간별 분포(histogram buckets)를 함께 보관
+- 그 밖의 지표는 이름별 카운터(MetricCounter)/분포(MetricHistogram)로 누적
+  (시간 블록 저장량, 통계 섹션 계산 시간 등, /metrics에서 Prometheus 형식으로 제공)
+- 프로세스별 값이므로 워커가 여러 개면 워커마다 따로 집계됨
+=================================================================================
+"""
+
+import threading
+from bisect import bisect_left
+from collections import deque
+
+# 처리 시간 분포 구간 상한 (ms, 마지막 구간은 그 이상 전체)
+DURATION_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+# 뷰별로 p50/p95 계산에 사용할 최근 요청 수
+ROLLING_WINDOW = 500
+
+
+def percentile(values, pct):
+    """값 목록의 백분위수 (선형 보간)"""
+    if not values:
+        return 0
+    values = sorted(values)
+    position = (len(values) - 1) * pct / 100
+    lower = int(position)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+
+class ViewMetrics:
+    """뷰 하나의 처리 시간/쿼리 수 누적 (스레드 안전)"""
+
+    def __init__(self, name):
+        self.name = name
+        self.count = 0
+        self.sampled = 0
+        self.queries = 0
+        self.total_ms = 0.0
+        self.db_ms = 0.0
+        self.template_ms = 0.0
+        self.bucket_counts = [0] * (len(DURATION_BUCKETS_MS) + 1)
+        self.recent_ms = deque(maxlen=ROLLING_WINDOW)
+        self._lock = threading.Lock()
+
+    def record(self, total_ms, db_ms=None, template_ms=None, queries=None):
+        """요청 하나 기록 (샘플링되지 않은 요청은 total_ms만 전달)"""
+        with self._lock:
+            self.count += 1
+            self.total_ms += total_ms
+            self.bucket_counts[bisect_left(DURATION_BUCKETS_MS, total_ms)] += 1
+            self.recent_ms.append(total_ms)
+            if queries is not None:
+                self.sampled += 1
+                self.queries += queries
+                self.db_ms += db_ms
+                self.template_ms += template_ms
+
+    def snapshot(self):
+        with self._lock:
+            recent = list(self.recent_ms)
+            return {
+                "view": self.name,
+                "count": self.count,
+                "sampled": self.sampled,
+                "queries": self.queries,
+                "total_ms": round(self.total_ms, 2),
+                "db_ms": round(self.db_ms, 2),
+                "template_ms": round(self.template_ms, 2),
+                "buckets": list(zip(DURATION_BUCKETS_MS, self.bucket_counts)),
+                "overflow": self.bucket_counts[-1],
+                "p50_ms": round(percentile(recent, 50), 2),
+                "p95_ms": round(percentile(recent, 95), 2),
+            }
+
+
+# 뷰 이름 → ViewMetrics
+VIEW_METRICS = {}
+_metrics_lock = threading.Lock()
+
+
+def get_view_metrics(name):
+    """이름별 ViewMetrics (없으면 생성)"""
+    with _metrics_lock:
+        if name not in VIEW_METRICS:
+            VIEW_METRICS[name] = ViewMetrics(name)
+        return VIEW_METRICS[name]
+
+
+def get_metrics_snapshot():
+    """모든 뷰의 누적 지표 (뷰 이름순)"""
+    with _metrics_lock:
+        metrics = sorted(VIEW_METRICS.values(), key=lambda item: item.name)
+    return [item.snapshot() for item in metrics]
+
+
+class MetricCounter:
+    """라벨 값 조합별 누적 카운터 (스레드 안전)"""
+
+    def __init__(self, name, description, labels=()):
+        self.name = name
+        self.description = description
+        self.labels = tuple(labels)
+        self.values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1, **labels):
+        key = tuple(labels.get(label, "") for label in self.labels)
+        with self._lock:
+            self.values[key] = self.values.get(key, 0) + amount
+
+    def snapshot(self):
+        """라벨 값 튜플 → 누적값"""
+        with self._lock:
+            return dict(self.values)
+
+
+class MetricHistogram:
+    """라벨 값 조합별 구간 분포 (ms, 스레드 안전)"""
+
+    def __init__(self, name, description, labels=(), buckets=DURATION_BUCKETS_MS):
+        self.name = name
+        self.description = description
+        self.labels = tuple(labels)
+        self.buckets = tuple(buckets)
+        self.values = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value_ms, **labels):
+        key = tuple(labels.get(label, "") for label in self.labels)
+        with self._lock:
+            if key not in self.values:
+                self.values[key] = {
+                    "count": 0,
+                    "sum_ms": 0.0,
+                    "bucket_counts": [0] * (len(self.buckets) + 1),
+                }
+            value = self.values[key]
+            value["count"] += 1
+            value["sum_ms"] += value_ms
+            value["bucket_counts"][bisect_left(self.buckets, value_ms)] += 1
+
+    def snapshot(self):
+        """라벨 값 튜플 → {"count", "sum_ms", "bucket_counts"}"""
+        with self._lock:
+            return {
+                key: {**value, "bucket_counts": list(value["bucket_counts"])}
+                for key, value in self.values.items()
+            }
+
+
+# 지표 이름 → MetricCounter / MetricHistogram
+COUNTERS = {}
+HISTOGRAMS = {}
+
+
+def get_counter(name, description="", labels=()):
+    """이름별 MetricCounter (없으면 생성)"""
+    with _metrics_lock:
+        if name not in COUNTERS:
+            COUNTERS[name] = MetricCounter(name, description, labels)
+        return COUNTERS[name]
+
+
+def get_histogram(name, description="", labels=()):
+    """이름별 MetricHistogram (없으면 생성)"""
+    with _metrics_lock:
+        if name not in HISTOGRAMS:
+            HISTOGRAMS[name] = MetricHistogram(name, description, labels)
+        return HISTOGRAMS[name]
+
+
+def get_registered_metrics():
+    """(카운터 목록, 분포 목록) (각각 이름순)"""
+    with _metrics_lock:
+        counters = sorted(COUNTERS.values(), key=lambda item: item.name)
+        histograms = sorted(HISTOGRAMS.values(), key=lambda item: item.name)
+    return counters, histograms
@@ -0,0 +1,227 @@
+"""
+=================================================================================
+요청별 SQL/처리 시간 계측 미들웨어
+- 샘플링된 요청마다 쿼리 수, DB 시간, 템플릿 렌더링 시간, 뷰 처리 시간, 전체 시간 측정
+  - DB: connection.execute_wrapper (DEBUG 여부와 관계없이 동작)
+  - 템플릿: 최상위 템플릿 렌더링(render/render_to_string)만 합산 (include/extends 중복 제외)
+  - 뷰: process_view부터 응답을 돌려받을 때까지 (스트리밍 응답은 본문 생성 전까지)
+- 결과는 Server-Timing 헤더, 구조화(JSON) 로그, 뷰별 누적 지표(apps.core.metrics)로 기록
+- settings.REQUEST_METRICS_SAMPLE_RATE(0~1)로 샘플링, 샘플링되지 않은 요청은
+  전체 처리 시간만 뷰별 누적 지표에 기록 (/metrics의 요청 수/처리 시간 분포용)
+- ProfilingMiddleware: 관리자가 요청한 경우에만 cProfile/SQL 실행 계획 보고서 생성
+  (apps.core.profiling)
+=================================================================================
+"""
+
+import cProfile
+import json
+import logging
+import random
+import threading
+import time
+from contextlib import ExitStack
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import connections
+from django.contrib.auth.models import User
+from django.http import HttpResponse, HttpResponseBadRequest, HttpResponseNotFound
+from django.template.backends.django import Template as DjangoBackendTemplate
+
+from .metrics import get_view_metrics
+from .profiling import QueryRecorder, StackSampler, get_query_param, save_report
+
+logger = logging.getLogger(__name__)
+
+# 현재 요청의 측정값 (샘플링되지 않은 요청은 None)
+_current_timings = ContextVar("request_timings", default=None)
+
+
+class RequestTimings:
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.view_started = None
+        self.queries = 0
+        self.db_ms = 0.0
+        self.template_ms = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        """connection.execute_wrapper용: 쿼리 실행 시간 합산"""
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries += 1
+            self.db_ms += (time.perf_counter() - started) * 1000
+
+
+_original_template_render = DjangoBackendTemplate.render
+
+
+def _timed_template_render(self, context=None, request=None):
+    timings = _current_timings.get()
+    if timings is None:
+        return _original_template_render(self, context, request)
+    started = time.perf_counter()
+    try:
+        return _original_template_render(self, context, request)
+    finally:
+        timings.template_ms += (time.perf_counter() - started) * 1000
+
+
+def _get_view_name(request):
+    match = request.resolver_match
+    return match.view_name if match else "<unresolved>"
+
+
+def _get_sample_rate():
+    return getattr(settings, "REQUEST_METRICS_SAMPLE_RATE", 1.0)
+
+
+class RequestMetricsMiddleware:
+    """요청 계측 (MIDDLEWARE에서 정적 파일 처리 다음, 다른 미들웨어보다 앞에 둠)"""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        # 템플릿 렌더링 시간 측정 (샘플링된 요청이 아니면 원래 함수를 그대로 호출)
+        DjangoBackendTemplate.render = _timed_template_render
+
+    def __call__(self, request):
+        sample_rate = _get_sample_rate()
+        if sample_rate <= 0 or random.random() >= sample_rate:
+            started = time.perf_counter()
+            response = self.get_response(request)
+            get_view_metrics(_get_view_name(request)).record(
+                (time.perf_counter() - started) * 1000
+            )
+            return response
+
+        timings = RequestTimings()
+        token = _current_timings.set(timings)
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(timings))
+                response = self.get_response(request)
+        finally:
+            _current_timings.reset(token)
+
+        self.record(request, response, timings)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        timings = _current_timings.get()
+        if timings is not None:
+            timings.view_started = time.perf_counter()
+
+    def record(self, request, response, timings):
+        finished = time.perf_counter()
+        total_ms = (finished - timings.started) * 1000
+        view_ms = (
+            (finished - timings.view_started) * 1000 if timings.view_started else 0.0
+        )
+        view_name = _get_view_name(request)
+
+        response["Server-Timing"] = ", ".join(
+            [
+                f'db;dur={timings.db_ms:.1f};desc="{timings.queries} queries"',
+                f"tpl;dur={timings.template_ms:.1f}",
+                f"view;dur={view_ms:.1f}",
+                f"total;dur={total_ms:.1f}",
+            ]
+        )
+        get_view_metrics(view_name).record(
+            total_ms, timings.db_ms, timings.template_ms, timings.queries
+        )
+        logger.info(
+            json.dumps(
+                {
+                    "event": "request",
+                    "method": request.method,
+                    "path": request.path,
+                    "view": view_name,
+                    "status": response.status_code,
+                    "queries": timings.queries,
+                    "db_ms": round(timings.db_ms, 2),
+                    "template_ms": round(timings.template_ms, 2),
+                    "view_ms": round(view_ms, 2),
+                    "total_ms": round(total_ms, 2),
+                },
+                ensure_ascii=False,
+            )
+        )
+
+
+# 프로파일링 요청에서 제거할 조건부 요청 헤더 (304 대신 뷰를 실행하도록)
+_CONDITIONAL_HEADERS = ("HTTP_IF_NONE_MATCH", "HTTP_IF_MODIFIED_SINCE")
+
+
+class ProfilingMiddleware:
+    """
+    관리자 요청 프로파일링 (MIDDLEWARE에서 AuthenticationMiddleware 다음에 둠)
+    - ?_profile=1: 보고서를 저장하고 원래 응답에 X-Profile-Report 헤더(보고서 이름) 추가
+    - ?_profile=text: 원래 응답 대신 보고서 내용을 text/plain으로 반환
+    - &_profile_user=사용자명: (GET/HEAD만) 해당 사용자로 뷰를 실행하여 측정
+    - 관리자가 아니면 플래그를 무시하고 그대로 처리
+    - 스트리밍 응답은 본문 생성 전까지만 측정
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.query_param = get_query_param()
+
+    def __call__(self, request):
+        # 플래그가 없는 요청은 쿼리 문자열만 확인하고 그대로 처리
+        if self.query_param not in request.META.get("QUERY_STRING", ""):
+            return self.get_response(request)
+        mode = request.GET.get(self.query_param)
+        user = getattr(request, "user", None)
+        if not mode or user is None or not user.is_superuser:
+            return self.get_response(request)
+
+        username = request.GET.get(f"{self.query_param}_user")
+        if username:
+            if request.method not in ("GET", "HEAD"):
+                return HttpResponseBadRequest(
+                    "다른 사용자로는 GET/HEAD 요청만 프로파일링할 수 있습니다."
+                )
+            try:
+                request.user = User.objects.get(username=username)
+            except User.DoesNotExist:
+                return HttpResponseNotFound(f"존재하지 않는 사용자: {username}")
+        return self.profile(request, mode)
+
+    def profile(self, request, mode):
+        for header in _CONDITIONAL_HEADERS:
+            request.META.pop(header, None)
+
+        queries = []
+        profiler = cProfile.Profile()
+        started = time.perf_counter()
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(
+                    connection.execute_wrapper(QueryRecorder(connection.alias, queries))
+                )
+            sampler = stack.enter_context(StackSampler(threading.get_ident()))
+            profiler.enable()
+            try:
+                response = self.get_response(request)
+            finally:
+                profiler.disable()
+        total_ms = (time.perf_counter() - started) * 1000
+
+        try:
+            name, profile_text, sql_text = save_report(
+                request, profiler, sampler, queries, total_ms
+            )
+        except OSError:
+            logger.exception("프로파일 보고서를 저장하지 못했습니다.")
+            return response
+
+        if mode == "text":
+            response = HttpResponse(
+                f"{profile_text}\n{sql_text}", content_type="text/plain; charset=utf-8"
+            )
+        response["X-Profile-Report"] = name
+        return response
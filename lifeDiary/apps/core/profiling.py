@@ -0,0 +1,234 @@
+"""
+=================================================================================
+요청 프로파일링 (관리자 전용, ProfilingMiddleware에서 사용)
+- 관리자가 URL에 ?_profile=1 (settings.PROFILING_QUERY_PARAM)을 붙여 요청하면
+  뷰를 cProfile로 실행하고 실행된 SQL을 모두 기록
+- 요청이 끝난 뒤 SELECT 문마다 실행 계획 조회
+  (PostgreSQL: EXPLAIN ANALYZE, 그 외: DB가 지원하는 EXPLAIN)
+- 보고서는 settings.PROFILING_DIR 아래 요청별 디렉터리에 저장
+  - profile.txt: pstats 요약 (누적 시간순)
+  - profile.collapsed: 호출 스택 샘플을 접은 스택 (flamegraph.pl, speedscope 등에서 사용)
+  - sql.txt: 쿼리별 실행 시간과 실행 계획
+  - 최근 settings.PROFILING_MAX_REPORTS개만 보관 (오래된 보고서부터 삭제)
+- 플래그가 없는 요청은 쿼리 문자열 확인 외에는 아무것도 하지 않음
+=================================================================================
+"""
+
+import io
+import os
+import pstats
+import re
+import shutil
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+
+from django.conf import settings
+from django.db import DatabaseError, connections, transaction
+
+DEFAULT_QUERY_PARAM = "_profile"
+DEFAULT_MAX_REPORTS = 20
+
+# 실행 계획을 조회할 최대 쿼리 수 (같은 SQL/파라미터는 한 번만)
+MAX_EXPLAINED_QUERIES = 50
+
+# profile.txt에 출력할 함수 수
+PSTATS_LIMIT = 80
+
+# 접힌 스택 수집 간격 (초)
+SAMPLE_INTERVAL = 0.001
+
+# 스레드 전환 간격(sys.setswitchinterval)은 프로세스 전체 설정이므로
+# 동시에 실행 중인 StackSampler 수를 세어 마지막 샘플러가 끝날 때 원래 값으로 되돌림
+_switch_interval_lock = threading.Lock()
+_switch_interval_users = 0
+_original_switch_interval = None
+
+
+def get_query_param():
+    return getattr(settings, "PROFILING_QUERY_PARAM", DEFAULT_QUERY_PARAM)
+
+
+def get_report_dir():
+    return getattr(
+        settings, "PROFILING_DIR", os.path.join(settings.BASE_DIR, ".profiles")
+    )
+
+
+class QueryRecorder:
+    """connection.execute_wrapper용: 실행된 SQL, 파라미터, 시간 기록"""
+
+    def __init__(self, alias, queries):
+        self.alias = alias
+        self.queries = queries
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries.append(
+                (self.alias, sql, params, many, (time.perf_counter() - started) * 1000)
+            )
+
+
+def _explain(alias, sql, params):
+    """SELECT 문의 실행 계획 (지원하지 않거나 실패하면 사유 문자열)"""
+    connection = connections[alias]
+    try:
+        prefix = connection.ops.explain_query_prefix(analyze=True)
+    except (ValueError, NotImplementedError):
+        # SQLite 등 ANALYZE 옵션이 없는 DB
+        prefix = connection.ops.explain_query_prefix()
+    try:
+        # 실패해도 요청의 트랜잭션에 영향이 없도록 세이브포인트 안에서 실행
+        with transaction.atomic(using=alias):
+            with connection.cursor() as cursor:
+                cursor.execute(f"{prefix} {sql}", params)
+                return "\n".join(
+                    " ".join(str(value) for value in row) for row in cursor.fetchall()
+                )
+    except (DatabaseError, NotImplementedError) as e:
+        return f"(실행 계획을 조회할 수 없습니다: {e})"
+
+
+def _format_sql_report(queries):
+    lines = [
+        f"쿼리 {len(queries)}개, "
+        f"총 {sum(duration for *_, duration in queries):.2f}ms",
+        "",
+    ]
+    explained = set()
+    for index, (alias, sql, params, many, duration) in enumerate(queries, 1):
+        lines.append(f"[{index}] {alias} {duration:.2f}ms")
+        lines.append(sql)
+        if params:
+            lines.append(f"params: {params!r}")
+        key = (alias, sql, repr(params))
+        if (
+            not many
+            and sql.lstrip().upper().startswith("SELECT")
+            and key not in explained
+            and len(explained) < MAX_EXPLAINED_QUERIES
+        ):
+            explained.add(key)
+            lines.append("-- plan")
+            lines.append(_explain(alias, sql, params))
+        lines.append("")
+    return "\n".join(lines)
+
+
+def _format_pstats(profiler):
+    output = io.StringIO()
+    stats = pstats.Stats(profiler, stream=output)
+    stats.sort_stats("cumulative").print_stats(PSTATS_LIMIT)
+    return output.getvalue()
+
+
+def _shorten_switch_interval(interval):
+    global _switch_interval_users, _original_switch_interval
+    with _switch_interval_lock:
+        if _switch_interval_users == 0:
+            _original_switch_interval = sys.getswitchinterval()
+        _switch_interval_users += 1
+        sys.setswitchinterval(min(sys.getswitchinterval(), interval))
+
+
+def _restore_switch_interval():
+    global _switch_interval_users
+    with _switch_interval_lock:
+        _switch_interval_users -= 1
+        if _switch_interval_users == 0:
+            sys.setswitchinterval(_original_switch_interval)
+
+
+class StackSampler:
+    """
+    요청을 처리하는 스레드의 호출 스택을 일정 간격으로 수집 (접힌 스택용)
+    - cProfile은 호출자-피호출자 관계만 기록하므로 전체 호출 경로는 샘플링으로 얻음
+    """
+
+    def __init__(self, thread_id, interval=SAMPLE_INTERVAL):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.samples = Counter()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(
+                    f"{code.co_name} ({os.path.basename(code.co_filename)}"
+                    f":{code.co_firstlineno})"
+                )
+                frame = frame.f_back
+            if stack:
+                self.samples[";".join(reversed(stack))] += 1
+
+    def __enter__(self):
+        # 요청 스레드가 GIL을 오래 잡지 않도록 스레드 전환 간격을 수집 간격에 맞춤
+        _shorten_switch_interval(self.interval)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stopped.set()
+        self._thread.join()
+        _restore_switch_interval()
+
+    def collapsed(self):
+        """접힌 스택 줄 목록 ("a;b;c 샘플 수")"""
+        return [f"{stack} {count}" for stack, count in self.samples.items()]
+
+
+def _prune_reports(report_dir, keep):
+    """최근 keep개 보고서만 남기고 삭제"""
+    # 보고서 이름이 생성 시각으로 시작하므로 이름순 = 생성순
+    names = sorted(entry.name for entry in os.scandir(report_dir) if entry.is_dir())
+    for name in names[: max(len(names) - keep, 0)]:
+        shutil.rmtree(os.path.join(report_dir, name), ignore_errors=True)
+
+
+def save_report(request, profiler, sampler, queries, total_ms):
+    """
+    프로파일 보고서 저장
+
+    Returns:
+        tuple: (보고서 이름, pstats 요약, SQL 보고서)
+    """
+    match = request.resolver_match
+    view_name = match.view_name if match else "unresolved"
+    name = "-".join(
+        [
+            datetime.now().strftime("%Y%m%d-%H%M%S-%f"),
+            re.sub(r"[^A-Za-z0-9_.-]+", "_", view_name),
+            str(request.user.id),
+        ]
+    )
+    summary = (
+        f"{request.method} {request.get_full_path()}\n"
+        f"view: {view_name}, user: {request.user.id}, total: {total_ms:.2f}ms\n\n"
+    )
+    profile_text = summary + _format_pstats(profiler)
+    sql_text = summary + _format_sql_report(queries)
+
+    report_dir = get_report_dir()
+    path = os.path.join(report_dir, name)
+    os.makedirs(path, exist_ok=True)
+    for filename, content in (
+        ("profile.txt", profile_text),
+        ("profile.collapsed", "\n".join(sampler.collapsed()) + "\n"),
+        ("sql.txt", sql_text),
+    ):
+        with open(os.path.join(path, filename), "w", encoding="utf-8") as output:
+            output.write(content)
+    _prune_reports(
+        report_dir, getattr(settings, "PROFILING_MAX_REPORTS", DEFAULT_MAX_REPORTS)
+    )
+    return name, profile_text, sql_text
@@ -0,0 +1,153 @@
+"""
+=================================================================================
+Prometheus 텍스트 형식 지표 (/metrics)
+- 뷰별 요청 처리 시간 분포 (모든 요청)
+- 뷰별 쿼리 수, DB/템플릿 시간 누적 (샘플링된 요청만, 샘플 수와 함께 제공)
+- 캐시 적중/실패 (apps.core.cache.CACHE_COUNTERS)
+- 이름별 카운터/분포 (apps.core.metrics.COUNTERS / HISTOGRAMS)
+  - 시간 블록 API 슬롯 생성/수정/삭제 수, 통계 섹션 계산 시간 등
+- 시간 단위는 Prometheus 관례대로 초, 프로세스(워커)별 값
+=================================================================================
+"""
+
+from .cache import get_cache_counter_snapshots
+from .metrics import (
+    DURATION_BUCKETS_MS,
+    get_metrics_snapshot,
+    get_registered_metrics,
+)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+PREFIX = "lifediary_"
+
+
+def _escape_label(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _escape_help(value):
+    return value.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _labels(names, values):
+    if not names:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape_label(value)}"' for name, value in zip(names, values)
+    )
+    return f"{{{pairs}}}"
+
+
+def _number(value):
+    if isinstance(value, float):
+        return repr(round(value, 6))
+    return str(value)
+
+
+def _header(name, metric_type, description):
+    return [
+        f"# HELP {name} {_escape_help(description)}",
+        f"# TYPE {name} {metric_type}",
+    ]
+
+
+def _histogram_lines(name, label_names, label_values, buckets_ms, counts, sum_ms):
+    """구간별 개수(누적 아님) → Prometheus 누적 구간 줄"""
+    lines = []
+    cumulative = 0
+    for bound_ms, count in zip([*buckets_ms, None], counts):
+        cumulative += count
+        le = "+Inf" if bound_ms is None else _number(bound_ms / 1000)
+        labels = _labels([*label_names, "le"], [*label_values, le])
+        lines.append(f"{name}_bucket{labels} {cumulative}")
+    labels = _labels(label_names, label_values)
+    lines.append(f"{name}_sum{labels} {_number(sum_ms / 1000)}")
+    lines.append(f"{name}_count{labels} {cumulative}")
+    return lines
+
+
+def _view_lines():
+    views = get_metrics_snapshot()
+    duration = f"{PREFIX}http_request_duration_seconds"
+    lines = _header(duration, "histogram", "뷰별 요청 처리 시간")
+    for view in views:
+        lines += _histogram_lines(
+            duration,
+            ["view"],
+            [view["view"]],
+            DURATION_BUCKETS_MS,
+            [count for _, count in view["buckets"]] + [view["overflow"]],
+            view["total_ms"],
+        )
+
+    # (지표 이름, 설명, 값 변환)
+    sampled_metrics = [
+        (
+            "http_requests_sampled_total",
+            "쿼리/DB/템플릿 시간을 측정한 요청 수",
+            lambda view: view["sampled"],
+        ),
+        (
+            "db_queries_total",
+            "샘플링된 요청의 쿼리 수",
+            lambda view: view["queries"],
+        ),
+        (
+            "db_duration_seconds_total",
+            "샘플링된 요청의 DB 시간",
+            lambda view: view["db_ms"] / 1000,
+        ),
+        (
+            "template_duration_seconds_total",
+            "샘플링된 요청의 템플릿 렌더링 시간",
+            lambda view: view["template_ms"] / 1000,
+        ),
+    ]
+    for suffix, description, get_value in sampled_metrics:
+        name = f"{PREFIX}{suffix}"
+        lines += _header(name, "counter", description)
+        lines += [
+            f"{name}{_labels(['view'], [view['view']])} {_number(get_value(view))}"
+            for view in views
+        ]
+    return lines
+
+
+def _cache_lines():
+    name = f"{PREFIX}cache_requests_total"
+    lines = _header(name, "counter", "캐시 조회 수 (result: hit/miss)")
+    for cache_name, snapshot in get_cache_counter_snapshots().items():
+        for result, key in (("hit", "hits"), ("miss", "misses")):
+            labels = _labels(["cache", "result"], [cache_name, result])
+            lines.append(f"{name}{labels} {snapshot[key]}")
+    return lines
+
+
+def _registered_lines():
+    lines = []
+    counters, histograms = get_registered_metrics()
+    for counter in counters:
+        name = f"{PREFIX}{counter.name}_total"
+        lines += _header(name, "counter", counter.description)
+        lines += [
+            f"{name}{_labels(counter.labels, key)} {_number(value)}"
+            for key, value in sorted(counter.snapshot().items())
+        ]
+    for histogram in histograms:
+        name = f"{PREFIX}{histogram.name}_seconds"
+        lines += _header(name, "histogram", histogram.description)
+        for key, value in sorted(histogram.snapshot().items()):
+            lines += _histogram_lines(
+                name,
+                histogram.labels,
+                key,
+                histogram.buckets,
+                value["bucket_counts"],
+                value["sum_ms"],
+            )
+    return lines
+
+
+def render_metrics():
+    """모든 지표를 Prometheus 텍스트 형식으로"""
+    return "\n".join([*_view_lines(), *_cache_lines(), *_registered_lines()]) + "\n"
@@ -0,0 +1,451 @@
+"""
+=================================================================================
+화면/API별 쿼리 수 상한 (apps/core/tests/test_query_budgets.py, manage.py check_query_budgets)
+- URL 이름마다 대표 요청과 허용 쿼리 수(QUERY_BUDGETS)를 정의
+- 기록 기간이 다른 합성 사용자로 요청을 보내 쿼리 수가 상한을 넘으면 실패 처리
+- 저장 방식(rows/daylog)에 따라 쿼리 수가 다른 요청은 _by_storage로 각각 상한 지정
+  (날짜/목표마다 쿼리를 보내는 코드가 다시 들어오면 데이터가 많을수록 상한을 넘음)
+- 요청마다 캐시를 비우고 측정 (캐시가 없을 때의 최대 쿼리 수 기준)
+- 측정은 롤백되는 트랜잭션 안에서 하므로 SAVEPOINT 관련 쿼리는 세지 않음
+  (bulk_create는 BULK_WRITE_BATCH_SIZE로 배치 크기를 고정하므로 INSERT 문도 모두 셈)
+=================================================================================
+"""
+
+import json
+from collections import namedtuple
+from math import ceil
+from datetime import timedelta
+from types import SimpleNamespace
+
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.urls import URLPattern, URLResolver, get_resolver, reverse
+from django.utils import timezone
+
+from .utils import BULK_WRITE_BATCH_SIZE
+from .synthetic import (
+    create_synthetic_goals_and_notes,
+    create_synthetic_user,
+    rolled_back,
+)
+
+# 측정하지 않는 URL 네임스페이스 (Django 관리자)
+EXCLUDED_NAMESPACES = {"admin"}
+
+# 측정 중 /metrics 조회에 사용할 토큰 (settings.METRICS_TOKEN을 이 값으로 바꿔 측정)
+METRICS_TOKEN = "query-budget"
+
+# 트랜잭션 안에서만 생기는 쿼리 (실제 요청에서는 실행되지 않음)
+_SAVEPOINT_PREFIXES = ("SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK TO SAVEPOINT")
+
+QueryBudget = namedtuple(
+    "QueryBudget",
+    ["url_name", "method", "max_queries", "build", "variant", "anonymous"],
+    defaults=("", False),
+)
+QueryBudget.__doc__ = """
+요청 하나의 쿼리 수 상한
+- build(fixture): 요청 옵션 dict
+  (kwargs: URL 인자, data: 쿼리/폼/JSON 본문, json: JSON 여부, headers: 요청 헤더)
+- max_queries: 정수 또는 fixture를 받아 정수를 반환하는 함수
+  (기록 양에 비례하는 bulk_create 배치 수처럼 fixture에 따라 달라지는 경우)
+- variant: 같은 URL의 요청을 구분하는 이름, anonymous: 로그인하지 않고 요청
+"""
+
+
+def _request(kwargs=None, data=None, json=False, headers=None):
+    return {
+        "kwargs": kwargs or {},
+        "data": data or {},
+        "json": json,
+        "headers": headers or {},
+    }
+
+
+def _import_file(fixture):
+    content = f"date,start,end,tag\n{fixture.empty_date},09:00,12:00,가져오기\n"
+    return SimpleUploadedFile("import.csv", content.encode(), "text/csv")
+
+
+def _by_storage(rows, daylog):
+    """
+    시간 블록 저장 방식(settings.TIMEBLOCK_STORAGE)별 상한
+    - daylog: 태그 FK가 없어 읽을 때 남아 있는 태그 ID 조회 1개,
+      저장할 때 날짜 행 잠금 조회(select_for_update) 후 저장
+    """
+    return lambda f: rows if f.storage == "rows" else daylog
+
+
+# 세션/사용자 조회(2개)를 포함한 요청 전체의 쿼리 수
+# 목록 순서대로 요청하므로 데이터를 지우는 요청은 뒤에 둠
+QUERY_BUDGETS = [
+    QueryBudget("home", "GET", 2, lambda f: _request()),
+    QueryBudget(
+        "metrics",
+        "GET",
+        0,
+        lambda f: _request(headers={"Authorization": f"Bearer {METRICS_TOKEN}"}),
+        anonymous=True,
+    ),
+    QueryBudget("dashboard:index", "GET", 5, lambda f: _request(data={"date": f.date})),
+    QueryBudget(
+        "dashboard:day_data", "GET", 5, lambda f: _request(data={"date": f.date})
+    ),
+    QueryBudget(
+        "dashboard:week",
+        "GET",
+        _by_storage(rows=5, daylog=6),
+        lambda f: _request(data={"date": f.date}),
+    ),
+    QueryBudget(
+        "dashboard:month",
+        "GET",
+        _by_storage(rows=5, daylog=6),
+        lambda f: _request(data={"date": f.date}),
+    ),
+    *[
+        QueryBudget(
+            "stats:index",
+            "GET",
+            4,
+            lambda f, tab=tab: _request(data={"tab": tab}),
+            variant=tab,
+        )
+        for tab in ("daily", "weekly", "monthly", "tags")
+    ],
+    *[
+        QueryBudget(
+            "stats_api:stats_section_api",
+            "GET",
+            3,
+            lambda f, tab=tab: _request(kwargs={"tab": tab}),
+            variant=tab,
+        )
+        for tab in ("daily", "weekly", "monthly", "tags")
+    ],
+    QueryBudget("stats_api:stats_feedback_api", "GET", 8, lambda f: _request()),
+    QueryBudget("tags:index", "GET", 4, lambda f: _request()),
+    QueryBudget("tags_api:tag_list_create", "GET", 4, lambda f: _request()),
+    QueryBudget(
+        "tags_api:tag_list_create",
+        "POST",
+        4,
+        lambda f: _request(data={"name": "새 태그", "color": "#123456"}, json=True),
+    ),
+    QueryBudget(
+        "tags_api:tag_detail_update_delete",
+        "PUT",
+        6,
+        lambda f: _request(
+            kwargs={"tag_id": f.tag.id},
+            data={"name": f.tag.name, "color": "#654321"},
+            json=True,
+        ),
+    ),
+    QueryBudget(
+        "dashboard_api:time_block_api",
+        "GET",
+        _by_storage(rows=5, daylog=6),
+        lambda f: _request(data={"from": f.week_start, "to": f.date}),
+        variant="week",
+    ),
+    QueryBudget(
+        "dashboard_api:time_block_api",
+        "GET",
+        _by_storage(rows=5, daylog=6),
+        lambda f: _request(data={"from": f.year_start, "to": f.date}),
+        variant="stream",
+    ),
+    QueryBudget(
+        "dashboard_api:time_block_api",
+        "POST",
+        _by_storage(rows=9, daylog=11),
+        lambda f: _request(
+            data={
+                "date": f.date,
+                "slot_indexes": list(range(54, 108)),
+                "tag_id": f.tag.id,
+            },
+            json=True,
+        ),
+    ),
+    QueryBudget(
+        "dashboard_api:time_block_api",
+        "DELETE",
+        9,
+        lambda f: _request(
+            data={"date": f.date, "slot_indexes": list(range(54, 108))}, json=True
+        ),
+    ),
+    # 일괄 편집은 작업(날짜)마다 변경 번호 발급/기존 슬롯 확인/저장 3개 (작업 7개)
+    QueryBudget(
+        "dashboard_api:time_block_batch_api",
+        "POST",
+        _by_storage(rows=27, daylog=31),
+        lambda f: _request(
+            data={
+                "operations": [
+                    {
+                        "op": "set",
+                        "date": (f.today - timedelta(days=offset)).isoformat(),
+                        "slots": [[54, 107]],
+                        "tag_id": f.tag.id,
+                    }
+                    for offset in range(7)
+                ]
+            },
+            json=True,
+        ),
+    ),
+    QueryBudget("dashboard_api:time_block_changes_api", "GET", 3, lambda f: _request()),
+    QueryBudget(
+        "dashboard_api:export_api",
+        "GET",
+        _by_storage(rows=4, daylog=5),
+        lambda f: _request(data={"from": f.year_start, "to": f.date}),
+    ),
+    QueryBudget(
+        "dashboard_api:import_api",
+        "POST",
+        _by_storage(rows=9, daylog=11),
+        lambda f: _request(data={"file": _import_file(f)}),
+    ),
+    QueryBudget("users:signup", "GET", 0, lambda f: _request(), anonymous=True),
+    QueryBudget("users:login", "GET", 0, lambda f: _request(), anonymous=True),
+    QueryBudget("users:mypage", "GET", 8, lambda f: _request()),
+    QueryBudget(
+        "users:mypage",
+        "POST",
+        9,
+        lambda f: _request(
+            data={"tag": f.tag.id, "period": "daily", "target_hours": 1}
+        ),
+    ),
+    QueryBudget("users:usergoal_list", "GET", 3, lambda f: _request()),
+    QueryBudget("users:usergoal_create", "GET", 4, lambda f: _request()),
+    QueryBudget(
+        "users:usergoal_create",
+        "POST",
+        5,
+        lambda f: _request(
+            data={"tag": f.tag.id, "period": "weekly", "target_hours": 3}
+        ),
+    ),
+    QueryBudget(
+        "users:usergoal_update",
+        "GET",
+        5,
+        lambda f: _request(kwargs={"pk": f.goal.pk}),
+    ),
+    QueryBudget(
+        "users:usergoal_update",
+        "POST",
+        6,
+        lambda f: _request(
+            kwargs={"pk": f.goal.pk},
+            data={"tag": f.tag.id, "period": "monthly", "target_hours": 10},
+        ),
+    ),
+    QueryBudget("users:usernote_list", "GET", 3, lambda f: _request()),
+    QueryBudget("users:usernote_create", "GET", 2, lambda f: _request()),
+    QueryBudget(
+        "users:usernote_create",
+        "POST",
+        3,
+        lambda f: _request(data={"note": "쿼리 수 점검"}),
+    ),
+    QueryBudget(
+        "users:usernote_update",
+        "GET",
+        3,
+        lambda f: _request(kwargs={"pk": f.note.pk}),
+    ),
+    QueryBudget(
+        "users:usernote_update",
+        "POST",
+        4,
+        lambda f: _request(kwargs={"pk": f.note.pk}, data={"note": "수정"}),
+    ),
+    QueryBudget(
+        "users:usergoal_delete",
+        "GET",
+        4,
+        lambda f: _request(kwargs={"pk": f.goal.pk}),
+    ),
+    QueryBudget(
+        "users:usergoal_delete",
+        "POST",
+        4,
+        lambda f: _request(kwargs={"pk": f.goal.pk}),
+    ),
+    QueryBudget(
+        "users:usernote_delete",
+        "GET",
+        3,
+        lambda f: _request(kwargs={"pk": f.note.pk}),
+    ),
+    QueryBudget(
+        "users:usernote_delete",
+        "POST",
+        4,
+        lambda f: _request(kwargs={"pk": f.note.pk}),
+    ),
+    # 태그를 쓰던 날짜의 일별 집계를 다시 저장하므로 집계 행 BULK_WRITE_BATCH_SIZE개마다 INSERT 1개
+    QueryBudget(
+        "tags_api:tag_detail_update_delete",
+        "DELETE",
+        lambda f: _by_storage(rows=11, daylog=12)(f)
+        + ceil(f.tag_rollup_rows / BULK_WRITE_BATCH_SIZE),
+        lambda f: _request(kwargs={"tag_id": f.tag.id}),
+    ),
+    QueryBudget("users:logout", "POST", 4, lambda f: _request()),
+]
+
+
+def iter_url_names(patterns=None, namespace=""):
+    """URL 설정의 모든 이름 (네임스페이스 포함, EXCLUDED_NAMESPACES 제외)"""
+    if patterns is None:
+        patterns = get_resolver().url_patterns
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            if pattern.namespace in EXCLUDED_NAMESPACES:
+                continue
+            child_namespace = namespace
+            if pattern.namespace:
+                child_namespace = f"{namespace}{pattern.namespace}:"
+            yield from iter_url_names(pattern.url_patterns, child_namespace)
+        elif isinstance(pattern, URLPattern) and pattern.name:
+            yield f"{namespace}{pattern.name}"
+
+
+def get_uncovered_url_names(budgets=QUERY_BUDGETS):
+    """상한이 정의되지 않은 URL 이름 목록"""
+    covered = {budget.url_name for budget in budgets}
+    return sorted(set(iter_url_names()) - covered)
+
+
+def create_fixture(username, years):
+    """기록 기간이 years년인 합성 사용자와 요청에 쓸 날짜/태그/목표/메모"""
+    from apps.dashboard.storage import copy_rows_to_day_logs, get_timeblock_storage
+    from apps.stats.models import DailyTagRollup
+    from apps.tags.models import Tag
+    from apps.users.models import UserGoal, UserNote
+
+    today = timezone.localdate()
+    user = create_synthetic_user(username, years, end_date=today)
+    create_synthetic_goals_and_notes(user, years)
+    if get_timeblock_storage().name == "daylog":
+        copy_rows_to_day_logs(user.id)
+    tag = Tag.objects.filter(user=user, name="업무").first()
+    return SimpleNamespace(
+        user=user,
+        storage=get_timeblock_storage().name,
+        today=today,
+        date=today.isoformat(),
+        week_start=(today - timedelta(days=6)).isoformat(),
+        year_start=(today - timedelta(days=364)).isoformat(),
+        empty_date=(today + timedelta(days=1)).isoformat(),
+        tag=tag,
+        # 태그를 쓰던 날짜의 일별 집계 행 수 (태그 삭제 시 다시 저장)
+        tag_rollup_rows=DailyTagRollup.objects.filter(
+            user=user,
+            date__in=DailyTagRollup.objects.filter(tag=tag).values("date"),
+        ).count(),
+        goal=UserGoal.objects.filter(user=user).first(),
+        note=UserNote.objects.filter(user=user).first(),
+    )
+
+
+def _send(client, budget, fixture):
+    options = budget.build(fixture)
+    path = reverse(budget.url_name, kwargs=options["kwargs"])
+    send = getattr(client, budget.method.lower())
+    if options["json"]:
+        return send(
+            path,
+            json.dumps(options["data"]),
+            content_type="application/json",
+            headers=options["headers"],
+        )
+    return send(path, options["data"], headers=options["headers"])
+
+
+def _counted_queries(captured):
+    """세는 쿼리 목록 (SAVEPOINT 제외)"""
+    return [
+        query["sql"]
+        for query in captured.captured_queries
+        if not query["sql"].startswith(_SAVEPOINT_PREFIXES)
+    ]
+
+
+def check_budget(budget, fixture):
+    """
+    요청 하나를 보내고 쿼리 수 측정
+
+    Returns:
+        dict: {"status", "queries", "max_queries", "sql"} (sql: 실행된 쿼리 목록)
+    """
+    max_queries = budget.max_queries
+    if callable(max_queries):
+        max_queries = max_queries(fixture)
+    cache.clear()
+    client = Client()
+    if not budget.anonymous:
+        client.force_login(fixture.user)
+    with CaptureQueriesContext(connection) as captured:
+        response = _send(client, budget, fixture)
+        if response.streaming:
+            # 스트리밍 응답은 본문을 만들 때 쿼리가 실행됨
+            b"".join(response.streaming_content)
+    sql = _counted_queries(captured)
+    return {
+        "status": response.status_code,
+        "queries": len(sql),
+        "max_queries": max_queries,
+        "sql": sql,
+    }
+
+
+def run_query_budgets(years_list, budgets=QUERY_BUDGETS):
+    """
+    기록 기간별 합성 사용자로 모든 요청의 쿼리 수 측정 (데이터는 롤백)
+
+    Returns:
+        list: 요청별 결과 dict
+            {"label", "queries": {기간: (쿼리 수, 상한)}, "failures": [...]}
+            failures: (기간, 사유, 실행된 쿼리 목록)
+    """
+    results = [
+        {
+            "label": " ".join(
+                filter(None, [budget.method, budget.url_name, budget.variant])
+            ),
+            "queries": {},
+            "failures": [],
+        }
+        for budget in budgets
+    ]
+    for years in years_list:
+        with rolled_back(), override_settings(METRICS_TOKEN=METRICS_TOKEN):
+            fixture = create_fixture(f"query_budget_{years}y", years)
+            for budget, result in zip(budgets, results):
+                measured = check_budget(budget, fixture)
+                result["queries"][years] = (
+                    measured["queries"],
+                    measured["max_queries"],
+                )
+                if measured["status"] >= 400:
+                    reason = f"응답 코드 {measured['status']}"
+                elif measured["queries"] > measured["max_queries"]:
+                    reason = (
+                        f"쿼리 {measured['queries']}개 > "
+                        f"상한 {measured['max_queries']}개"
+                    )
+                else:
+                    continue
+                result["failures"].append((years, reason, measured["sql"]))
+    return results
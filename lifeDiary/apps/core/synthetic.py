@@ -0,0 +1,234 @@
+"""
+=================================================================================
+합성(synthetic) 데이터와 벤치마크 공통 도구
+- 합성 사용자/시간 블록/목표/메모 데이터 생성 (벤치마크, 쿼리 예산 검사, 시드 데이터, 테스트)
+- 반복 실행 시간(p50/p95)과 쿼리 수 측정
+- 측정 후 데이터를 남기지 않도록 트랜잭션 롤백
+=================================================================================
+"""
+
+import random
+import time
+from contextlib import contextmanager
+from datetime import date, timedelta
+
+from django.contrib.auth.models import User
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from apps.core.metrics import percentile
+from apps.core.utils import TOTAL_SLOTS_PER_DAY, SLOTS_PER_HOUR
+
+# 합성 사용자에게 만들어 줄 태그 (이름, 색상)
+SYNTHETIC_TAGS = [
+    ("수면", "#5B6C8F"),
+    ("업무", "#E74C3C"),
+    ("식사", "#F39C12"),
+    ("운동", "#27AE60"),
+    ("독서", "#8E44AD"),
+    ("휴식", "#16A085"),
+    ("공부", "#2980B9"),
+    ("이동", "#7F8C8D"),
+]
+
+# 합성 사용자에게 만들어 줄 목표 (태그명, 기간, 목표 시간)
+SYNTHETIC_GOALS = [
+    ("수면", "daily", 7),
+    ("업무", "weekly", 40),
+    ("운동", "weekly", 5),
+    ("독서", "monthly", 20),
+    ("공부", "monthly", 30),
+]
+
+# 합성 메모 본문
+SYNTHETIC_NOTES = [
+    "이번 주는 수면 시간이 부족했다.",
+    "운동을 꾸준히 하려면 아침 시간을 활용하자.",
+    "업무 시간이 길어지고 있어서 휴식 시간을 따로 확보해야 한다.",
+    "독서 목표를 달성하려면 이동 시간에 책을 읽자.",
+    "주말에는 공부 시간을 늘려 보자.",
+]
+
+
+class _Rollback(Exception):
+    pass
+
+
+@contextmanager
+def rolled_back():
+    """블록 안에서 만든 데이터를 모두 롤백 (벤치마크용 합성 데이터 정리)"""
+    try:
+        with transaction.atomic():
+            yield
+            raise _Rollback
+    except _Rollback:
+        pass
+
+
+def generate_day_slots(rng, date_item, tag_ids):
+    """
+    하루치 합성 슬롯 생성 (수면 → 식사/업무/운동 등 → 빈 시간 일부)
+
+    Args:
+        rng (random.Random): 난수 생성기
+        date_item (date): 날짜
+        tag_ids (dict): 태그명 → 태그 ID
+
+    Returns:
+        list: (slot_index, tag_id, memo) 튜플 목록 (slot_index 순)
+    """
+    slots = {}
+    wake_slot = rng.randint(6 * SLOTS_PER_HOUR, 8 * SLOTS_PER_HOUR)
+    bed_slot = rng.randint(22 * SLOTS_PER_HOUR, TOTAL_SLOTS_PER_DAY - 1)
+    for slot_index in range(wake_slot):
+        slots[slot_index] = tag_ids["수면"]
+    for slot_index in range(bed_slot, TOTAL_SLOTS_PER_DAY):
+        slots[slot_index] = tag_ids["수면"]
+
+    if date_item.weekday() < 5:
+        for slot_index in range(9 * SLOTS_PER_HOUR, 18 * SLOTS_PER_HOUR):
+            slots[slot_index] = tag_ids["업무"]
+    for meal_hour in (8, 12, 19):
+        start = meal_hour * SLOTS_PER_HOUR + rng.randint(0, 2)
+        for slot_index in range(start, start + rng.randint(3, 6)):
+            slots[slot_index] = tag_ids["식사"]
+
+    free_tags = ["운동", "독서", "휴식", "공부", "이동"]
+    current_tag = tag_ids[rng.choice(free_tags)]
+    for slot_index in range(wake_slot, bed_slot):
+        if slot_index in slots:
+            continue
+        # 약 20%는 기록하지 않은 빈 시간으로 남김
+        if rng.random() < 0.2:
+            continue
+        if rng.random() < 0.15:
+            current_tag = tag_ids[rng.choice(free_tags)]
+        slots[slot_index] = current_tag
+
+    return [
+        (slot_index, slots[slot_index], "메모" if rng.random() < 0.01 else "")
+        for slot_index in sorted(slots)
+    ]
+
+
+def create_synthetic_user(
+    username, years, end_date=None, seed=0, batch_size=5000, fill_ratio=0.9
+):
+    """
+    합성 사용자와 태그, 시간 블록, 일별 태그 집계를 대량 생성
+
+    Args:
+        username (str): 사용자명
+        years (float): 생성할 기록 기간 (년)
+        end_date (date): 마지막 기록 날짜 (기본값: 오늘)
+        seed (int): 난수 시드
+        batch_size (int): bulk_create 배치 크기
+        fill_ratio (float): 기록이 있는 날의 비율
+
+    Returns:
+        User: 생성된 사용자
+    """
+    from apps.tags.models import Tag
+    from apps.dashboard.models import TimeBlock
+    from apps.stats.models import DailyTagRollup
+    from apps.stats.rollups import build_rollup_rows
+
+    rng = random.Random(seed)
+    end_date = end_date or date.today()
+    total_days = int(365 * years)
+    start_date = end_date - timedelta(days=total_days - 1)
+
+    user = User.objects.create_user(username=username, password=None)
+    tags = Tag.objects.bulk_create(
+        [Tag(user=user, name=name, color=color) for name, color in SYNTHETIC_TAGS]
+    )
+    tag_ids = {tag.name: tag.id for tag in tags}
+
+    blocks = []
+    rollups = []
+    for day_index in range(total_days):
+        date_item = start_date + timedelta(days=day_index)
+        if rng.random() > fill_ratio:
+            continue
+        day_slots = generate_day_slots(rng, date_item, tag_ids)
+        blocks.extend(
+            TimeBlock(
+                user=user,
+                date=date_item,
+                slot_index=slot_index,
+                tag_id=tag_id,
+                memo=memo,
+            )
+            for slot_index, tag_id, memo in day_slots
+        )
+        rollups.extend(
+            DailyTagRollup(user=user, **row)
+            for row in build_rollup_rows(
+                (date_item, slot_index, tag_id) for slot_index, tag_id, _ in day_slots
+            )
+        )
+        if len(blocks) >= batch_size:
+            TimeBlock.objects.bulk_create(blocks, batch_size=batch_size)
+            blocks = []
+    TimeBlock.objects.bulk_create(blocks, batch_size=batch_size)
+    DailyTagRollup.objects.bulk_create(rollups, batch_size=batch_size)
+    return user
+
+
+def create_synthetic_goals_and_notes(user, years, seed=0, notes_per_week=1):
+    """
+    합성 사용자의 목표(SYNTHETIC_GOALS)와 메모(기록 기간의 주마다 notes_per_week개) 생성
+    (create_synthetic_user로 만든 사용자의 태그를 사용)
+
+    Returns:
+        tuple: (목표 수, 메모 수)
+    """
+    from apps.tags.models import Tag
+    from apps.users.models import UserGoal, UserNote
+
+    rng = random.Random(seed)
+    tag_ids = dict(Tag.objects.filter(user=user).values_list("name", "id"))
+    goals = UserGoal.objects.bulk_create(
+        [
+            UserGoal(
+                user=user,
+                tag_id=tag_ids[tag_name],
+                period=period,
+                target_hours=target_hours,
+            )
+            for tag_name, period, target_hours in SYNTHETIC_GOALS
+        ]
+    )
+    notes = UserNote.objects.bulk_create(
+        [
+            UserNote(user=user, note=rng.choice(SYNTHETIC_NOTES))
+            for _ in range(int(52 * years * notes_per_week))
+        ]
+    )
+    return len(goals), len(notes)
+
+
+def measure(func, repeat=5, warmup=1):
+    """
+    함수를 반복 실행하여 실행 시간(ms)과 마지막 실행의 쿼리 수 측정
+
+    Returns:
+        dict: {"p50_ms", "p95_ms", "mean_ms", "min_ms", "queries"}
+    """
+    for _ in range(warmup):
+        func()
+    durations = []
+    queries = 0
+    for _ in range(repeat):
+        with CaptureQueriesContext(connection) as captured:
+            started = time.perf_counter()
+            func()
+            durations.append((time.perf_counter() - started) * 1000)
+        queries = len(captured)
+    return {
+        "p50_ms": round(percentile(durations, 50), 2),
+        "p95_ms": round(percentile(durations, 95), 2),
+        "mean_ms": round(sum(durations) / len(durations), 2),
+        "min_ms": round(min(durations), 2),
+        "queries": queries,
+    }
@@ -0,0 +1,21 @@
+import sys
+import threading
+
+from django.test import SimpleTestCase
+
+from apps.core.profiling import StackSampler
+
+
+class StackSamplerTests(SimpleTestCase):
+    def test_overlapping_samplers_restore_switch_interval(self):
+        original = sys.getswitchinterval()
+        first = StackSampler(threading.get_ident(), interval=0.001)
+        second = StackSampler(threading.get_ident(), interval=0.002)
+
+        first.__enter__()
+        second.__enter__()
+        # 먼저 시작한 샘플러가 끝나도 다른 샘플러가 실행 중이면 짧은 간격 유지
+        first.__exit__(None, None, None)
+        self.assertEqual(sys.getswitchinterval(), 0.001)
+        second.__exit__(None, None, None)
+        self.assertEqual(sys.getswitchinterval(), original)
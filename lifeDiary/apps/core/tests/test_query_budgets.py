@@ -0,0 +1,43 @@
+from django.test import TestCase, override_settings
+
+from apps.dashboard.storage import TIMEBLOCK_STORAGES
+from apps.core.query_budgets import (
+    METRICS_TOKEN,
+    QUERY_BUDGETS,
+    check_budget,
+    create_fixture,
+    get_uncovered_url_names,
+)
+
+
+@override_settings(METRICS_TOKEN=METRICS_TOKEN)
+class QueryBudgetTests(TestCase):
+    """모든 화면/API의 쿼리 수가 QUERY_BUDGETS의 상한 이내인지 (저장 방식/기록 기간별 합성 사용자)"""
+
+    # 기록이 많아져도 쿼리 수가 늘지 않는지 보기 위해 기간이 다른 두 사용자로 측정
+    YEARS = (0.1, 1)
+
+    def test_every_url_has_budget(self):
+        self.assertEqual(get_uncovered_url_names(), [])
+
+    def test_query_budgets(self):
+        for storage in TIMEBLOCK_STORAGES:
+            for years in self.YEARS:
+                with override_settings(TIMEBLOCK_STORAGE=storage):
+                    self.check_budgets(storage, years)
+
+    def check_budgets(self, storage, years):
+        fixture = create_fixture(f"query_budget_{storage}_{years}y", years)
+        # 목록 순서대로 요청 (데이터를 지우는 요청은 목록 뒤쪽)
+        for budget in QUERY_BUDGETS:
+            label = " ".join(
+                filter(None, [budget.method, budget.url_name, budget.variant])
+            )
+            with self.subTest(budget=label, storage=storage, years=years):
+                measured = check_budget(budget, fixture)
+                self.assertLess(measured["status"], 400)
+                self.assertLessEqual(
+                    measured["queries"],
+                    measured["max_queries"],
+                    "\n".join(measured["sql"]),
+                )
@@ -21,6 +21,13 @@ TOTAL_SLOTS_PER_DAY = 144  # 24시간 * 6
 MINUTES_PER_SLOT = 10
 HOURS_PER_DAY = 24
 
+# 시간 블록 메모 최대 길이 (TimeBlock.memo의 max_length)
+MAX_MEMO_LENGTH = 500
+
+# 요청 처리 중 bulk_create의 배치 크기
+# (SQLite 파라미터 상한 999에서도 더 나뉘지 않는 크기로 고정 → DB와 관계없이 INSERT 문 수가 같음)
+BULK_WRITE_BATCH_SIZE = 100
+
 
 def serialize_for_js(data):
     """
@@ -55,6 +62,22 @@ def safe_date_parse(date_str, default=None):
         return default or date.today()
 
 
+def parse_date_or_none(date_str):
+    """
+    YYYY-MM-DD 날짜 파싱 (safe_date_parse와 달리 실패하면 오늘 대신 None 반환)
+
+    Args:
+        date_str (str): 파싱할 날짜 문자열
+
+    Returns:
+        date: 파싱된 날짜 객체 또는 None
+    """
+    try:
+        return datetime.strptime(date_str, "%Y-%m-%d").date()
+    except (ValueError, TypeError):
+        return None
+
+
 def calculate_time_statistics(blocks_count):
     """
     시간 블록 개수를 기반으로 시간 통계 계산
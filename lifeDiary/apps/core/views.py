@@ -0,0 +1,31 @@
+import hmac
+
+from django.conf import settings
+from django.http import Http404, HttpResponse
+from django.views.decorators.cache import never_cache
+from django.views.decorators.http import require_GET
+
+from .prometheus import CONTENT_TYPE, render_metrics
+
+
+@require_GET
+@never_cache
+def metrics_view(request):
+    """
+    Prometheus 지표 (apps.core.prometheus 참고)
+    - Authorization: Bearer <settings.METRICS_TOKEN> 헤더가 있어야 조회 가능
+    - METRICS_TOKEN이 설정되지 않았으면 404
+    """
+    token = getattr(settings, "METRICS_TOKEN", "")
+    if not token:
+        raise Http404
+
+    scheme, _, credentials = request.headers.get("Authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not hmac.compare_digest(
+        credentials.strip().encode(), token.encode()
+    ):
+        response = HttpResponse("Unauthorized", status=401, content_type="text/plain")
+        response["WWW-Authenticate"] = "Bearer"
+        return response
+
+    return HttpResponse(render_metrics(), content_type=CONTENT_TYPE)
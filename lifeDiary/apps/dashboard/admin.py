@@ -1,6 +1,10 @@
 from django.contrib import admin
+from django.db import transaction
 from django.utils.html import format_html
-from .models import TimeBlock
+from apps.stats.rollups import refresh_daily_rollups
+from apps.core.cache import bump_data_version
+from .models import TimeBlock, DayLog
+from .storage import unpack_slots, EMPTY_SLOT
 
 # Register your models here.
 
@@ -64,3 +68,69 @@ class TimeBlockAdmin(admin.ModelAdmin):
         """폼 커스터마이징"""
         request._obj_ = obj
         return super().get_form(request, obj, **kwargs)
+
+    def save_model(self, request, obj, form, change):
+        """저장 후 변경 전/후 날짜의 일별 태그 집계 갱신"""
+        with transaction.atomic():
+            super().save_model(request, obj, form, change)
+            if change and form.initial.get("date"):
+                initial_user_id = form.initial.get("user", obj.user_id)
+                refresh_daily_rollups(initial_user_id, [form.initial["date"]])
+                bump_data_version(initial_user_id)
+            refresh_daily_rollups(obj.user_id, [obj.date])
+            bump_data_version(obj.user_id)
+
+    def delete_model(self, request, obj):
+        """삭제 후 해당 날짜의 일별 태그 집계 갱신"""
+        with transaction.atomic():
+            super().delete_model(request, obj)
+            refresh_daily_rollups(obj.user_id, [obj.date])
+            bump_data_version(obj.user_id)
+
+    def delete_queryset(self, request, queryset):
+        """일괄 삭제 후 영향받은 날짜의 일별 태그 집계 갱신"""
+        with transaction.atomic():
+            days_by_user = {}
+            for user_id, date_item in queryset.values_list("user_id", "date"):
+                days_by_user.setdefault(user_id, set()).add(date_item)
+            super().delete_queryset(request, queryset)
+            for user_id, dates in days_by_user.items():
+                refresh_daily_rollups(user_id, dates)
+                bump_data_version(user_id)
+
+
+@admin.register(DayLog)
+class DayLogAdmin(admin.ModelAdmin):
+    """DayLog 조회 전용 (수정은 시간 블록 API로만 하여 일별 태그 집계와 동기화 유지)"""
+
+    list_display = ["user", "date", "filled_slots", "memo_count", "updated_at"]
+    list_filter = ["user", "date"]
+    search_fields = ["user__username"]
+    ordering = ["-date"]
+    date_hierarchy = "date"
+    list_per_page = 50
+
+    def filled_slots(self, obj):
+        """기록된 슬롯 수"""
+        return sum(1 for value in unpack_slots(obj.slots) if value != EMPTY_SLOT)
+
+    filled_slots.short_description = "기록된 슬롯"
+
+    def memo_count(self, obj):
+        """메모가 있는 슬롯 수"""
+        return len(obj.memos)
+
+    memo_count.short_description = "메모"
+
+    def get_queryset(self, request):
+        """쿼리 최적화"""
+        return super().get_queryset(request).select_related("user")
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
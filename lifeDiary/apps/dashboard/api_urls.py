@@ -6,4 +6,18 @@ app_name = "dashboard_api"
 urlpatterns = [
     # 시간 블록 관리 API
     path("time-blocks/", views.time_block_api, name="time_block_api"),
+    path(
+        "time-blocks/changes/",
+        views.time_block_changes_api,
+        name="time_block_changes_api",
+    ),
+    path(
+        "time-blocks/batch/",
+        views.time_block_batch_api,
+        name="time_block_batch_api",
+    ),
+    # 시간 기록 내보내기 (CSV / JSON Lines 스트리밍)
+    path("export/", views.export_api, name="export_api"),
+    # 시간 기록 가져오기 (CSV / ICS 업로드)
+    path("import/", views.import_api, name="import_api"),
 ]
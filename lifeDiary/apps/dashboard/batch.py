@@ -0,0 +1,235 @@
+"""
+=================================================================================
+시간 블록 일괄 편집 (POST /api/time-blocks/batch/)
+- 여러 날짜의 편집 작업(set/clear/copy)을 한 요청, 한 트랜잭션으로 적용
+- 슬롯은 [시작, 끝] 구간 목록으로 지정 (양 끝 포함, 예: [[36, 54]] = 06:00~09:10)
+- 작업은 요청 순서대로 적용되며, 하나라도 실패하면 전체가 롤백됨
+
+요청 예시:
+    {"operations": [
+        {"op": "set", "date": "2025-01-06", "slots": [[36, 54]], "tag_id": 3, "memo": ""},
+        {"op": "clear", "date": "2025-01-07", "slots": [[0, 143]]},
+        {"op": "copy", "date": "2025-01-08", "source_date": "2025-01-06", "slots": [[0, 143]]}
+    ]}
+=================================================================================
+"""
+
+from django.db import transaction
+from django.db.models import Q
+
+from apps.tags.models import Tag
+from apps.stats.rollups import refresh_daily_rollups
+from apps.core.cache import bump_data_version
+from apps.core.utils import parse_date_or_none, MAX_MEMO_LENGTH, TOTAL_SLOTS_PER_DAY
+from .storage import get_timeblock_storage
+
+BATCH_OPERATION_TYPES = ("set", "clear", "copy")
+
+# 한 요청에 담을 수 있는 최대 작업 수
+MAX_BATCH_OPERATIONS = 400
+
+
+class BatchOperationError(ValueError):
+    """일괄 편집 요청 검증 실패 (index: 문제가 된 작업 번호)"""
+
+    def __init__(self, message, error_code, index=None):
+        if index is not None:
+            message = f"{index + 1}번째 작업: {message}"
+        super().__init__(message)
+        self.message = message
+        self.error_code = error_code
+        self.index = index
+
+
+def expand_slot_ranges(ranges):
+    """
+    [시작, 끝] 구간 목록 → 슬롯 인덱스 목록 (중복 제거, 입력 순서 유지)
+
+    Raises:
+        BatchOperationError: 구간 형식이 잘못되었거나 0~143을 벗어난 경우
+    """
+    if not isinstance(ranges, list) or not ranges:
+        raise BatchOperationError("슬롯 구간이 누락되었습니다.", "MISSING_SLOTS")
+
+    slot_indexes = {}
+    for slot_range in ranges:
+        if not (
+            isinstance(slot_range, list)
+            and len(slot_range) == 2
+            and all(
+                isinstance(value, int) and not isinstance(value, bool)
+                for value in slot_range
+            )
+            and 0 <= slot_range[0] <= slot_range[1] < TOTAL_SLOTS_PER_DAY
+        ):
+            raise BatchOperationError(
+                f"슬롯 구간은 0~{TOTAL_SLOTS_PER_DAY - 1} 사이의 [시작, 끝] 정수 쌍이어야 합니다.",
+                "INVALID_SLOT_RANGE",
+            )
+        slot_indexes.update(dict.fromkeys(range(slot_range[0], slot_range[1] + 1)))
+    return list(slot_indexes)
+
+
+def _parse_date(value, field):
+    date_item = parse_date_or_none(value)
+    if not date_item:
+        raise BatchOperationError(
+            f"{field}는 YYYY-MM-DD 형식이어야 합니다.", "INVALID_DATE_FORMAT"
+        )
+    return date_item
+
+
+def parse_operations(user, operations):
+    """
+    요청의 작업 목록을 검증하고 적용 가능한 형태로 변환
+    - set 작업의 태그는 한 번의 쿼리로 조회 (사용자 태그 + 기본 태그)
+
+    Returns:
+        list: {"op", "date", "slot_indexes", ...} 목록
+
+    Raises:
+        BatchOperationError: 작업 형식이 잘못되었거나 태그에 접근할 수 없는 경우
+    """
+    if not isinstance(operations, list) or not operations:
+        raise BatchOperationError("작업 목록이 누락되었습니다.", "MISSING_OPERATIONS")
+    if len(operations) > MAX_BATCH_OPERATIONS:
+        raise BatchOperationError(
+            f"한 번에 최대 {MAX_BATCH_OPERATIONS}개의 작업만 처리할 수 있습니다.",
+            "TOO_MANY_OPERATIONS",
+        )
+
+    parsed = []
+    for index, operation in enumerate(operations):
+        try:
+            if not isinstance(operation, dict):
+                raise BatchOperationError(
+                    "작업은 JSON 객체여야 합니다.", "INVALID_OPERATION"
+                )
+            op = operation.get("op")
+            if op not in BATCH_OPERATION_TYPES:
+                raise BatchOperationError(
+                    f"op는 {', '.join(BATCH_OPERATION_TYPES)} 중 하나여야 합니다.",
+                    "INVALID_OPERATION",
+                )
+            item = {
+                "op": op,
+                "date": _parse_date(operation.get("date"), "date"),
+                "slot_indexes": expand_slot_ranges(operation.get("slots")),
+            }
+            if op == "set":
+                if not operation.get("tag_id"):
+                    raise BatchOperationError(
+                        "태그가 선택되지 않았습니다.", "MISSING_TAG"
+                    )
+                try:
+                    item["tag_id"] = int(operation["tag_id"])
+                except (TypeError, ValueError):
+                    raise BatchOperationError(
+                        "태그 ID는 정수여야 합니다.", "INVALID_TAG"
+                    )
+                item["memo"] = operation.get("memo", "")
+                if (
+                    not isinstance(item["memo"], str)
+                    or len(item["memo"]) > MAX_MEMO_LENGTH
+                ):
+                    raise BatchOperationError(
+                        f"메모는 최대 {MAX_MEMO_LENGTH}자의 문자열이어야 합니다.",
+                        "INVALID_MEMO",
+                    )
+            elif op == "copy":
+                item["source_date"] = _parse_date(
+                    operation.get("source_date"), "source_date"
+                )
+        except BatchOperationError as e:
+            raise BatchOperationError(e.message, e.error_code, index)
+        parsed.append(item)
+
+    # 태그 캐시는 무효화가 늦게 반영될 수 있으므로 저장할 때는 DB에서 확인
+    tag_ids = {item["tag_id"] for item in parsed if item["op"] == "set"}
+    tags = {}
+    if tag_ids:
+        tags = Tag.objects.filter(Q(user=user) | Q(is_default=True)).in_bulk(tag_ids)
+    for index, item in enumerate(parsed):
+        if item["op"] != "set":
+            continue
+        item["tag"] = tags.get(item.pop("tag_id"))
+        if item["tag"] is None:
+            raise BatchOperationError(
+                "존재하지 않는 태그이거나 접근 권한이 없습니다.", "TAG_NOT_FOUND", index
+            )
+    return parsed
+
+
+def _copy_slots(storage, user, item):
+    """원본 날짜의 구간 기록을 대상 날짜에 복사 (원본에 없는 슬롯은 대상에서 삭제)"""
+    source = {
+        entry.slot_index: entry for entry in storage.get_day(user, item["source_date"])
+    }
+    groups = {}
+    empty_slots = []
+    for slot_index in item["slot_indexes"]:
+        entry = source.get(slot_index)
+        if entry is None:
+            empty_slots.append(slot_index)
+        else:
+            groups.setdefault((entry.tag_id, entry.memo), (entry.tag, []))[1].append(
+                slot_index
+            )
+
+    created_count = updated_count = deleted_count = 0
+    for (_, memo), (tag, slot_indexes) in groups.items():
+        created, updated = storage.save_slots(
+            user, item["date"], slot_indexes, tag, memo
+        )
+        created_count += created
+        updated_count += updated
+    if empty_slots:
+        deleted_count = storage.delete_slots(user, item["date"], empty_slots)
+    return created_count, updated_count, deleted_count
+
+
+def apply_operations(user, operations):
+    """
+    검증된 작업들을 한 트랜잭션으로 적용
+    - 일별 태그 집계와 데이터 버전은 변경된 날짜들에 대해 마지막에 한 번만 갱신
+
+    Returns:
+        list: 작업별 결과 {"op", "date", "slot_count", "created_count",
+              "updated_count", "deleted_count"}
+    """
+    storage = get_timeblock_storage()
+    results = []
+    changed_dates = set()
+    with transaction.atomic():
+        for item in operations:
+            created_count = updated_count = deleted_count = 0
+            if item["op"] == "set":
+                created_count, updated_count = storage.save_slots(
+                    user, item["date"], item["slot_indexes"], item["tag"], item["memo"]
+                )
+            elif item["op"] == "clear":
+                deleted_count = storage.delete_slots(
+                    user, item["date"], item["slot_indexes"]
+                )
+            else:
+                created_count, updated_count, deleted_count = _copy_slots(
+                    storage, user, item
+                )
+
+            if created_count or updated_count or deleted_count:
+                changed_dates.add(item["date"])
+            results.append(
+                {
+                    "op": item["op"],
+                    "date": item["date"].isoformat(),
+                    "slot_count": len(item["slot_indexes"]),
+                    "created_count": created_count,
+                    "updated_count": updated_count,
+                    "deleted_count": deleted_count,
+                }
+            )
+
+        if changed_dates:
+            refresh_daily_rollups(user.id, changed_dates)
+            bump_data_version(user.id)
+    return results
@@ -0,0 +1,333 @@
+"""
+시간 기록 벤치마크
+- manage.py benchmark timeblock_storage: 합성 사용자 데이터를 슬롯당 한 행(TimeBlock)과
+  하루 한 행(DayLog)으로 저장하여 행 수, 테이블/인덱스 크기, 하루치 조회 시간을 비교
+- manage.py benchmark timeblock_batch: 일주일치 기록 입력을 날짜별 API 요청으로 보낼 때와
+  일괄 편집 API 한 번으로 보낼 때의 처리 시간/쿼리 수 비교
+- manage.py benchmark dashboard_render: 대시보드 페이지(dashboard_view) 렌더링 시간
+- manage.py benchmark dashboard_range: 일주일/한 달을 하루 화면 여러 번으로 볼 때와
+  주간/월간 그리드 한 번으로 볼 때의 처리 시간/쿼리 수/응답 크기 비교
+"""
+
+import json
+import random
+from datetime import date, timedelta
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import RequestFactory
+
+from apps.core.synthetic import create_synthetic_user, measure, rolled_back
+from apps.tags.models import Tag
+from .models import TimeBlock, DayLog
+from .storage import TIMEBLOCK_STORAGES, copy_rows_to_day_logs
+from .views import (
+    RANGE_VIEW_SPANS,
+    dashboard_range_view,
+    dashboard_view,
+    time_block_api,
+    time_block_batch_api,
+)
+
+# 하루치 조회 시간을 측정할 날짜 수
+SAMPLE_DAYS = 30
+
+
+def _postgresql_sizes(table):
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT pg_relation_size(%s), pg_indexes_size(%s)", [table, table]
+        )
+        return cursor.fetchone()
+
+
+def _sqlite_sizes(table):
+    """dbstat 가상 테이블로 테이블/인덱스 페이지 크기 합계 (지원하지 않으면 None)"""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = %s",
+            [table],
+        )
+        index_names = [row[0] for row in cursor.fetchall()]
+        sizes = []
+        for names in ([table], index_names):
+            if not names:
+                sizes.append(0)
+                continue
+            placeholders = ", ".join(["%s"] * len(names))
+            cursor.execute(
+                f"SELECT COALESCE(SUM(pgsize), 0) FROM dbstat WHERE name IN ({placeholders})",
+                names,
+            )
+            sizes.append(cursor.fetchone()[0])
+        return tuple(sizes)
+
+
+def get_table_sizes(model):
+    """
+    모델 테이블의 (테이블 바이트, 인덱스 바이트)
+    - PostgreSQL: pg_relation_size / pg_indexes_size
+    - SQLite: dbstat (컴파일 옵션에 따라 없을 수 있음)
+    - 그 외 또는 측정 불가: (None, None)
+    """
+    table = model._meta.db_table
+    try:
+        if connection.vendor == "postgresql":
+            return _postgresql_sizes(table)
+        if connection.vendor == "sqlite":
+            return _sqlite_sizes(table)
+    except Exception:
+        pass
+    return None, None
+
+
+def _size_delta(before, after):
+    if None in before or None in after:
+        return None, None
+    return after[0] - before[0], after[1] - before[1]
+
+
+def timeblock_storage(options):
+    """
+    저장 방식별 측정 항목
+    - rows: 합성 사용자의 저장 행 수
+    - table_bytes / index_bytes: 합성 데이터 생성 전후의 테이블/인덱스 크기 차이
+    - p50_ms 등: 무작위 날짜 SAMPLE_DAYS일의 하루치 조회(get_day) 시간
+    """
+    results = []
+    end_date = date.today()
+    models = {"rows": TimeBlock, "daylog": DayLog}
+    for years in options["years"]:
+        with rolled_back():
+            sizes_before = {
+                name: get_table_sizes(model) for name, model in models.items()
+            }
+            user = create_synthetic_user(f"bench_storage_{years}y", years, end_date)
+            copy_rows_to_day_logs(user.id)
+            sizes_after = {
+                name: get_table_sizes(model) for name, model in models.items()
+            }
+
+            total_days = int(365 * years)
+            rng = random.Random(0)
+            sample_dates = [
+                end_date - timedelta(days=rng.randrange(total_days))
+                for _ in range(SAMPLE_DAYS)
+            ]
+            for name, storage in TIMEBLOCK_STORAGES.items():
+
+                def read_days():
+                    for date_item in sample_dates:
+                        storage.get_day(user, date_item)
+
+                table_bytes, index_bytes = _size_delta(
+                    sizes_before[name], sizes_after[name]
+                )
+                results.append(
+                    {
+                        "years": years,
+                        "storage": name,
+                        "rows": models[name].objects.filter(user=user).count(),
+                        "table_bytes": table_bytes,
+                        "index_bytes": index_bytes,
+                        "days_read": SAMPLE_DAYS,
+                        **measure(read_days, repeat=options["repeat"]),
+                    }
+                )
+    return results
+
+
+# 일괄 편집 벤치마크에서 입력할 하루 일정: (태그명, [시작 슬롯, 끝 슬롯])
+BATCH_DAY_PLAN = [("수면", [0, 41]), ("업무", [54, 107]), ("수면", [138, 143])]
+BATCH_DAYS = 7
+
+
+def _post_json(view, user, payload, path):
+    request = RequestFactory().post(
+        path, json.dumps(payload), content_type="application/json"
+    )
+    request.user = user
+    response = view(request)
+    if response.status_code >= 400:
+        raise RuntimeError(response.content.decode())
+    return response
+
+
+def timeblock_batch(options):
+    """
+    일주일치 일정(BATCH_DAY_PLAN x BATCH_DAYS) 입력 방식별 측정 항목
+    - single: 기존 시간 블록 API에 (날짜, 태그)마다 슬롯 목록을 보내는 요청들
+    - batch: 일괄 편집 API에 구간 작업 목록을 한 번에 보내는 요청
+    - requests: 요청 수, p50_ms 등: 요청 전체 처리 시간 (뷰 직접 호출)
+    """
+    results = []
+    end_date = date.today()
+    for years in options["years"]:
+        with rolled_back():
+            user = create_synthetic_user(f"bench_batch_{years}y", years, end_date)
+            tag_ids = dict(Tag.objects.filter(user=user).values_list("name", "id"))
+            dates = [end_date - timedelta(days=offset) for offset in range(BATCH_DAYS)]
+            plan = [
+                (date_item, tag_ids[tag_name], slot_range)
+                for date_item in dates
+                for tag_name, slot_range in BATCH_DAY_PLAN
+            ]
+
+            def send_single():
+                for date_item, tag_id, (start, end) in plan:
+                    _post_json(
+                        time_block_api,
+                        user,
+                        {
+                            "date": date_item.isoformat(),
+                            "slot_indexes": list(range(start, end + 1)),
+                            "tag_id": tag_id,
+                        },
+                        "/api/time-blocks/",
+                    )
+
+            def send_batch():
+                operations = [
+                    {
+                        "op": "set",
+                        "date": date_item.isoformat(),
+                        "slots": [slot_range],
+                        "tag_id": tag_id,
+                    }
+                    for date_item, tag_id, slot_range in plan
+                ]
+                _post_json(
+                    time_block_batch_api,
+                    user,
+                    {"operations": operations},
+                    "/api/time-blocks/batch/",
+                )
+
+            for name, send, request_count in (
+                ("single", send_single, len(plan)),
+                ("batch", send_batch, 1),
+            ):
+                results.append(
+                    {
+                        "years": years,
+                        "api": name,
+                        "requests": request_count,
+                        "slots": sum(end - start + 1 for _, _, (start, end) in plan),
+                        **measure(send, repeat=options["repeat"]),
+                    }
+                )
+    return results
+
+
+def dashboard_render(options):
+    """
+    대시보드 렌더링 측정 항목
+    - day: filled(기록이 있는 최근 날짜) / empty(기록이 없는 날짜)
+    - cache: warm(캐시 유지) / cold(요청마다 캐시 비움)
+    - p50_ms 등: dashboard_view 전체 처리 시간 (뷰 직접 호출)
+    """
+    results = []
+    end_date = date.today()
+    for years in options["years"]:
+        with rolled_back():
+            user = create_synthetic_user(f"bench_dashboard_{years}y", years, end_date)
+            filled_date = (
+                TimeBlock.objects.filter(user=user)
+                .order_by("-date")
+                .values_list("date", flat=True)
+                .first()
+            )
+            days = {
+                "filled": filled_date,
+                "empty": end_date + timedelta(days=1),
+            }
+            for day_name, date_item in days.items():
+                for cache_state in ("warm", "cold"):
+
+                    def render_dashboard():
+                        if cache_state == "cold":
+                            cache.clear()
+                        request = RequestFactory().get(
+                            "/dashboard/", {"date": date_item.isoformat()}
+                        )
+                        request.user = user
+                        response = dashboard_view(request)
+                        if response.status_code != 200:
+                            raise RuntimeError(response.status_code)
+
+                    results.append(
+                        {
+                            "years": years,
+                            "day": day_name,
+                            "cache": cache_state,
+                            **measure(render_dashboard, repeat=options["repeat"]),
+                        }
+                    )
+    return results
+
+
+def _get_page(view, user, path, params, **kwargs):
+    request = RequestFactory().get(path, params)
+    request.user = user
+    response = view(request, **kwargs)
+    if response.status_code != 200:
+        raise RuntimeError(response.status_code)
+    return response
+
+
+def dashboard_range(options):
+    """
+    기간(week/month) 보기 방식별 측정 항목
+    - days: 하루 화면(dashboard_view)을 기간의 날짜 수만큼 요청
+    - range: 주간/월간 그리드(dashboard_range_view)를 한 번 요청
+    - requests: 요청 수, bytes: 응답 크기 합계, p50_ms 등: 요청 전체 처리 시간
+    """
+    results = []
+    end_date = date.today()
+    for years in options["years"]:
+        with rolled_back():
+            user = create_synthetic_user(f"bench_range_{years}y", years, end_date)
+            for span, (_, get_date_range) in RANGE_VIEW_SPANS.items():
+                start_date, last_date = get_date_range(end_date - timedelta(days=7))
+                dates = [
+                    start_date + timedelta(days=offset)
+                    for offset in range((last_date - start_date).days + 1)
+                ]
+
+                def load_days():
+                    return [
+                        _get_page(
+                            dashboard_view,
+                            user,
+                            "/dashboard/",
+                            {"date": date_item.isoformat()},
+                        )
+                        for date_item in dates
+                    ]
+
+                def load_range():
+                    return [
+                        _get_page(
+                            dashboard_range_view,
+                            user,
+                            f"/dashboard/{span}/",
+                            {"date": start_date.isoformat()},
+                            span=span,
+                        )
+                    ]
+
+                for mode, load in (("days", load_days), ("range", load_range)):
+                    responses = load()
+                    results.append(
+                        {
+                            "years": years,
+                            "span": span,
+                            "mode": mode,
+                            "requests": len(responses),
+                            "bytes": sum(
+                                len(response.content) for response in responses
+                            ),
+                            **measure(load, repeat=options["repeat"]),
+                        }
+                    )
+    return results
@@ -0,0 +1,112 @@
+"""
+=================================================================================
+시간 블록 변경 피드 (GET /api/time-blocks/changes/?since=<cursor>)
+- 커서 이후 생성/수정된 슬롯과 삭제된 슬롯(TimeBlockTombstone)을 변경 순으로 반환
+- 커서는 서버가 돌려준 문자열을 그대로 다음 요청에 사용 (since 없이 요청하면 현재 커서만 반환)
+- 커서는 시각이 아니라 사용자별 변경 번호(TimeBlockChangeSequence)
+  → 번호는 쓰기 트랜잭션 안에서 행 잠금으로 발급되어 커밋 순서와 같으므로,
+    오래 걸린 트랜잭션이 커서보다 늦게 커밋되어도 변경을 놓치지 않음
+- 커서보다 새 삭제 기록이 이미 정리되었거나(보관 기간 경과) 변경이 너무 많으면
+  ResyncRequired → 클라이언트는 기간 조회 API로 다시 불러온 뒤 새 커서부터 조회
+
+응답 예시 (data):
+    {"cursor": "s1532",
+     "changes": [{"date": "2025-01-15", "slot": 40, "tag_id": 3, "memo": ""},
+                 {"date": "2025-01-15", "slot": 41, "deleted": true}]}
+=================================================================================
+"""
+
+import heapq
+
+from .models import TimeBlockChangeSequence, TimeBlockTombstone
+from .storage import get_timeblock_storage
+
+# 한 번에 반환할 최대 변경 수 (초과하면 다시 불러오기 요청)
+MAX_CHANGES = 5000
+
+CURSOR_PREFIX = "s"
+
+
+class ResyncRequired(Exception):
+    """변경 피드로 따라잡을 수 없어 전체 다시 불러오기가 필요함"""
+
+
+def encode_cursor(change_seq):
+    """변경 번호 → 커서 문자열"""
+    return f"{CURSOR_PREFIX}{change_seq}"
+
+
+def decode_cursor(cursor):
+    """커서 문자열 → 변경 번호 (형식이 잘못되면 ValueError)"""
+    if not cursor.startswith(CURSOR_PREFIX) or not cursor[1:].isdigit():
+        raise ValueError(f"잘못된 커서입니다: {cursor}")
+    return int(cursor[1:])
+
+
+def _get_sequence(user_id):
+    """(마지막으로 커밋된 변경 번호, 정리된 삭제 기록의 최대 변경 번호)"""
+    row = (
+        TimeBlockChangeSequence.objects.filter(user_id=user_id)
+        .values_list("value", "purged_through")
+        .first()
+    )
+    return row or (0, 0)
+
+
+def _iter_tombstones(user_id, since, until):
+    return (
+        TimeBlockTombstone.objects.filter(
+            user_id=user_id, change_seq__gt=since, change_seq__lte=until
+        )
+        .order_by("change_seq", "id")
+        .values_list("change_seq", "date", "slot_index")
+        .iterator(chunk_size=5000)
+    )
+
+
+def get_changes(user, since=None):
+    """
+    커서 이후의 변경 목록
+
+    Args:
+        user: 사용자
+        since (int): 이전 응답의 커서 변경 번호 (None이면 현재 커서만 반환)
+
+    Returns:
+        dict: {"cursor", "changes"}
+
+    Raises:
+        ResyncRequired: 커서 이후의 삭제 기록이 정리되었거나, 서버에 없는 커서이거나,
+            변경이 MAX_CHANGES를 넘는 경우
+    """
+    until, purged_through = _get_sequence(user.id)
+    if since is None:
+        return {"cursor": encode_cursor(until), "changes": []}
+    if since > until or since < purged_through:
+        raise ResyncRequired
+    if since == until:
+        return {"cursor": encode_cursor(until), "changes": []}
+
+    updates = get_timeblock_storage().iter_changes(user.id, since, until)
+    deletes = _iter_tombstones(user.id, since, until)
+    changes = []
+    for row in heapq.merge(updates, deletes, key=lambda row: row[0]):
+        if len(changes) >= MAX_CHANGES:
+            raise ResyncRequired
+        if len(row) == 3:
+            _, date_item, slot_index = row
+            change = {
+                "date": date_item.isoformat(),
+                "slot": slot_index,
+                "deleted": True,
+            }
+        else:
+            _, date_item, slot_index, tag_id, memo = row
+            change = {
+                "date": date_item.isoformat(),
+                "slot": slot_index,
+                "tag_id": tag_id,
+                "memo": memo,
+            }
+        changes.append(change)
+    return {"cursor": encode_cursor(until), "changes": changes}
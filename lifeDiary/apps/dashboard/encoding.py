@@ -0,0 +1,107 @@
+"""
+=================================================================================
+시간 블록 기간 조회 응답 형식 (GET /api/time-blocks/?from=&to=)
+- 태그 사전(tags)과 날짜별 144칸 슬롯 배열(days)로 구성
+  - tags[0]: 태그가 삭제된 기록을 위한 미분류 항목 (id: null)
+  - slots: 슬롯마다 tags 목록의 인덱스, 기록이 없으면 null
+  - memos: 메모가 있는 슬롯만 {"슬롯 인덱스": 메모}
+- 기록이 없는 날짜는 days에 포함하지 않음
+
+응답 예시 (data):
+    {"from": "2025-01-01", "to": "2025-01-31",
+     "tags": [{"id": null, "name": "미분류", "color": "#808080", "is_default": false},
+              {"id": 3, "name": "수면", "color": "#5B6C8F", "is_default": true}],
+     "days": [{"date": "2025-01-01", "slots": [1, 1, ..., null], "memos": {"40": "산책"}}]}
+=================================================================================
+"""
+
+import json
+
+from apps.tags.cache import get_available_tags
+from apps.core.utils import (
+    TOTAL_SLOTS_PER_DAY,
+    UNCLASSIFIED_TAG_NAME,
+    UNCLASSIFIED_TAG_COLOR,
+)
+from .storage import get_timeblock_storage
+
+UNCLASSIFIED_TAG_INDEX = 0
+
+
+def build_tag_dictionary(user):
+    """
+    사용자 태그 + 기본 태그의 태그 사전
+
+    Returns:
+        tuple: (tags 목록, 태그 ID → tags 인덱스)
+    """
+    tags = [
+        {
+            "id": None,
+            "name": UNCLASSIFIED_TAG_NAME,
+            "color": UNCLASSIFIED_TAG_COLOR,
+            "is_default": False,
+        }
+    ]
+    tag_index = {}
+    for tag in get_available_tags(user).tags:
+        tag_index[tag.id] = len(tags)
+        tags.append(
+            {
+                "id": tag.id,
+                "name": tag.name,
+                "color": tag.color,
+                "is_default": tag.is_default,
+            }
+        )
+    return tags, tag_index
+
+
+def encode_day(date_item, day_blocks, tag_index):
+    """하루치 (slot_index, tag_id, memo) 목록 → {"date", "slots", "memos"}"""
+    slots = [None] * TOTAL_SLOTS_PER_DAY
+    memos = {}
+    for slot_index, tag_id, memo in day_blocks:
+        slots[slot_index] = tag_index.get(tag_id, UNCLASSIFIED_TAG_INDEX)
+        if memo:
+            memos[str(slot_index)] = memo
+    return {"date": date_item.isoformat(), "slots": slots, "memos": memos}
+
+
+def encode_single_day(user, date_item):
+    """
+    하루치 기록을 태그 사전과 함께 인코딩 (대시보드 날짜 이동용)
+
+    Returns:
+        dict: {"tags", "date", "slots", "memos"} (기록이 없으면 slots가 모두 null)
+    """
+    tags, tag_index = build_tag_dictionary(user)
+    days = dict(get_timeblock_storage().iter_days(user.id, date_item, date_item))
+    return {"tags": tags, **encode_day(date_item, days.get(date_item, []), tag_index)}
+
+
+def iter_encoded_days(user, start_date, end_date, tag_index):
+    """기간 내 기록이 있는 날짜를 날짜 순으로 인코딩하여 반환"""
+    for date_item, day_blocks in get_timeblock_storage().iter_days(
+        user.id, start_date, end_date
+    ):
+        yield encode_day(date_item, day_blocks, tag_index)
+
+
+def iter_range_json(message, header, days):
+    """
+    success_response와 같은 형식의 JSON을 날짜 단위 조각으로 생성 (스트리밍 응답용)
+
+    Args:
+        message (str): 응답 메시지
+        header (dict): days를 제외한 data 항목
+        days (iterable): 인코딩된 날짜 dict
+    """
+    prefix = json.dumps({"success": True, "message": message}, ensure_ascii=False)
+    data = json.dumps(header, ensure_ascii=False)
+    yield f'{prefix[:-1]}, "data": {data[:-1]}, "days": ['
+    separator = ""
+    for day in days:
+        yield separator + json.dumps(day, ensure_ascii=False, separators=(",", ":"))
+        separator = ","
+    yield "]}}"
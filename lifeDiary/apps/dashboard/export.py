@@ -0,0 +1,156 @@
+"""
+=================================================================================
+시간 기록 내보내기 (CSV / JSON Lines)
+- /api/export/ (본인 기록 다운로드)와 manage.py export_timeblocks (전체 사용자)에서 사용
+- 저장소에서 날짜 단위로 읽어 바로 출력하므로 기록 기간과 관계없이 메모리 사용량이 일정
+- merge 옵션: 연속된 슬롯 중 태그와 메모가 같은 구간을 한 행으로 합침
+
+출력 항목:
+    user, date, start, end, slot_start, slot_end, slots, tag, color, memo
+    (start/end는 "HH:MM", end는 구간이 끝나는 시각, slot_end는 마지막 슬롯 인덱스)
+=================================================================================
+"""
+
+import csv
+import json
+
+from django.db.models import Q
+
+from apps.tags.models import Tag
+from apps.core.utils import (
+    UNCLASSIFIED_TAG_NAME,
+    UNCLASSIFIED_TAG_COLOR,
+    get_time_from_slot,
+)
+from .storage import get_timeblock_storage
+
+EXPORT_FIELDS = [
+    "user",
+    "date",
+    "start",
+    "end",
+    "slot_start",
+    "slot_end",
+    "slots",
+    "tag",
+    "color",
+    "memo",
+]
+
+# 스트리밍 응답 한 조각의 최소 크기 (문자 수, 작은 조각을 여러 번 쓰지 않도록 묶음)
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+
+def _format_slot_time(slot_index):
+    hour, minute = get_time_from_slot(slot_index)
+    return f"{hour:02d}:{minute:02d}"
+
+
+def iter_day_intervals(day_blocks, merge=False):
+    """
+    하루치 (slot_index, tag_id, memo) 목록 → (시작 슬롯, 끝 슬롯, tag_id, memo) 구간
+
+    Args:
+        day_blocks: slot_index 순으로 정렬된 하루치 기록
+        merge (bool): 연속된 슬롯 중 태그/메모가 같은 구간을 합칠지 여부
+    """
+    current = None
+    for slot_index, tag_id, memo in day_blocks:
+        if (
+            merge
+            and current
+            and current[1] + 1 == slot_index
+            and current[2] == tag_id
+            and current[3] == memo
+        ):
+            current[1] = slot_index
+            continue
+        if current:
+            yield tuple(current)
+        current = [slot_index, slot_index, tag_id, memo]
+    if current:
+        yield tuple(current)
+
+
+def _get_tag_labels(user_id):
+    """태그 ID → (이름, 색상) (사용자 태그 + 기본 태그)"""
+    return {
+        tag_id: (name, color)
+        for tag_id, name, color in Tag.objects.filter(
+            Q(user_id=user_id) | Q(is_default=True)
+        ).values_list("id", "name", "color")
+    }
+
+
+def iter_export_records(users, start_date=None, end_date=None, merge=False):
+    """
+    사용자들의 기록을 내보내기 항목 목록(EXPORT_FIELDS 순서)으로 반환
+
+    Args:
+        users: (user_id, username) 튜플 iterable
+        start_date, end_date (date): 내보낼 기간 (없으면 제한 없음)
+        merge (bool): 같은 태그/메모의 연속 슬롯을 한 구간으로 합칠지 여부
+    """
+    storage = get_timeblock_storage()
+    unclassified = (UNCLASSIFIED_TAG_NAME, UNCLASSIFIED_TAG_COLOR)
+    for user_id, username in users:
+        tag_labels = _get_tag_labels(user_id)
+        for date_item, day_blocks in storage.iter_days(user_id, start_date, end_date):
+            date_str = date_item.isoformat()
+            for slot_start, slot_end, tag_id, memo in iter_day_intervals(
+                day_blocks, merge
+            ):
+                tag_name, tag_color = tag_labels.get(tag_id, unclassified)
+                yield [
+                    username,
+                    date_str,
+                    _format_slot_time(slot_start),
+                    _format_slot_time(slot_end + 1),
+                    slot_start,
+                    slot_end,
+                    slot_end - slot_start + 1,
+                    tag_name,
+                    tag_color,
+                    memo,
+                ]
+
+
+class _LineBuffer:
+    """csv.writer가 쓴 한 줄을 그대로 반환하는 파일 객체"""
+
+    def write(self, value):
+        return value
+
+
+def iter_csv(records):
+    writer = csv.writer(_LineBuffer())
+    yield writer.writerow(EXPORT_FIELDS)
+    for record in records:
+        yield writer.writerow(record)
+
+
+def iter_jsonl(records):
+    for record in records:
+        yield json.dumps(dict(zip(EXPORT_FIELDS, record)), ensure_ascii=False) + "\n"
+
+
+# 형식 → (줄 생성 함수, Content-Type, 파일 확장자)
+EXPORT_FORMATS = {
+    "csv": (iter_csv, "text/csv; charset=utf-8", "csv"),
+    "jsonl": (iter_jsonl, "application/x-ndjson; charset=utf-8", "jsonl"),
+}
+
+
+def iter_chunks(lines, chunk_size=EXPORT_CHUNK_SIZE):
+    """줄들을 chunk_size 문자 이상의 조각으로 묶음"""
+    buffer = []
+    size = 0
+    for line in lines:
+        buffer.append(line)
+        size += len(line)
+        if size >= chunk_size:
+            yield "".join(buffer)
+            buffer = []
+            size = 0
+    if buffer:
+        yield "".join(buffer)
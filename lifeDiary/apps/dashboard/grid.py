@@ -0,0 +1,73 @@
+"""
+=================================================================================
+대시보드 시간 그리드
+- 144개 슬롯의 고정 정보(인덱스, 시각 문자열)와 시간 헤더는 모듈 로드 시 한 번만 계산
+- 요청마다 기록된 슬롯만 담은 희소 overlay를 고정 정보와 합쳐 그리드를 구성
+- 그리드 마크업은 기록 내용의 digest를 키로 템플릿 조각 캐시에 저장
+  (같은 기록이면 사용자/날짜와 관계없이 같은 마크업, 빈 날은 모두 같은 조각 사용)
+=================================================================================
+"""
+
+import hashlib
+from collections import namedtuple
+
+from apps.core.utils import TOTAL_SLOTS_PER_DAY, get_time_from_slot
+
+# 슬롯 한 칸의 고정 정보
+# - key: 템플릿 출력용 문자열 인덱스 (정수를 출력할 때마다 드는 지역화 비용 회피)
+# - hour_label: 정시 슬롯의 시각 표시 ("09:00", 정시가 아니면 "")
+SlotCell = namedtuple(
+    "SlotCell", ["index", "key", "hour", "minute", "time_str", "hour_label"]
+)
+
+
+def _build_slot_skeleton():
+    cells = []
+    for slot_index in range(TOTAL_SLOTS_PER_DAY):
+        hour, minute = get_time_from_slot(slot_index)
+        time_str = f"{hour:02d}:{minute:02d}"
+        cells.append(
+            SlotCell(
+                slot_index,
+                str(slot_index),
+                hour,
+                minute,
+                time_str,
+                time_str if minute == 0 else "",
+            )
+        )
+    return tuple(cells)
+
+
+# 144개 슬롯 (00:00 ~ 23:50, 10분 단위)
+SLOT_SKELETON = _build_slot_skeleton()
+
+# 시간 헤더 (1분, 11분, 21분, 31분, 41분, 51분)
+TIME_HEADERS = tuple(f"{(i * 10 - 1) % 60 + 1}분" for i in range(1, 13))
+
+# 그리드 템플릿 조각 캐시 유지 시간 (초)
+GRID_FRAGMENT_TIMEOUT = 60 * 60 * 24
+
+
+def build_day_grid(entries):
+    """
+    하루치 SlotEntry 목록을 그리드 고정 정보와 합침
+
+    Returns:
+        tuple: ((SlotCell, {"tag", "memo"} 또는 None) 144개, 그리드 조각 캐시 키)
+    """
+    overlay = [None] * TOTAL_SLOTS_PER_DAY
+    digest = hashlib.md5()
+    for entry in entries:
+        overlay[entry.slot_index] = {"tag": entry.tag, "memo": entry.memo}
+        tag = entry.tag
+        digest.update(
+            repr(
+                (
+                    entry.slot_index,
+                    tag and (tag.id, tag.name, tag.color),
+                    entry.memo,
+                )
+            ).encode()
+        )
+    return tuple(zip(SLOT_SKELETON, overlay)), digest.hexdigest()
@@ -0,0 +1,462 @@
+"""
+=================================================================================
+시간 기록 가져오기 (CSV / ICS)
+- manage.py import_timeblocks와 /api/import/ 업로드에서 사용
+- 파일을 한 줄씩 읽어 구간(시작~끝 시각)을 10분 슬롯으로 변환하고,
+  chunk_size 슬롯마다 한 번의 upsert로 저장 (파일 크기와 관계없이 메모리 사용량이 일정)
+- 태그는 이름으로 찾고 없으면 생성 (이름 → ID 사전을 메모리에 유지, "미분류"는 태그 없음)
+- 같은 슬롯이 여러 번 나오면 나중 값으로 덮어씀
+- 24시간보다 긴 구간과 MAX_MEMO_LENGTH자를 넘는 메모는 해당 줄만 건너뜀
+- max_slots를 지정하면 그 수만큼 가져온 뒤 나머지는 읽지 않음 (업로드 API의 요청당 상한)
+
+CSV 형식 (첫 줄은 헤더, 내보내기(export) 결과를 그대로 가져올 수 있음):
+    date,start,end,tag[,memo][,color]
+    2025-01-06,23:00,07:00,수면      ← 끝 시각이 시작보다 이르면 다음 날까지
+    2025-01-07,09:00,18:00,업무,회의,#E74C3C
+
+ICS 형식: VEVENT의 DTSTART/DTEND(또는 DURATION), SUMMARY(태그), DESCRIPTION(메모)
+    (종일 일정은 제외, UTC/TZID 시각은 settings.TIME_ZONE으로 변환)
+=================================================================================
+"""
+
+import csv
+import re
+import time
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from apps.tags.models import Tag
+from apps.stats.rollups import refresh_daily_rollups
+from apps.core.cache import bump_data_version
+from apps.core.utils import (
+    MAX_MEMO_LENGTH,
+    TOTAL_SLOTS_PER_DAY,
+    MINUTES_PER_SLOT,
+    UNCLASSIFIED_TAG_NAME,
+    get_slot_from_time,
+)
+from .storage import get_timeblock_storage
+
+IMPORT_FORMATS = ("csv", "ics")
+
+# 한 번에 저장할 슬롯 수
+DEFAULT_IMPORT_CHUNK_SIZE = 5000
+
+# 구간(줄/일정) 하나의 최대 길이
+MAX_INTERVAL = timedelta(hours=24)
+
+# 업로드 API에서 요청 하나로 가져올 수 있는 최대 슬롯 수 (settings.IMPORT_MAX_SLOTS, 약 1년)
+DEFAULT_IMPORT_MAX_SLOTS = TOTAL_SLOTS_PER_DAY * 366
+
+# 보고서에 담을 최대 오류 수 (건너뛴 줄 수는 모두 집계)
+MAX_REPORTED_ERRORS = 20
+
+# 새로 만드는 태그의 색상 (CSV에 color가 없을 때 순서대로 사용)
+NEW_TAG_COLORS = [
+    "#E74C3C",
+    "#3498DB",
+    "#27AE60",
+    "#F39C12",
+    "#8E44AD",
+    "#16A085",
+    "#D35400",
+    "#2C3E50",
+]
+
+_COLOR_PATTERN = re.compile(r"^#[0-9A-Fa-f]{6}$")
+_DURATION_PATTERN = re.compile(
+    r"^P(?:(?P<weeks>\d+)W)?(?:(?P<days>\d+)D)?"
+    r"(?:T(?:(?P<hours>\d+)H)?(?:(?P<minutes>\d+)M)?(?:(?P<seconds>\d+)S)?)?$"
+)
+_MAX_TAG_NAME_LENGTH = Tag._meta.get_field("name").max_length
+
+
+class ImportRowError(ValueError):
+    """가져올 수 없는 줄/일정 (해당 항목만 건너뜀)"""
+
+
+def detect_import_format(filename):
+    """파일 확장자로 형식 추정 (.ics → ics, 그 외 csv)"""
+    return "ics" if filename.lower().endswith(".ics") else "csv"
+
+
+def _parse_time(value):
+    """시각 문자열("HH:MM" 또는 "HH:MM:SS") → (시, 분), "24:00" 허용"""
+    try:
+        parts = [int(part) for part in value.strip().split(":")]
+    except ValueError:
+        parts = []
+    if len(parts) not in (2, 3):
+        raise ImportRowError(f"시각은 HH:MM 형식이어야 합니다: {value}")
+    hour, minute = parts[:2]
+    if not (0 <= hour <= 23 and 0 <= minute <= 59) and (hour, minute) != (24, 0):
+        raise ImportRowError(f"올바르지 않은 시각입니다: {value}")
+    return hour, minute
+
+
+def iter_csv_intervals(lines):
+    """
+    CSV 줄 → (줄 번호, 시작 datetime, 끝 datetime, 태그명, 메모, 색상) 또는 ImportRowError
+    """
+    reader = csv.DictReader(lines)
+    missing = {"date", "start", "end", "tag"} - set(reader.fieldnames or [])
+    if missing:
+        raise ImportRowError(
+            f"CSV 헤더에 필요한 열이 없습니다: {', '.join(sorted(missing))}"
+        )
+
+    for row in reader:
+        line_no = reader.line_num
+        try:
+            try:
+                date_item = datetime.strptime(row["date"].strip(), "%Y-%m-%d")
+            except (ValueError, AttributeError):
+                raise ImportRowError(
+                    f"날짜는 YYYY-MM-DD 형식이어야 합니다: {row['date']}"
+                )
+            start_hour, start_minute = _parse_time(row["start"] or "")
+            end_hour, end_minute = _parse_time(row["end"] or "")
+            try:
+                start = date_item + timedelta(hours=start_hour, minutes=start_minute)
+                end = date_item + timedelta(hours=end_hour, minutes=end_minute)
+                if end <= start:
+                    # 자정을 넘기는 구간 (예: 23:00~07:00)
+                    end += timedelta(days=1)
+            except OverflowError:
+                raise ImportRowError(f"가져올 수 없는 날짜입니다: {row['date']}")
+            yield (
+                line_no,
+                start,
+                end,
+                (row["tag"] or "").strip(),
+                (row.get("memo") or "").strip(),
+                (row.get("color") or "").strip(),
+            )
+        except ImportRowError as e:
+            yield line_no, e
+
+
+def _unfold_ics_lines(lines):
+    """ICS 접힌 줄(공백/탭으로 시작하는 다음 줄)을 이어 붙임"""
+    current = None
+    current_no = 0
+    for line_no, line in enumerate(lines, start=1):
+        line = line.rstrip("\r\n")
+        if line[:1] in (" ", "\t") and current is not None:
+            current += line[1:]
+            continue
+        if current is not None:
+            yield current_no, current
+        current, current_no = line, line_no
+    if current is not None:
+        yield current_no, current
+
+
+def _unescape_ics_text(value):
+    return (
+        value.replace("\\n", "\n")
+        .replace("\\N", "\n")
+        .replace("\\,", ",")
+        .replace("\\;", ";")
+        .replace("\\\\", "\\")
+    )
+
+
+def _parse_ics_datetime(value, params):
+    """ICS 날짜/시각 → 현재 시간대 기준 naive datetime (종일 일정이면 None)"""
+    if params.get("VALUE") == "DATE" or len(value) == 8:
+        return None
+    try:
+        if value.endswith("Z"):
+            moment = datetime.strptime(value, "%Y%m%dT%H%M%SZ").replace(
+                tzinfo=ZoneInfo("UTC")
+            )
+        else:
+            moment = datetime.strptime(value, "%Y%m%dT%H%M%S")
+            if "TZID" in params:
+                moment = moment.replace(tzinfo=ZoneInfo(params["TZID"]))
+    except (ValueError, ZoneInfoNotFoundError):
+        raise ImportRowError(f"올바르지 않은 일정 시각입니다: {value}")
+    if timezone.is_aware(moment):
+        moment = timezone.make_naive(moment, timezone.get_current_timezone())
+    return moment
+
+
+def _parse_ics_duration(value):
+    match = _DURATION_PATTERN.match(value)
+    if not match or not any(match.groupdict().values()):
+        raise ImportRowError(f"올바르지 않은 일정 길이입니다: {value}")
+    try:
+        parts = {key: int(number or 0) for key, number in match.groupdict().items()}
+        return timedelta(**parts)
+    except (OverflowError, ValueError):
+        # 표현할 수 없을 만큼 긴 길이 (timedelta 범위 초과, 너무 긴 숫자 문자열)
+        raise ImportRowError(f"일정 길이가 너무 깁니다: {value}")
+
+
+def iter_ics_intervals(lines):
+    """
+    ICS 줄 → (줄 번호, 시작 datetime, 끝 datetime, 태그명, 메모, 색상) 또는 ImportRowError
+    """
+    event = None
+    nested = 0  # VEVENT 안의 하위 구성요소(VALARM 등) 깊이
+    for line_no, line in _unfold_ics_lines(lines):
+        if line == "BEGIN:VEVENT":
+            event = {"line_no": line_no}
+            nested = 0
+            continue
+        if event is None:
+            continue
+        if line.startswith("BEGIN:"):
+            nested += 1
+            continue
+        if nested:
+            if line.startswith("END:"):
+                nested -= 1
+            continue
+        if line == "END:VEVENT":
+            try:
+                interval = _build_ics_interval(event)
+                if interval:
+                    yield interval
+            except ImportRowError as e:
+                yield event["line_no"], e
+            event = None
+            continue
+
+        name_part, _, value = line.partition(":")
+        name, *param_parts = name_part.split(";")
+        # 매개변수 값은 따옴표로 감쌀 수 있음 (예: TZID="America/New_York")
+        params = {
+            key: param_value.strip('"')
+            for key, param_value in (
+                part.split("=", 1) for part in param_parts if "=" in part
+            )
+        }
+        event[name.upper()] = (value, params)
+
+
+def _build_ics_interval(event):
+    if "DTSTART" not in event:
+        raise ImportRowError("DTSTART가 없는 일정입니다.")
+    start = _parse_ics_datetime(*event["DTSTART"])
+    if start is None:
+        return None  # 종일 일정
+    if "DTEND" in event:
+        end = _parse_ics_datetime(*event["DTEND"])
+        if end is None:
+            return None
+    elif "DURATION" in event:
+        duration = _parse_ics_duration(event["DURATION"][0])
+        try:
+            end = start + duration
+        except OverflowError:
+            raise ImportRowError(f"일정 길이가 너무 깁니다: {event['DURATION'][0]}")
+    else:
+        raise ImportRowError("DTEND 또는 DURATION이 없는 일정입니다.")
+    if end <= start:
+        raise ImportRowError("일정의 끝 시각이 시작 시각보다 빠릅니다.")
+    return (
+        event["line_no"],
+        start,
+        end,
+        _unescape_ics_text(event.get("SUMMARY", ("", {}))[0]).strip(),
+        _unescape_ics_text(event.get("DESCRIPTION", ("", {}))[0]).strip(),
+        "",
+    )
+
+
+def validate_interval(start, end, memo):
+    """저장할 수 없는 구간이면 ImportRowError (너무 긴 구간, 너무 긴 메모)"""
+    if end - start > MAX_INTERVAL:
+        raise ImportRowError(
+            f"구간은 최대 {MAX_INTERVAL.total_seconds() // 3600:.0f}시간까지 가능합니다: "
+            f"{start:%Y-%m-%d %H:%M} ~ {end:%Y-%m-%d %H:%M}"
+        )
+    if len(memo) > MAX_MEMO_LENGTH:
+        raise ImportRowError(f"메모는 최대 {MAX_MEMO_LENGTH}자까지 가능합니다.")
+
+
+def iter_interval_slots(start, end):
+    """
+    구간 [start, end) → 날짜별 (date, 시작 슬롯, 끝 슬롯(미포함))
+    - 시작 시각은 슬롯 단위로 내림, 끝 시각은 올림 (일부라도 걸친 슬롯은 포함)
+    """
+    current = start
+    while current < end:
+        try:
+            next_midnight = datetime.combine(
+                current.date() + timedelta(days=1), datetime.min.time()
+            )
+        except OverflowError:
+            next_midnight = None  # 표현할 수 있는 마지막 날짜 (9999-12-31)
+        segment_end = end if next_midnight is None else min(end, next_midnight)
+        start_slot = get_slot_from_time(current.hour, current.minute)
+        if segment_end == next_midnight:
+            end_slot = TOTAL_SLOTS_PER_DAY
+        else:
+            end_slot = get_slot_from_time(segment_end.hour, segment_end.minute)
+            if segment_end.minute % MINUTES_PER_SLOT or segment_end.second:
+                end_slot += 1
+        if end_slot > start_slot:
+            yield current.date(), start_slot, end_slot
+        current = segment_end
+
+
+class TagResolver:
+    """
+    태그명 → 태그 ID (사용자 태그 우선, 다음 기본 태그, 없으면 생성)
+    - 시작할 때 한 번만 조회하고 이후에는 메모리 사전 사용
+    """
+
+    def __init__(self, user):
+        self.user = user
+        self.created = 0
+        self.tag_ids = {UNCLASSIFIED_TAG_NAME: None}
+        tags = Tag.objects.filter(Q(user=user) | Q(is_default=True)).order_by(
+            "-is_default"
+        )
+        # 기본 태그 → 사용자 태그 순으로 덮어써서 같은 이름이면 사용자 태그 사용
+        for tag_id, name in tags.values_list("id", "name"):
+            self.tag_ids[name] = tag_id
+
+    def resolve(self, name, color=""):
+        if not name:
+            raise ImportRowError("태그명이 비어 있습니다.")
+        if name in self.tag_ids:
+            return self.tag_ids[name]
+        if len(name) > _MAX_TAG_NAME_LENGTH:
+            raise ImportRowError(
+                f"태그명은 최대 {_MAX_TAG_NAME_LENGTH}자까지 가능합니다: {name}"
+            )
+        if not _COLOR_PATTERN.match(color):
+            color = NEW_TAG_COLORS[self.created % len(NEW_TAG_COLORS)]
+        tag = Tag.objects.create(user=self.user, name=name, color=color)
+        self.created += 1
+        self.tag_ids[name] = tag.id
+        return tag.id
+
+
+class TimeBlockImporter:
+    """
+    구간 목록을 슬롯으로 변환하여 chunk_size 단위로 저장
+
+    Args:
+        user: 대상 사용자
+        chunk_size (int): 한 번에 저장할 슬롯 수 (청크마다 한 트랜잭션)
+        max_slots (int): 가져올 최대 슬롯 수 (넘으면 그 구간부터 가져오지 않음, None이면 제한 없음)
+    """
+
+    def __init__(self, user, chunk_size=DEFAULT_IMPORT_CHUNK_SIZE, max_slots=None):
+        self.user = user
+        self.chunk_size = chunk_size
+        self.max_slots = max_slots
+        self.storage = get_timeblock_storage()
+        self.tags = TagResolver(user)
+        self.pending = {}
+        self.expanded = 0  # 구간을 펼친 슬롯 수 (같은 슬롯을 덮어쓴 경우도 포함)
+        self.stats = {
+            "intervals": 0,
+            "slots": 0,
+            "chunks": 0,
+            "skipped": 0,
+            "truncated": False,
+        }
+        self.errors = []
+
+    def _skip(self, line_no, error):
+        self.stats["skipped"] += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({"line": line_no, "message": str(error)})
+
+    def flush(self):
+        """쌓인 슬롯을 저장하고 해당 날짜들의 일별 태그 집계 갱신"""
+        if not self.pending:
+            return
+        blocks = [
+            (date_item, slot_index, tag_id, memo)
+            for (date_item, slot_index), (tag_id, memo) in self.pending.items()
+        ]
+        with transaction.atomic():
+            self.storage.save_blocks(self.user.id, blocks)
+            refresh_daily_rollups(
+                self.user.id, {date_item for date_item, _ in self.pending}
+            )
+        self.stats["slots"] += len(blocks)
+        self.stats["chunks"] += 1
+        self.pending = {}
+
+    def run(self, intervals):
+        """
+        구간들을 가져오고 결과 보고서 반환
+
+        Args:
+            intervals: iter_csv_intervals / iter_ics_intervals의 결과
+
+        Returns:
+            dict: intervals, slots, chunks, skipped, truncated(max_slots에서 중단),
+                  tags_created, seconds, slots_per_second, errors
+        """
+        started = time.perf_counter()
+        try:
+            for item in intervals:
+                if isinstance(item[1], ImportRowError):
+                    self._skip(*item)
+                    continue
+                line_no, start, end, tag_name, memo, color = item
+                try:
+                    validate_interval(start, end, memo)
+                    tag_id = self.tags.resolve(tag_name, color)
+                except ImportRowError as e:
+                    self._skip(line_no, e)
+                    continue
+
+                segments = list(iter_interval_slots(start, end))
+                slot_count = sum(
+                    end_slot - start_slot for _, start_slot, end_slot in segments
+                )
+                if (
+                    self.max_slots is not None
+                    and self.expanded + slot_count > self.max_slots
+                ):
+                    self.stats["truncated"] = True
+                    break
+                self.expanded += slot_count
+
+                self.stats["intervals"] += 1
+                for date_item, start_slot, end_slot in segments:
+                    for slot_index in range(start_slot, end_slot):
+                        self.pending[(date_item, slot_index)] = (tag_id, memo)
+                    if len(self.pending) >= self.chunk_size:
+                        self.flush()
+            self.flush()
+        finally:
+            # 도중에 실패해도 이미 커밋된 청크/태그가 있으면 캐시를 무효화
+            if self.stats["chunks"] or self.tags.created:
+                bump_data_version(self.user.id)
+
+        seconds = time.perf_counter() - started
+        return {
+            **self.stats,
+            "tags_created": self.tags.created,
+            "seconds": round(seconds, 2),
+            "slots_per_second": round(self.stats["slots"] / seconds) if seconds else 0,
+            "errors": self.errors,
+        }
+
+
+def import_time_blocks(
+    user, lines, import_format, chunk_size=DEFAULT_IMPORT_CHUNK_SIZE, max_slots=None
+):
+    """
+    텍스트 줄 iterable(파일 객체 등)에서 시간 기록 가져오기 (max_slots: TimeBlockImporter 참고)
+
+    Raises:
+        ImportRowError: CSV 헤더가 잘못된 경우 등 파일 전체를 가져올 수 없는 경우
+    """
+    parse = iter_ics_intervals if import_format == "ics" else iter_csv_intervals
+    return TimeBlockImporter(user, chunk_size, max_slots).run(parse(lines))
@@ -0,0 +1,58 @@
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from apps.core.cache import bump_data_version
+from apps.dashboard.storage import (
+    TIMEBLOCK_STORAGES,
+    copy_day_logs_to_rows,
+    copy_rows_to_day_logs,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "시간 기록을 다른 저장 방식(rows: TimeBlock, daylog: DayLog)으로 복사합니다. "
+        "settings.TIMEBLOCK_STORAGE를 바꾸기 전에 실행하세요."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--to",
+            required=True,
+            choices=sorted(TIMEBLOCK_STORAGES),
+            help="복사할 대상 저장 방식 (대상의 기존 데이터는 교체됨)",
+        )
+        parser.add_argument(
+            "--user",
+            action="append",
+            dest="usernames",
+            help="대상 사용자명 (반복 가능)",
+        )
+
+    def handle(self, *args, **options):
+        users = User.objects.order_by("id")
+        if options["usernames"]:
+            users = users.filter(username__in=options["usernames"])
+            missing = set(options["usernames"]) - set(
+                users.values_list("username", flat=True)
+            )
+            if missing:
+                raise CommandError(
+                    f"존재하지 않는 사용자: {', '.join(sorted(missing))}"
+                )
+
+        if options["to"] == "daylog":
+            copy_user, unit = copy_rows_to_day_logs, "일"
+        else:
+            copy_user, unit = copy_day_logs_to_rows, "슬롯"
+
+        for user in users.iterator():
+            with transaction.atomic():
+                created = copy_user(user.id)
+                # 캐시된 통계/검증값이 복사한 데이터로 다시 계산되도록 (커밋 후 갱신)
+                bump_data_version(user.id)
+            self.stdout.write(f"{user.username}: {created}{unit} 복사")
+        self.stdout.write(
+            self.style.SUCCESS(f"{options['to']} 저장소로 복사를 완료했습니다.")
+        )
@@ -0,0 +1,69 @@
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.core.utils import parse_date_or_none
+from apps.dashboard.export import EXPORT_FORMATS, iter_chunks, iter_export_records
+
+
+class Command(BaseCommand):
+    help = (
+        "사용자들의 시간 기록을 CSV 또는 JSON Lines로 내보냅니다. "
+        "날짜 단위로 읽어 바로 쓰므로 전체 기록도 일정한 메모리로 처리합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--format", choices=sorted(EXPORT_FORMATS), default="csv", help="출력 형식"
+        )
+        parser.add_argument(
+            "--user",
+            action="append",
+            dest="usernames",
+            help="대상 사용자명 (반복 가능, 생략하면 전체 사용자)",
+        )
+        parser.add_argument("--from", dest="start_date", help="시작 날짜 (YYYY-MM-DD)")
+        parser.add_argument("--to", dest="end_date", help="종료 날짜 (YYYY-MM-DD)")
+        parser.add_argument(
+            "--merge",
+            action="store_true",
+            help="같은 태그/메모의 연속 슬롯을 한 구간으로 합침",
+        )
+        parser.add_argument("--output", help="저장할 파일 경로 (생략하면 표준 출력)")
+
+    def handle(self, *args, **options):
+        dates = {}
+        for key in ("start_date", "end_date"):
+            value = options[key]
+            dates[key] = parse_date_or_none(value) if value else None
+            if value and dates[key] is None:
+                raise CommandError(f"날짜는 YYYY-MM-DD 형식이어야 합니다: {value}")
+
+        users = User.objects.order_by("id")
+        if options["usernames"]:
+            users = users.filter(username__in=options["usernames"])
+            missing = set(options["usernames"]) - set(
+                users.values_list("username", flat=True)
+            )
+            if missing:
+                raise CommandError(
+                    f"존재하지 않는 사용자: {', '.join(sorted(missing))}"
+                )
+
+        iter_lines = EXPORT_FORMATS[options["format"]][0]
+        records = iter_export_records(
+            list(users.values_list("id", "username")),
+            dates["start_date"],
+            dates["end_date"],
+            merge=options["merge"],
+        )
+
+        chunks = iter_chunks(iter_lines(records))
+        if not options["output"]:
+            for chunk in chunks:
+                self.stdout.write(chunk, ending="")
+            return
+
+        with open(options["output"], "w", encoding="utf-8", newline="") as output:
+            for chunk in chunks:
+                output.write(chunk)
+        self.stdout.write(self.style.SUCCESS(f"내보내기 완료: {options['output']}"))
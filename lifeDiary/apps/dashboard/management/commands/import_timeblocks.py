@@ -0,0 +1,59 @@
+import json
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.dashboard.importer import (
+    IMPORT_FORMATS,
+    DEFAULT_IMPORT_CHUNK_SIZE,
+    ImportRowError,
+    detect_import_format,
+    import_time_blocks,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "CSV 또는 ICS 파일의 시간 구간을 사용자의 시간 기록으로 가져옵니다. "
+        "파일을 한 줄씩 읽어 청크 단위로 저장하므로 큰 파일도 일정한 메모리로 처리합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="가져올 파일 경로")
+        parser.add_argument("--user", required=True, help="대상 사용자명")
+        parser.add_argument(
+            "--format",
+            choices=IMPORT_FORMATS,
+            help="파일 형식 (생략하면 확장자로 판단: .ics → ics, 그 외 csv)",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=DEFAULT_IMPORT_CHUNK_SIZE,
+            help="한 번에 저장할 슬롯 수",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            user = User.objects.get(username=options["user"])
+        except User.DoesNotExist:
+            raise CommandError(f"존재하지 않는 사용자: {options['user']}")
+
+        import_format = options["format"] or detect_import_format(options["path"])
+        try:
+            with open(options["path"], encoding="utf-8-sig", newline="") as lines:
+                report = import_time_blocks(
+                    user, lines, import_format, options["chunk_size"]
+                )
+        except (OSError, ImportRowError) as e:
+            raise CommandError(str(e))
+
+        for error in report["errors"]:
+            self.stderr.write(f"{error['line']}번째 줄: {error['message']}")
+        self.stdout.write(json.dumps(report, ensure_ascii=False, indent=2))
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{report['slots']}개 슬롯을 가져왔습니다. "
+                f"({report['slots_per_second']}슬롯/초, 건너뜀 {report['skipped']}건)"
+            )
+        )
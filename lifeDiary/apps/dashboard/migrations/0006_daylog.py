@@ -0,0 +1,60 @@
+# Generated by Django 5.2.4 on 2026-10-17 22:43
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("dashboard", "0005_remove_timeblock_deleted_tag_name"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DayLog",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("date", models.DateField(verbose_name="날짜")),
+                ("slots", models.BinaryField(verbose_name="슬롯별 태그")),
+                (
+                    "memos",
+                    models.JSONField(
+                        blank=True, default=dict, verbose_name="슬롯별 메모"
+                    ),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(auto_now=True, verbose_name="수정일"),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="사용자",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "일별 시간 기록",
+                "verbose_name_plural": "일별 시간 기록들",
+                "ordering": ["date"],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("user", "date"), name="unique_user_date_daylog"
+                    )
+                ],
+            },
+        ),
+    ]
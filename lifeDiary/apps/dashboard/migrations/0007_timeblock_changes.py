@@ -0,0 +1,124 @@
+# Generated by Django 5.2.4 on 2026-10-17 22:49
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("auth", "0012_alter_user_first_name_max_length"),
+        ("dashboard", "0006_daylog"),
+        ("tags", "0003_remove_tag_unique_user_tag_name_tag_is_default_and_more"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TimeBlockChangeSequence",
+            fields=[
+                (
+                    "user",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        serialize=False,
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="사용자",
+                    ),
+                ),
+                (
+                    "value",
+                    models.BigIntegerField(default=0, verbose_name="마지막 변경 번호"),
+                ),
+                (
+                    "purged_through",
+                    models.BigIntegerField(
+                        default=0, verbose_name="정리된 삭제 기록의 마지막 변경 번호"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "시간 기록 변경 번호",
+                "verbose_name_plural": "시간 기록 변경 번호들",
+            },
+        ),
+        migrations.CreateModel(
+            name="TimeBlockTombstone",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("date", models.DateField(verbose_name="날짜")),
+                ("slot_index", models.IntegerField(verbose_name="슬롯 인덱스")),
+                (
+                    "deleted_at",
+                    models.DateTimeField(auto_now=True, verbose_name="삭제일"),
+                ),
+                (
+                    "change_seq",
+                    models.BigIntegerField(default=0, verbose_name="변경 번호"),
+                ),
+            ],
+            options={
+                "verbose_name": "시간 블록 삭제 기록",
+                "verbose_name_plural": "시간 블록 삭제 기록들",
+            },
+        ),
+        migrations.AddField(
+            model_name="daylog",
+            name="change_seq",
+            field=models.BigIntegerField(default=0, verbose_name="변경 번호"),
+        ),
+        migrations.AddField(
+            model_name="timeblock",
+            name="change_seq",
+            field=models.BigIntegerField(default=0, verbose_name="변경 번호"),
+        ),
+        migrations.AddIndex(
+            model_name="daylog",
+            index=models.Index(
+                fields=["user", "change_seq"], name="idx_daylog_user_change_seq"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="timeblock",
+            index=models.Index(
+                fields=["user", "change_seq"], name="idx_user_change_seq"
+            ),
+        ),
+        migrations.AddField(
+            model_name="timeblocktombstone",
+            name="user",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                to=settings.AUTH_USER_MODEL,
+                verbose_name="사용자",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="timeblocktombstone",
+            index=models.Index(
+                fields=["user", "deleted_at"], name="idx_tombstone_user_deleted"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="timeblocktombstone",
+            index=models.Index(
+                fields=["user", "change_seq"], name="idx_tombstone_user_change_seq"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="timeblocktombstone",
+            constraint=models.UniqueConstraint(
+                fields=("user", "date", "slot_index"), name="unique_user_date_tombstone"
+            ),
+        ),
+    ]
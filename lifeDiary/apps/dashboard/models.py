@@ -33,6 +33,7 @@ class TimeBlock(models.Model):
     )
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성일")
     updated_at = models.DateTimeField(auto_now=True, verbose_name="수정일")
+    change_seq = models.BigIntegerField(default=0, verbose_name="변경 번호")
 
     class Meta:
         verbose_name = "시간 블록"
@@ -49,11 +50,15 @@ class TimeBlock(models.Model):
             models.Index(fields=["user", "date"], name="idx_user_date"),
             models.Index(fields=["user", "tag"], name="idx_user_tag"),
             models.Index(fields=["date", "slot_index"], name="idx_date_slot"),
+            # 변경 피드(since 커서) 조회용
+            models.Index(fields=["user", "change_seq"], name="idx_user_change_seq"),
         ]
 
     def __str__(self):
         tag_name = self.tag.name if self.tag else UNCLASSIFIED_TAG_NAME
-        return f"{self.user.username} - {self.date} [{self.get_time_range()}] {tag_name}"
+        return (
+            f"{self.user.username} - {self.date} [{self.get_time_range()}] {tag_name}"
+        )
 
     def get_time_range(self):
         """슬롯 인덱스를 시간 범위로 변환"""
@@ -85,3 +90,98 @@ class TimeBlock(models.Model):
             and self.tag.user != self.user
         ):
             raise ValidationError({"tag": "다른 사용자의 태그는 사용할 수 없습니다."})
+
+
+class DayLog(models.Model):
+    """
+    하루치 시간 기록 (사용자·날짜당 한 행)
+    - settings.TIMEBLOCK_STORAGE = "daylog"일 때 TimeBlock 대신 사용 (apps.dashboard.storage)
+    - slots: 144개 슬롯의 태그 ID를 little-endian uint32로 묶은 576바이트
+      (0: 기록 없음, 0xFFFFFFFF: 태그가 삭제된 기록)
+    - memos: 메모가 있는 슬롯만 저장 {"슬롯 인덱스": 메모}
+    """
+
+    user = models.ForeignKey(User, on_delete=models.CASCADE, verbose_name="사용자")
+    date = models.DateField(verbose_name="날짜")
+    slots = models.BinaryField(verbose_name="슬롯별 태그")
+    memos = models.JSONField(default=dict, blank=True, verbose_name="슬롯별 메모")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="수정일")
+    change_seq = models.BigIntegerField(default=0, verbose_name="변경 번호")
+
+    class Meta:
+        verbose_name = "일별 시간 기록"
+        verbose_name_plural = "일별 시간 기록들"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "date"], name="unique_user_date_daylog"
+            )
+        ]
+        ordering = ["date"]
+        indexes = [
+            # 변경 피드(since 커서) 조회용
+            models.Index(
+                fields=["user", "change_seq"], name="idx_daylog_user_change_seq"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.user.username} - {self.date}"
+
+
+class TimeBlockTombstone(models.Model):
+    """
+    삭제된 시간 블록 기록 (변경 피드에서 삭제를 전달하기 위한 묘비)
+    - 슬롯당 최대 한 행, 다시 삭제되면 deleted_at/change_seq만 갱신
+    - 보관 기간(settings.TIMEBLOCK_TOMBSTONE_RETENTION_DAYS)이 지나면 정리
+    """
+
+    user = models.ForeignKey(User, on_delete=models.CASCADE, verbose_name="사용자")
+    date = models.DateField(verbose_name="날짜")
+    slot_index = models.IntegerField(verbose_name="슬롯 인덱스")
+    deleted_at = models.DateTimeField(auto_now=True, verbose_name="삭제일")
+    change_seq = models.BigIntegerField(default=0, verbose_name="변경 번호")
+
+    class Meta:
+        verbose_name = "시간 블록 삭제 기록"
+        verbose_name_plural = "시간 블록 삭제 기록들"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "date", "slot_index"], name="unique_user_date_tombstone"
+            )
+        ]
+        indexes = [
+            models.Index(
+                fields=["user", "deleted_at"], name="idx_tombstone_user_deleted"
+            ),
+            models.Index(
+                fields=["user", "change_seq"], name="idx_tombstone_user_change_seq"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.user.username} - {self.date} [{self.slot_index}]"
+
+
+class TimeBlockChangeSequence(models.Model):
+    """
+    사용자별 시간 기록 변경 번호 (변경 피드 커서)
+    - 쓰기 트랜잭션이 value를 1 올리고 그 값을 변경한 행의 change_seq에 기록
+    - 올린 행의 잠금이 커밋까지 유지되므로 같은 사용자의 변경 번호는 커밋 순서대로 증가
+      (커밋된 value 이하의 변경은 모두 커밋되어 있어, 수정 시각과 달리 놓치는 변경이 없음)
+    - purged_through: 보관 기간이 지나 정리한 삭제 기록 중 가장 큰 변경 번호
+    """
+
+    user = models.OneToOneField(
+        User, on_delete=models.CASCADE, primary_key=True, verbose_name="사용자"
+    )
+    value = models.BigIntegerField(default=0, verbose_name="마지막 변경 번호")
+    purged_through = models.BigIntegerField(
+        default=0, verbose_name="정리된 삭제 기록의 마지막 변경 번호"
+    )
+
+    class Meta:
+        verbose_name = "시간 기록 변경 번호"
+        verbose_name_plural = "시간 기록 변경 번호들"
+
+    def __str__(self):
+        return f"{self.user.username} - {self.value}"
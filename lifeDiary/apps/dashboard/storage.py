@@ -0,0 +1,669 @@
+"""
+=================================================================================
+시간 블록 저장소
+- 시간 기록을 읽고 쓰는 API를 저장 방식과 분리
+  (대시보드, 시간 블록 API, 통계 계산/일별 태그 집계가 이 모듈을 통해 접근)
+- settings.TIMEBLOCK_STORAGE로 선택 (기본값: "rows")
+  - rows: 슬롯당 한 행 (TimeBlock)
+  - daylog: 사용자·날짜당 한 행 (DayLog, 144개 태그 ID를 바이트로 묶어 저장)
+- 저장 방식을 바꿀 때는 manage.py convert_timeblock_storage로 기존 데이터를 옮김
+- 쓰기마다 사용자별 변경 번호(next_change_seq)를 받아 변경된 행/삭제 기록에 남김
+  (변경 피드 apps.dashboard.changes의 커서)
+=================================================================================
+"""
+
+import struct
+from collections import namedtuple
+from datetime import timedelta
+from itertools import groupby
+from operator import itemgetter
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection
+from django.db.models import Max, Q, Value
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+from apps.tags.models import Tag
+from apps.core.utils import BULK_WRITE_BATCH_SIZE, TOTAL_SLOTS_PER_DAY
+from .models import TimeBlock, DayLog, TimeBlockChangeSequence, TimeBlockTombstone
+
+DEFAULT_TIMEBLOCK_STORAGE = "rows"
+DEFAULT_TOMBSTONE_RETENTION_DAYS = 30
+
+# DayLog.slots 형식: 슬롯별 little-endian uint32 태그 ID
+SLOTS_FORMAT = f"<{TOTAL_SLOTS_PER_DAY}I"
+EMPTY_SLOT = 0  # 기록 없음
+UNTAGGED_SLOT = 0xFFFFFFFF  # 기록은 있으나 태그가 삭제됨
+EMPTY_DAY = bytes(struct.calcsize(SLOTS_FORMAT))
+
+# RowStorage의 PostgreSQL upsert에서 값을 넣는 TimeBlock 필드 (순서대로)
+UPSERT_FIELDS = (
+    "user",
+    "date",
+    "slot_index",
+    "tag",
+    "memo",
+    "created_at",
+    "updated_at",
+    "change_seq",
+)
+
+# 하루치 기록 한 칸 (tag는 태그가 삭제되었으면 None)
+SlotEntry = namedtuple("SlotEntry", ["slot_index", "tag_id", "tag", "memo"])
+
+
+def unpack_slots(data):
+    """DayLog.slots 바이트 → 144개 슬롯 값 리스트"""
+    return list(struct.unpack(SLOTS_FORMAT, bytes(data)))
+
+
+def pack_slots(values):
+    """144개 슬롯 값 리스트 → DayLog.slots 바이트"""
+    return struct.pack(SLOTS_FORMAT, *values)
+
+
+def encode_tag_id(tag_id):
+    """태그 ID → 슬롯 값 (None이면 태그가 삭제된 기록)"""
+    if tag_id is None:
+        return UNTAGGED_SLOT
+    if not EMPTY_SLOT < tag_id < UNTAGGED_SLOT:
+        raise ValueError(f"DayLog에 저장할 수 없는 태그 ID입니다: {tag_id}")
+    return tag_id
+
+
+def build_day_log_fields(day_blocks):
+    """
+    하루치 (slot_index, tag_id, memo) 목록 → DayLog의 (slots, memos)
+    """
+    values = [EMPTY_SLOT] * TOTAL_SLOTS_PER_DAY
+    memos = {}
+    for slot_index, tag_id, memo in day_blocks:
+        values[slot_index] = encode_tag_id(tag_id)
+        if memo:
+            memos[str(slot_index)] = memo
+    return pack_slots(values), memos
+
+
+def iter_day_log_blocks(slots, memos):
+    """DayLog의 (slots, memos) → 기록된 슬롯의 (slot_index, tag_id, memo)"""
+    for slot_index, value in enumerate(unpack_slots(slots)):
+        if value == EMPTY_SLOT:
+            continue
+        tag_id = None if value == UNTAGGED_SLOT else value
+        yield slot_index, tag_id, memos.get(str(slot_index), "")
+
+
+def next_change_seq(user_id):
+    """
+    사용자의 다음 변경 번호 (트랜잭션 안에서 다른 쓰기보다 먼저 호출)
+    - 사용자별 TimeBlockChangeSequence 행을 한 문장으로 생성/증가시키고 커밋까지 잠금 유지
+      → 같은 사용자의 쓰기는 이 행에서 순서대로 대기하므로 번호가 커밋 순서와 같음
+    """
+    table = connection.ops.quote_name(TimeBlockChangeSequence._meta.db_table)
+    user_column, value_column, purged_column = (
+        connection.ops.quote_name(TimeBlockChangeSequence._meta.get_field(name).column)
+        for name in ("user", "value", "purged_through")
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"INSERT INTO {table} ({user_column}, {value_column}, {purged_column}) "
+            f"VALUES (%s, 1, 0) ON CONFLICT ({user_column}) "
+            f"DO UPDATE SET {value_column} = {table}.{value_column} + 1 "
+            f"RETURNING {value_column}",
+            [user_id],
+        )
+        return cursor.fetchone()[0]
+
+
+def record_tombstones(user, date_item, slot_indexes, change_seq):
+    """
+    삭제된 슬롯의 삭제 기록(TimeBlockTombstone)을 남기고, 보관 기간이 지난 기록은 정리
+    - 이미 삭제 기록이 있는 슬롯은 deleted_at/change_seq만 갱신
+    - 정리한 기록의 가장 큰 변경 번호를 purged_through에 남김 (그보다 오래된 커서는 다시 불러오기)
+    """
+    TimeBlockTombstone.objects.bulk_create(
+        [
+            TimeBlockTombstone(
+                user=user,
+                date=date_item,
+                slot_index=slot_index,
+                change_seq=change_seq,
+            )
+            for slot_index in slot_indexes
+        ],
+        batch_size=BULK_WRITE_BATCH_SIZE,
+        update_conflicts=True,
+        unique_fields=["user", "date", "slot_index"],
+        update_fields=["deleted_at", "change_seq"],
+    )
+    expired = TimeBlockTombstone.objects.filter(
+        user=user, deleted_at__lt=get_tombstone_cutoff()
+    )
+    purged_through = expired.aggregate(Max("change_seq"))["change_seq__max"]
+    if purged_through is not None:
+        expired.delete()
+        TimeBlockChangeSequence.objects.filter(user=user).update(
+            purged_through=Greatest("purged_through", Value(purged_through))
+        )
+
+
+def get_tombstone_cutoff():
+    """이 시각 이전의 삭제 기록은 보관하지 않음"""
+    retention_days = getattr(
+        settings,
+        "TIMEBLOCK_TOMBSTONE_RETENTION_DAYS",
+        DEFAULT_TOMBSTONE_RETENTION_DAYS,
+    )
+    return timezone.now() - timedelta(days=retention_days)
+
+
+def filter_date_range(queryset, start_date=None, end_date=None):
+    """날짜 기간 조건 적용 (없는 쪽은 제한 없음)"""
+    if start_date and end_date:
+        return queryset.filter(date__range=(start_date, end_date))
+    if start_date:
+        queryset = queryset.filter(date__gte=start_date)
+    if end_date:
+        queryset = queryset.filter(date__lte=end_date)
+    return queryset
+
+
+class RowStorage:
+    """슬롯당 한 행 (TimeBlock)"""
+
+    name = "rows"
+
+    def get_day(self, user, date_item):
+        """하루치 기록된 슬롯의 SlotEntry 목록 (slot_index 순)"""
+        time_blocks = TimeBlock.objects.filter(
+            user=user, date=date_item
+        ).select_related("tag")
+        return [
+            SlotEntry(block.slot_index, block.tag_id, block.tag, block.memo)
+            for block in time_blocks
+        ]
+
+    def iter_rows(self, user_id, start_date=None, end_date=None, dates=None):
+        """
+        기록된 슬롯의 (date, slot_index, tag_id)를 날짜/슬롯 순으로 반환
+
+        Args:
+            user_id (int): 사용자 ID
+            start_date, end_date (date): 조회 기간 (없으면 제한 없음)
+            dates (iterable): 특정 날짜들만 조회
+        """
+        time_blocks = TimeBlock.objects.filter(user_id=user_id)
+        if start_date:
+            time_blocks = time_blocks.filter(date__gte=start_date)
+        if end_date:
+            time_blocks = time_blocks.filter(date__lte=end_date)
+        if dates is not None:
+            time_blocks = time_blocks.filter(date__in=dates)
+        return (
+            time_blocks.order_by("date", "slot_index")
+            .values_list("date", "slot_index", "tag_id")
+            .iterator(chunk_size=5000)
+        )
+
+    def iter_days(self, user_id, start_date=None, end_date=None):
+        """
+        기간 내 기록이 있는 날짜별 (date, [(slot_index, tag_id, memo), ...]) 반환
+        - 날짜 순으로 한 날씩 만들어 긴 기간도 메모리 사용량이 일정
+        - start_date, end_date가 없으면 해당 방향으로 제한 없음
+        """
+        blocks = (
+            filter_date_range(
+                TimeBlock.objects.filter(user_id=user_id), start_date, end_date
+            )
+            .order_by("date", "slot_index")
+            .values_list("date", "slot_index", "tag_id", "memo")
+            .iterator(chunk_size=5000)
+        )
+        for date_item, day_blocks in groupby(blocks, key=itemgetter(0)):
+            yield date_item, [block[1:] for block in day_blocks]
+
+    def save_slots(self, user, date_item, slot_indexes, tag, memo):
+        """
+        슬롯들에 태그/메모 저장 (트랜잭션 안에서 호출)
+        - INSERT ... ON CONFLICT DO UPDATE로 저장하여, 같은 슬롯에 동시에
+          저장해도 unique_user_date_slot 위반(IntegrityError)이 발생하지 않음
+        - 생성/수정 수도 같은 잠금 안에서 계산하여 동시 저장 시에도 정확
+          - PostgreSQL: upsert 한 문장의 RETURNING (xmax = 0) (새로 삽입된 행이면 참)
+          - 그 외: 기존 슬롯을 먼저 UPDATE하여 잠그고 그 행 수로 계산한 뒤 upsert
+
+        Returns:
+            tuple: (생성된 슬롯 수, 수정된 슬롯 수)
+        """
+        # 같은 슬롯이 두 번 들어 있으면 ON CONFLICT가 한 행을 두 번 수정하게 되므로 제거
+        slot_indexes = list(dict.fromkeys(slot_indexes))
+        change_seq = next_change_seq(user.id)
+        if connection.vendor == "postgresql":
+            return self._upsert_returning_counts(
+                user, date_item, slot_indexes, tag, memo, change_seq
+            )
+
+        # 기존 행은 UPDATE로 잠그므로 upsert 전까지 다른 트랜잭션이 바꾸거나 지울 수 없고,
+        # 없는 슬롯은 (user, date, slot_index) 범위 잠금(MySQL)이나 DB 쓰기 잠금(SQLite)으로
+        # 다른 트랜잭션이 먼저 삽입할 수 없음
+        existing_count = TimeBlock.objects.filter(
+            user=user, date=date_item, slot_index__in=slot_indexes
+        ).update(tag=tag, memo=memo, updated_at=timezone.now(), change_seq=change_seq)
+        TimeBlock.objects.bulk_create(
+            [
+                TimeBlock(
+                    user=user,
+                    date=date_item,
+                    slot_index=slot_index,
+                    tag=tag,
+                    memo=memo,
+                    change_seq=change_seq,
+                )
+                for slot_index in slot_indexes
+            ],
+            batch_size=BULK_WRITE_BATCH_SIZE,
+            update_conflicts=True,
+            unique_fields=["user", "date", "slot_index"],
+            update_fields=["tag", "memo", "updated_at", "change_seq"],
+        )
+        return len(slot_indexes) - existing_count, existing_count
+
+    def _upsert_returning_counts(
+        self, user, date_item, slot_indexes, tag, memo, change_seq
+    ):
+        """PostgreSQL: 한 문장으로 upsert하고 행별 삽입 여부로 (생성 수, 수정 수) 계산"""
+        fields = [TimeBlock._meta.get_field(name) for name in UPSERT_FIELDS]
+        columns = ", ".join(connection.ops.quote_name(field.column) for field in fields)
+        conflict_columns = ", ".join(
+            connection.ops.quote_name(TimeBlock._meta.get_field(name).column)
+            for name in ("user", "date", "slot_index")
+        )
+        updates = ", ".join(
+            f"{column} = EXCLUDED.{column}"
+            for column in (
+                connection.ops.quote_name(TimeBlock._meta.get_field(name).column)
+                for name in ("tag", "memo", "updated_at", "change_seq")
+            )
+        )
+        row_placeholder = f"({', '.join(['%s'] * len(fields))})"
+        now = timezone.now()
+        params = []
+        for slot_index in slot_indexes:
+            params += [
+                user.id,
+                date_item,
+                slot_index,
+                tag and tag.id,
+                memo,
+                now,
+                now,
+                change_seq,
+            ]
+        sql = (
+            f"INSERT INTO {connection.ops.quote_name(TimeBlock._meta.db_table)} "
+            f"({columns}) VALUES {', '.join([row_placeholder] * len(slot_indexes))} "
+            f"ON CONFLICT ({conflict_columns}) DO UPDATE SET {updates} "
+            "RETURNING (xmax = 0)"
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            created_count = sum(1 for (inserted,) in cursor.fetchall() if inserted)
+        return created_count, len(slot_indexes) - created_count
+
+    def iter_changes(self, user_id, since, until):
+        """
+        변경 번호가 (since, until] 구간인 슬롯의
+        (change_seq, date, slot_index, tag_id, memo)를 변경 번호 순으로 반환
+        """
+        return (
+            TimeBlock.objects.filter(
+                user_id=user_id, change_seq__gt=since, change_seq__lte=until
+            )
+            .order_by("change_seq", "id")
+            .values_list("change_seq", "date", "slot_index", "tag_id", "memo")
+            .iterator(chunk_size=5000)
+        )
+
+    def save_blocks(self, user_id, blocks):
+        """
+        여러 날짜의 슬롯 기록을 한 번에 저장 (가져오기용, 트랜잭션 안에서 호출)
+
+        Args:
+            user_id (int): 사용자 ID
+            blocks (list): (date, slot_index, tag_id, memo) 목록 (같은 슬롯은 한 번만)
+        """
+        change_seq = next_change_seq(user_id)
+        TimeBlock.objects.bulk_create(
+            [
+                TimeBlock(
+                    user_id=user_id,
+                    date=date_item,
+                    slot_index=slot_index,
+                    tag_id=tag_id,
+                    memo=memo,
+                    change_seq=change_seq,
+                )
+                for date_item, slot_index, tag_id, memo in blocks
+            ],
+            batch_size=BULK_WRITE_BATCH_SIZE,
+            update_conflicts=True,
+            unique_fields=["user", "date", "slot_index"],
+            update_fields=["tag", "memo", "updated_at", "change_seq"],
+        )
+
+    def delete_slots(self, user, date_item, slot_indexes):
+        """
+        슬롯들의 기록 삭제 (트랜잭션 안에서 호출), 삭제된 슬롯 수 반환
+        - 실제로 삭제된 슬롯만 변경 피드용 삭제 기록을 남김
+        """
+        change_seq = next_change_seq(user.id)
+        time_blocks = TimeBlock.objects.filter(
+            user=user, date=date_item, slot_index__in=slot_indexes
+        )
+        deleted_slots = list(time_blocks.values_list("slot_index", flat=True))
+        if not deleted_slots:
+            return 0
+        time_blocks.filter(slot_index__in=deleted_slots).delete()
+        record_tombstones(user, date_item, deleted_slots, change_seq)
+        return len(deleted_slots)
+
+
+class DayLogStorage:
+    """사용자·날짜당 한 행 (DayLog)"""
+
+    name = "daylog"
+
+    def _get_tags(self, tag_ids):
+        """태그 ID → Tag (삭제된 태그는 포함되지 않음)"""
+        tag_ids = set(tag_ids) - {EMPTY_SLOT, UNTAGGED_SLOT}
+        return Tag.objects.in_bulk(tag_ids) if tag_ids else {}
+
+    def get_day(self, user, date_item):
+        """하루치 기록된 슬롯의 SlotEntry 목록 (slot_index 순)"""
+        day_log = DayLog.objects.filter(user=user, date=date_item).first()
+        if day_log is None:
+            return []
+        day_blocks = list(iter_day_log_blocks(day_log.slots, day_log.memos))
+        tags = self._get_tags(tag_id for _, tag_id, _ in day_blocks if tag_id)
+        entries = []
+        for slot_index, tag_id, memo in day_blocks:
+            # 태그가 삭제된 뒤에도 남아 있는 ID는 태그가 삭제된 기록으로 취급
+            tag = tags.get(tag_id)
+            entries.append(SlotEntry(slot_index, tag and tag.id, tag, memo))
+        return entries
+
+    def iter_rows(self, user_id, start_date=None, end_date=None, dates=None):
+        """기록된 슬롯의 (date, slot_index, tag_id)를 날짜/슬롯 순으로 반환"""
+        day_logs = DayLog.objects.filter(user_id=user_id)
+        if start_date:
+            day_logs = day_logs.filter(date__gte=start_date)
+        if end_date:
+            day_logs = day_logs.filter(date__lte=end_date)
+        if dates is not None:
+            day_logs = day_logs.filter(date__in=dates)
+        days = [
+            (date_item, unpack_slots(slots))
+            for date_item, slots in day_logs.order_by("date").values_list(
+                "date", "slots"
+            )
+        ]
+        tag_ids = set()
+        for _, values in days:
+            tag_ids.update(values)
+        existing_tag_ids = set(self._get_tags(tag_ids))
+
+        for date_item, values in days:
+            for slot_index, value in enumerate(values):
+                if value == EMPTY_SLOT:
+                    continue
+                tag_id = value if value in existing_tag_ids else None
+                yield date_item, slot_index, tag_id
+
+    def iter_days(self, user_id, start_date=None, end_date=None):
+        """
+        기간 내 기록이 있는 날짜별 (date, [(slot_index, tag_id, memo), ...]) 반환
+        - 삭제된 태그의 ID는 None으로 반환
+        """
+        day_logs = (
+            filter_date_range(
+                DayLog.objects.filter(user_id=user_id), start_date, end_date
+            )
+            .order_by("date")
+            .values_list("date", "slots", "memos")
+            .iterator(chunk_size=500)
+        )
+        existing_tag_ids = None
+        for date_item, slots, memos in day_logs:
+            day_blocks = list(iter_day_log_blocks(slots, memos))
+            if existing_tag_ids is None:
+                # 사용자 태그 + 기본 태그 ID (태그 수는 적으므로 한 번만 조회)
+                existing_tag_ids = set(
+                    Tag.objects.filter(
+                        Q(user_id=user_id) | Q(is_default=True)
+                    ).values_list("id", flat=True)
+                )
+            yield date_item, [
+                (
+                    slot_index,
+                    tag_id if tag_id in existing_tag_ids else None,
+                    memo,
+                )
+                for slot_index, tag_id, memo in day_blocks
+            ]
+
+    def save_slots(self, user, date_item, slot_indexes, tag, memo):
+        """
+        슬롯들에 태그/메모 저장 (트랜잭션 안에서 호출, 해당 날짜 행을 잠금)
+        - tag가 None이면 태그가 삭제된 기록으로 저장 (다른 날짜의 기록을 복사할 때)
+
+        Returns:
+            tuple: (생성된 슬롯 수, 수정된 슬롯 수)
+        """
+        change_seq = next_change_seq(user.id)
+        day_log, _ = DayLog.objects.select_for_update().get_or_create(
+            user=user, date=date_item, defaults={"slots": EMPTY_DAY}
+        )
+        values = unpack_slots(day_log.slots)
+        tag_value = encode_tag_id(tag and tag.id)
+        created_count = 0
+        updated_count = 0
+        for slot_index in dict.fromkeys(slot_indexes):
+            if values[slot_index] == EMPTY_SLOT:
+                created_count += 1
+            else:
+                updated_count += 1
+            values[slot_index] = tag_value
+            if memo:
+                day_log.memos[str(slot_index)] = memo
+            else:
+                day_log.memos.pop(str(slot_index), None)
+        day_log.slots = pack_slots(values)
+        day_log.change_seq = change_seq
+        day_log.save()
+        return created_count, updated_count
+
+    def iter_changes(self, user_id, since, until):
+        """
+        변경 번호가 (since, until] 구간인 날짜의 모든 기록 슬롯을
+        (change_seq, date, slot_index, tag_id, memo)로 반환 (날짜 단위로 변경 번호 기록)
+        """
+        day_logs = (
+            DayLog.objects.filter(
+                user_id=user_id, change_seq__gt=since, change_seq__lte=until
+            )
+            .order_by("change_seq", "id")
+            .values_list("change_seq", "date", "slots", "memos")
+            .iterator(chunk_size=500)
+        )
+        existing_tag_ids = None
+        for change_seq, date_item, slots, memos in day_logs:
+            if existing_tag_ids is None:
+                existing_tag_ids = set(
+                    Tag.objects.filter(
+                        Q(user_id=user_id) | Q(is_default=True)
+                    ).values_list("id", flat=True)
+                )
+            for slot_index, tag_id, memo in iter_day_log_blocks(slots, memos):
+                tag_id = tag_id if tag_id in existing_tag_ids else None
+                yield change_seq, date_item, slot_index, tag_id, memo
+
+    def save_blocks(self, user_id, blocks):
+        """
+        여러 날짜의 슬롯 기록을 한 번에 저장 (가져오기용, 트랜잭션 안에서 호출)
+        - 대상 날짜의 DayLog를 한 번에 잠그고 읽은 뒤 한 번의 upsert로 저장
+
+        Args:
+            user_id (int): 사용자 ID
+            blocks (list): (date, slot_index, tag_id, memo) 목록 (같은 슬롯은 한 번만)
+        """
+        change_seq = next_change_seq(user_id)
+        blocks_by_date = {}
+        for date_item, slot_index, tag_id, memo in blocks:
+            blocks_by_date.setdefault(date_item, []).append((slot_index, tag_id, memo))
+        existing = {
+            day_log.date: day_log
+            for day_log in DayLog.objects.select_for_update().filter(
+                user_id=user_id, date__in=list(blocks_by_date)
+            )
+        }
+
+        day_logs = []
+        for date_item, day_blocks in blocks_by_date.items():
+            day_log = existing.get(date_item)
+            if day_log is None:
+                day_log = DayLog(user_id=user_id, date=date_item, slots=EMPTY_DAY)
+            values = unpack_slots(day_log.slots)
+            for slot_index, tag_id, memo in day_blocks:
+                values[slot_index] = encode_tag_id(tag_id)
+                if memo:
+                    day_log.memos[str(slot_index)] = memo
+                else:
+                    day_log.memos.pop(str(slot_index), None)
+            day_log.slots = pack_slots(values)
+            day_log.change_seq = change_seq
+            day_logs.append(day_log)
+        DayLog.objects.bulk_create(
+            day_logs,
+            batch_size=BULK_WRITE_BATCH_SIZE,
+            update_conflicts=True,
+            unique_fields=["user", "date"],
+            update_fields=["slots", "memos", "updated_at", "change_seq"],
+        )
+
+    def delete_slots(self, user, date_item, slot_indexes):
+        """
+        슬롯들의 기록 삭제 (트랜잭션 안에서 호출), 삭제된 슬롯 수 반환
+        - 실제로 삭제된 슬롯만 변경 피드용 삭제 기록을 남김
+        """
+        change_seq = next_change_seq(user.id)
+        day_log = (
+            DayLog.objects.select_for_update().filter(user=user, date=date_item).first()
+        )
+        if day_log is None:
+            return 0
+        values = unpack_slots(day_log.slots)
+        deleted_slots = []
+        for slot_index in dict.fromkeys(slot_indexes):
+            if values[slot_index] != EMPTY_SLOT:
+                values[slot_index] = EMPTY_SLOT
+                day_log.memos.pop(str(slot_index), None)
+                deleted_slots.append(slot_index)
+        if not deleted_slots:
+            return 0
+        if any(values):
+            day_log.slots = pack_slots(values)
+            day_log.change_seq = change_seq
+            day_log.save()
+        else:
+            day_log.delete()
+        record_tombstones(user, date_item, deleted_slots, change_seq)
+        return len(deleted_slots)
+
+
+TIMEBLOCK_STORAGES = {
+    "rows": RowStorage(),
+    "daylog": DayLogStorage(),
+}
+
+
+def get_timeblock_storage(name=None):
+    """이름(기본값: settings.TIMEBLOCK_STORAGE)에 해당하는 저장소 반환"""
+    name = name or getattr(settings, "TIMEBLOCK_STORAGE", DEFAULT_TIMEBLOCK_STORAGE)
+    try:
+        return TIMEBLOCK_STORAGES[name]
+    except KeyError:
+        raise ImproperlyConfigured(
+            f"알 수 없는 시간 블록 저장소입니다: {name} "
+            f"(사용 가능: {', '.join(TIMEBLOCK_STORAGES)})"
+        )
+
+
+def copy_rows_to_day_logs(user_id):
+    """
+    사용자의 TimeBlock을 DayLog로 복사 (기존 DayLog는 교체)
+
+    Returns:
+        int: 생성된 DayLog 수
+    """
+    change_seq = next_change_seq(user_id)
+    DayLog.objects.filter(user_id=user_id).delete()
+    blocks = (
+        TimeBlock.objects.filter(user_id=user_id)
+        .order_by("date", "slot_index")
+        .values_list("date", "slot_index", "tag_id", "memo")
+        .iterator(chunk_size=5000)
+    )
+    created = 0
+    day_logs = []
+    for date_item, day_blocks in groupby(blocks, key=itemgetter(0)):
+        slots, memos = build_day_log_fields(block[1:] for block in day_blocks)
+        day_logs.append(
+            DayLog(
+                user_id=user_id,
+                date=date_item,
+                slots=slots,
+                memos=memos,
+                change_seq=change_seq,
+            )
+        )
+        if len(day_logs) >= 1000:
+            DayLog.objects.bulk_create(day_logs)
+            created += len(day_logs)
+            day_logs = []
+    DayLog.objects.bulk_create(day_logs)
+    return created + len(day_logs)
+
+
+def copy_day_logs_to_rows(user_id):
+    """
+    사용자의 DayLog를 TimeBlock으로 복사 (기존 TimeBlock은 교체)
+
+    Returns:
+        int: 생성된 TimeBlock 수
+    """
+    change_seq = next_change_seq(user_id)
+    TimeBlock.objects.filter(user_id=user_id).delete()
+    existing_tag_ids = set(Tag.objects.values_list("id", flat=True))
+    created = 0
+    time_blocks = []
+    for day_log in DayLog.objects.filter(user_id=user_id).iterator(chunk_size=1000):
+        for slot_index, tag_id, memo in iter_day_log_blocks(
+            day_log.slots, day_log.memos
+        ):
+            time_blocks.append(
+                TimeBlock(
+                    user_id=user_id,
+                    date=day_log.date,
+                    slot_index=slot_index,
+                    tag_id=tag_id if tag_id in existing_tag_ids else None,
+                    memo=memo,
+                    change_seq=change_seq,
+                )
+            )
+        if len(time_blocks) >= 5000:
+            TimeBlock.objects.bulk_create(time_blocks)
+            created += len(time_blocks)
+            time_blocks = []
+    TimeBlock.objects.bulk_create(time_blocks)
+    return created + len(time_blocks)
@@ -0,0 +1,516 @@
+import json
+import threading
+from datetime import date, datetime, timedelta
+
+from django.contrib.auth.models import User
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection, transaction
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.urls import reverse
+
+from apps.core.cache import get_data_version
+from apps.core.metrics import get_counter
+from apps.core.utils import MAX_MEMO_LENGTH
+from apps.tags.cache import get_available_tags
+from apps.tags.models import Tag
+from .changes import decode_cursor, get_changes
+from .importer import TimeBlockImporter, import_time_blocks
+from .models import DayLog
+from .storage import (
+    EMPTY_SLOT,
+    UNTAGGED_SLOT,
+    copy_day_logs_to_rows,
+    get_timeblock_storage,
+    unpack_slots,
+)
+
+WRITE_DATE = date(2025, 1, 6)
+
+
+class SharedDatabaseTestCase(TransactionTestCase):
+    """스레드 간에 공유되는 DB(파일 SQLite, PostgreSQL 등)에서만 실행하는 동시 쓰기 테스트"""
+
+    def setUp(self):
+        # 테스트 DB가 만들어진 뒤의 연결로 판단 (메모리 SQLite는 스레드마다 다른 DB)
+        if connection.vendor == "sqlite" and connection.is_in_memory_db():
+            self.skipTest("동시 쓰기는 스레드 간에 공유되는 DB에서만 검사")
+        super().setUp()
+
+
+class ConcurrentSaveSlotsTests(SharedDatabaseTestCase):
+    """같은 슬롯을 여러 트랜잭션이 동시에 저장할 때 (같은 슬롯을 동시에 드래그)"""
+
+    WRITERS = 8
+    SLOTS = list(range(36, 54))
+
+    def setUp(self):
+        super().setUp()
+        self.user = User.objects.create_user("concurrent_writer")
+        self.tags = [
+            Tag.objects.create(user=self.user, name=f"태그{index}", color="#123456")
+            for index in range(self.WRITERS)
+        ]
+
+    def run_writers(self):
+        storage = get_timeblock_storage()
+        barrier = threading.Barrier(self.WRITERS)
+        results = []
+        errors = []
+
+        def write(tag):
+            try:
+                barrier.wait()
+                with transaction.atomic():
+                    results.append(
+                        storage.save_slots(self.user, WRITE_DATE, self.SLOTS, tag, "")
+                    )
+            except Exception as e:
+                errors.append(e)
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=write, args=(tag,)) for tag in self.tags]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results, errors
+
+    def test_counts_and_final_rows(self):
+        results, errors = self.run_writers()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(len(results), self.WRITERS)
+        # 각 슬롯은 정확히 한 트랜잭션만 생성하고 나머지는 모두 수정
+        created = sum(created_count for created_count, _ in results)
+        updated = sum(updated_count for _, updated_count in results)
+        self.assertEqual(created, len(self.SLOTS))
+        self.assertEqual(updated, len(self.SLOTS) * (self.WRITERS - 1))
+        for created_count, updated_count in results:
+            self.assertEqual(created_count + updated_count, len(self.SLOTS))
+
+        entries = get_timeblock_storage().get_day(self.user, WRITE_DATE)
+        self.assertEqual([entry.slot_index for entry in entries], self.SLOTS)
+        # 마지막으로 커밋한 트랜잭션의 태그로 모든 슬롯이 저장됨
+        self.assertEqual(len({entry.tag_id for entry in entries}), 1)
+
+
+class ChangeFeedCommitOrderTests(SharedDatabaseTestCase):
+    """변경 피드를 읽는 동안 아직 커밋되지 않은 쓰기 트랜잭션이 있을 때"""
+
+    def test_slow_transaction_not_skipped(self):
+        user = User.objects.create_user("slow_writer")
+        tag = Tag.objects.create(user=user, name="업무", color="#123456")
+        cursor = get_changes(user)["cursor"]
+        written = threading.Event()
+        release = threading.Event()
+        errors = []
+
+        def write():
+            try:
+                with transaction.atomic():
+                    get_timeblock_storage().save_slots(
+                        user, WRITE_DATE, [1, 2], tag, ""
+                    )
+                    written.set()
+                    release.wait(10)
+            except Exception as e:
+                errors.append(e)
+                written.set()
+            finally:
+                connection.close()
+
+        thread = threading.Thread(target=write)
+        thread.start()
+        written.wait(10)
+        # 커밋 전에 읽은 피드는 커서를 쓰기 트랜잭션 너머로 옮기지 않음
+        pending = get_changes(user, decode_cursor(cursor))
+        release.set()
+        thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(pending, {"cursor": cursor, "changes": []})
+        changes = get_changes(user, decode_cursor(pending["cursor"]))["changes"]
+        self.assertEqual([change["slot"] for change in changes], [1, 2])
+
+
+class ChangeFeedApiTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("feed_reader")
+        self.tag = Tag.objects.create(user=self.user, name="업무", color="#123456")
+        self.client.force_login(self.user)
+
+    def get_changes(self, cursor=None):
+        return self.client.get(
+            reverse("dashboard_api:time_block_changes_api"),
+            {"since": cursor} if cursor else {},
+        )
+
+    def test_cursor_follows_writes_and_deletes(self):
+        cursor = self.get_changes().json()["data"]["cursor"]
+        storage = get_timeblock_storage()
+        storage.save_slots(self.user, WRITE_DATE, [1, 2], self.tag, "회의")
+        storage.delete_slots(self.user, WRITE_DATE, [2])
+
+        data = self.get_changes(cursor).json()["data"]
+        self.assertEqual(
+            data["changes"],
+            [
+                {
+                    "date": "2025-01-06",
+                    "slot": 1,
+                    "tag_id": self.tag.id,
+                    "memo": "회의",
+                },
+                {"date": "2025-01-06", "slot": 2, "deleted": True},
+            ],
+        )
+        self.assertEqual(self.get_changes(data["cursor"]).json()["data"]["changes"], [])
+
+    def test_invalid_cursors(self):
+        self.assertEqual(self.get_changes("s-1").status_code, 400)
+        self.assertEqual(self.get_changes("abc").status_code, 400)
+        self.assertEqual(self.get_changes("1736900000123456").status_code, 400)
+        # 서버가 발급하지 않은 커서는 다시 불러오기
+        self.assertEqual(self.get_changes("s999").status_code, 410)
+
+
+@override_settings(TIMEBLOCK_STORAGE="daylog")
+class DayLogStorageTests(TestCase):
+    """사용자·날짜당 한 행으로 저장하는 DayLog 저장소"""
+
+    def setUp(self):
+        self.user = User.objects.create_user("day_log_writer")
+        self.tag = Tag.objects.create(user=self.user, name="업무", color="#123456")
+        self.storage = get_timeblock_storage()
+
+    def get_slot_values(self):
+        return unpack_slots(DayLog.objects.get(user=self.user, date=WRITE_DATE).slots)
+
+    def test_slots_packed_into_one_row(self):
+        self.assertEqual(
+            self.storage.save_slots(
+                self.user, WRITE_DATE, [0, 1, 143], self.tag, "회의"
+            ),
+            (3, 0),
+        )
+        self.assertEqual(
+            self.storage.save_slots(self.user, WRITE_DATE, [1, 2], self.tag, ""),
+            (1, 1),
+        )
+
+        day_log = DayLog.objects.get(user=self.user)
+        self.assertEqual(day_log.memos, {"0": "회의", "143": "회의"})
+        values = self.get_slot_values()
+        self.assertEqual(
+            [slot_index for slot_index, value in enumerate(values) if value],
+            [0, 1, 2, 143],
+        )
+        self.assertEqual({value for value in values if value}, {self.tag.id})
+        self.assertEqual(
+            [
+                (entry.slot_index, entry.tag, entry.memo)
+                for entry in self.storage.get_day(self.user, WRITE_DATE)
+            ],
+            [
+                (0, self.tag, "회의"),
+                (1, self.tag, ""),
+                (2, self.tag, ""),
+                (143, self.tag, "회의"),
+            ],
+        )
+
+    def test_untagged_slot_round_trip(self):
+        self.storage.save_slots(self.user, WRITE_DATE, [5], None, "복사한 기록")
+
+        self.assertEqual(self.get_slot_values()[5], UNTAGGED_SLOT)
+        entry = self.storage.get_day(self.user, WRITE_DATE)[0]
+        self.assertEqual((entry.slot_index, entry.tag_id, entry.tag), (5, None, None))
+        self.assertEqual(
+            list(self.storage.iter_rows(self.user.id)), [(WRITE_DATE, 5, None)]
+        )
+        self.assertEqual(
+            list(self.storage.iter_days(self.user.id)),
+            [(WRITE_DATE, [(5, None, "복사한 기록")])],
+        )
+
+    def test_deleted_tag_read_as_untagged(self):
+        self.storage.save_slots(self.user, WRITE_DATE, [1, 2], self.tag, "")
+        tag_id = self.tag.id
+        self.tag.delete()
+
+        # 슬롯 값은 그대로 남고 읽을 때 태그가 삭제된 기록으로 취급
+        self.assertEqual(self.get_slot_values()[1:3], [tag_id, tag_id])
+        self.assertEqual(
+            [entry.tag for entry in self.storage.get_day(self.user, WRITE_DATE)],
+            [None, None],
+        )
+        self.assertEqual(
+            list(self.storage.iter_rows(self.user.id)),
+            [(WRITE_DATE, 1, None), (WRITE_DATE, 2, None)],
+        )
+        self.assertEqual(
+            list(self.storage.iter_days(self.user.id)),
+            [(WRITE_DATE, [(1, None, ""), (2, None, "")])],
+        )
+        self.assertEqual(
+            [change[3] for change in self.storage.iter_changes(self.user.id, 0, 100)],
+            [None, None],
+        )
+
+    def test_delete_slots(self):
+        self.storage.save_slots(self.user, WRITE_DATE, [1, 2], self.tag, "회의")
+
+        self.assertEqual(self.storage.delete_slots(self.user, WRITE_DATE, [2, 3]), 1)
+        self.assertEqual(self.get_slot_values()[2], EMPTY_SLOT)
+        self.assertEqual(DayLog.objects.get(user=self.user).memos, {"1": "회의"})
+        # 마지막 슬롯을 지우면 날짜 행도 삭제
+        self.assertEqual(self.storage.delete_slots(self.user, WRITE_DATE, [1]), 1)
+        self.assertFalse(DayLog.objects.filter(user=self.user).exists())
+
+    def test_copy_to_rows_round_trip(self):
+        self.storage.save_slots(self.user, WRITE_DATE, [1, 2], self.tag, "회의")
+        self.storage.save_slots(self.user, WRITE_DATE, [3], None, "")
+        self.storage.save_blocks(
+            self.user.id, [(WRITE_DATE + timedelta(days=1), 0, self.tag.id, "")]
+        )
+        copy_day_logs_to_rows(self.user.id)
+
+        self.assertEqual(
+            list(get_timeblock_storage("rows").iter_days(self.user.id)),
+            list(self.storage.iter_days(self.user.id)),
+        )
+
+
+class TimeBlockApiTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("api_writer")
+        self.tag = Tag.objects.create(user=self.user, name="업무", color="#123456")
+        self.client.force_login(self.user)
+
+    def post_slots(self, slot_indexes):
+        return self.client.post(
+            reverse("dashboard_api:time_block_api"),
+            json.dumps(
+                {
+                    "date": WRITE_DATE.isoformat(),
+                    "slot_indexes": slot_indexes,
+                    "tag_id": self.tag.id,
+                }
+            ),
+            content_type="application/json",
+        )
+
+    def test_duplicate_slot_indexes_counted_once(self):
+        self.post_slots([1, 2])
+        response = self.post_slots([2, 2, 3, 3, 3])
+
+        self.assertEqual(response.status_code, 201)
+        data = response.json()["data"]
+        self.assertEqual(data["created_count"], 1)
+        self.assertEqual(data["updated_count"], 1)
+        self.assertEqual(data["total_count"], 2)
+
+    def post_batch(self, operations):
+        return self.client.post(
+            reverse("dashboard_api:time_block_batch_api"),
+            json.dumps({"operations": operations}),
+            content_type="application/json",
+        )
+
+    def test_memo_must_be_short_string(self):
+        for memo in (["메모"], 123, "가" * (MAX_MEMO_LENGTH + 1)):
+            with self.subTest(memo=memo):
+                operation = {
+                    "op": "set",
+                    "date": WRITE_DATE.isoformat(),
+                    "slots": [[0, 2]],
+                    "tag_id": self.tag.id,
+                    "memo": memo,
+                }
+                response = self.post_batch([operation])
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(response.json()["error"], "INVALID_MEMO")
+
+                response = self.client.post(
+                    reverse("dashboard_api:time_block_api"),
+                    json.dumps(
+                        {
+                            "date": WRITE_DATE.isoformat(),
+                            "slot_indexes": [0],
+                            "tag_id": self.tag.id,
+                            "memo": memo,
+                        }
+                    ),
+                    content_type="application/json",
+                )
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(response.json()["error"], "INVALID_MEMO")
+        self.assertEqual(list(get_timeblock_storage().iter_rows(self.user.id)), [])
+
+    def test_stale_tag_cache_not_trusted_on_write(self):
+        self.assertIn(self.tag.id, get_available_tags(self.user).by_id)
+        # 시그널 없이 소유자가 바뀜 (다른 워커의 캐시 무효화가 아직 반영되지 않은 상태)
+        other = User.objects.create_user("other_owner")
+        Tag.objects.filter(id=self.tag.id).update(user=other)
+        self.assertIn(self.tag.id, get_available_tags(self.user).by_id)
+
+        response = self.post_slots([0])
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.json()["error"], "TAG_NOT_FOUND")
+        response = self.post_batch(
+            [
+                {
+                    "op": "set",
+                    "date": WRITE_DATE.isoformat(),
+                    "slots": [[0, 0]],
+                    "tag_id": self.tag.id,
+                }
+            ]
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()["error"], "TAG_NOT_FOUND")
+        self.assertEqual(list(get_timeblock_storage().iter_rows(self.user.id)), [])
+
+    def test_batch_writes_counted_in_metrics(self):
+        counter = get_counter("time_block_api_slots")
+        before = counter.snapshot()
+        self.post_slots([0, 1])
+        response = self.post_batch(
+            [
+                {
+                    "op": "set",
+                    "date": WRITE_DATE.isoformat(),
+                    "slots": [[1, 3]],
+                    "tag_id": self.tag.id,
+                },
+                {"op": "clear", "date": WRITE_DATE.isoformat(), "slots": [[0, 0]]},
+            ]
+        )
+
+        self.assertEqual(response.status_code, 200)
+        after = counter.snapshot()
+        increments = {
+            operation: after.get((operation,), 0) - before.get((operation,), 0)
+            for operation in ("created", "updated", "deleted")
+        }
+        # 단건 API: 생성 2, 일괄 편집: 생성 2 + 수정 1, 삭제 1
+        self.assertEqual(increments, {"created": 4, "updated": 1, "deleted": 1})
+
+
+ICS_TEMPLATE = """BEGIN:VCALENDAR
+BEGIN:VEVENT
+{}
+SUMMARY:업무
+END:VEVENT
+END:VCALENDAR
+"""
+
+
+@override_settings(TIME_ZONE="Asia/Seoul")
+class ImporterTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("importer")
+
+    def import_ics(self, *event_lines):
+        content = ICS_TEMPLATE.format("\n".join(event_lines))
+        return import_time_blocks(self.user, content.splitlines(), "ics")
+
+    def test_unrepresentable_duration_skipped(self):
+        for duration in ("P99999999999W", "PT" + "9" * 5000 + "S", "P3000000D"):
+            with self.subTest(duration=duration):
+                report = self.import_ics(
+                    "DTSTART:20250106T090000", f"DURATION:{duration}"
+                )
+                self.assertEqual(report["skipped"], 1)
+                self.assertEqual(report["slots"], 0)
+
+    def test_interval_longer_than_a_day_skipped(self):
+        report = self.import_ics("DTSTART:20000101T000000", "DURATION:P36500D")
+        self.assertEqual(report["skipped"], 1)
+        self.assertEqual(report["slots"], 0)
+
+        # 하루 전체(24시간)까지는 허용
+        report = self.import_ics("DTSTART:20250106T000000", "DURATION:P1D")
+        self.assertEqual(report["skipped"], 0)
+        self.assertEqual(report["slots"], 144)
+
+    def test_long_memo_skipped(self):
+        long_memo = "가" * (MAX_MEMO_LENGTH + 1)
+        report = import_time_blocks(
+            self.user,
+            [
+                "date,start,end,tag,memo",
+                f"2025-01-06,09:00,10:00,업무,{long_memo}",
+                f"2025-01-06,10:00,11:00,업무,{'가' * MAX_MEMO_LENGTH}",
+            ],
+            "csv",
+        )
+        self.assertEqual(report["skipped"], 1)
+        self.assertEqual(report["slots"], 6)
+
+        report = self.import_ics(
+            "DTSTART:20250107T090000", "DURATION:PT1H", "DESCRIPTION:" + "가" * 5000
+        )
+        self.assertEqual(report["skipped"], 1)
+        self.assertEqual(report["slots"], 0)
+
+    @override_settings(IMPORT_MAX_SLOTS=144)
+    def test_upload_slot_limit(self):
+        self.client.force_login(self.user)
+        content = "date,start,end,tag\n" + "".join(
+            f"2025-01-{day:02d},00:00,24:00,업무\n" for day in (6, 7, 8)
+        )
+        response = self.client.post(
+            reverse("dashboard_api:import_api"),
+            {"file": SimpleUploadedFile("import.csv", content.encode())},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        report = response.json()["data"]
+        self.assertTrue(report["truncated"])
+        self.assertEqual(report["slots"], 144)
+
+    def test_last_representable_day(self):
+        report = import_time_blocks(
+            self.user,
+            ["date,start,end,tag", "9999-12-31,23:00,00:00,업무"],
+            "csv",
+        )
+        self.assertEqual(report["skipped"], 1)
+
+        report = self.import_ics("DTSTART:99991231T230000", "DURATION:PT30M")
+        self.assertEqual(report["slots"], 3)
+
+    def test_quoted_tzid(self):
+        report = self.import_ics(
+            'DTSTART;TZID="America/New_York":20250106T090000',
+            'DTEND;TZID="America/New_York":20250106T100000',
+        )
+        self.assertEqual(report["skipped"], 0)
+        # 뉴욕 09:00~10:00 = 서울 23:00~24:00
+        self.assertEqual(
+            [
+                (date_item, slot_index)
+                for date_item, slot_index, _ in get_timeblock_storage().iter_rows(
+                    self.user.id
+                )
+            ],
+            [(WRITE_DATE, slot_index) for slot_index in range(138, 144)],
+        )
+
+    def test_data_version_bumped_after_partial_import(self):
+        def intervals():
+            start = datetime(2025, 1, 6, 9)
+            yield 2, start, start + timedelta(hours=1), "업무", "", ""
+            raise RuntimeError("읽기 실패")
+
+        Tag.objects.create(user=self.user, name="업무", color="#123456")
+        before = get_data_version(self.user.id)
+        importer = TimeBlockImporter(self.user, chunk_size=1)
+        with self.captureOnCommitCallbacks(execute=True):
+            with self.assertRaises(RuntimeError):
+                importer.run(intervals())
+
+        self.assertEqual(importer.stats["chunks"], 1)
+        self.assertNotEqual(get_data_version(self.user.id), before)
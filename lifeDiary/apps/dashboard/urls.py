@@ -5,4 +5,9 @@ app_name = "dashboard"
 
 urlpatterns = [
     path("", views.dashboard_view, name="index"),
+    # 날짜 이동/앞뒤 날짜 미리 읽기용 하루치 기록 (JSON)
+    path("day/", views.dashboard_day_data, name="day_data"),
+    # 주간/월간 시간 그리드
+    path("week/", views.dashboard_range_view, {"span": "week"}, name="week"),
+    path("month/", views.dashboard_range_view, {"span": "month"}, name="month"),
 ]
@@ -1,103 +1,189 @@
+from django.conf import settings
+from django.http import StreamingHttpResponse
 from django.shortcuts import render
 from django.contrib.auth.decorators import login_required
 from django.views.decorators.http import require_http_methods, require_GET
 
+import io
+import itertools
 import json
+from datetime import timedelta
+from django.db import transaction
 from django.db.models import Q
 
 from apps.tags.models import Tag
-from .models import TimeBlock
+from apps.tags.cache import get_available_tags
+from apps.stats.rollups import refresh_daily_rollups
+from apps.core.cache import bump_data_version
+from apps.core.conditional import conditional_on_data_version
+from apps.core.metrics import get_counter
+from .storage import get_timeblock_storage
+from .grid import GRID_FRAGMENT_TIMEOUT, TIME_HEADERS, build_day_grid
+from .batch import BatchOperationError, parse_operations, apply_operations
+from .encoding import (
+    build_tag_dictionary,
+    encode_single_day,
+    iter_encoded_days,
+    iter_range_json,
+)
+from .changes import ResyncRequired, decode_cursor, get_changes
+from .export import EXPORT_FORMATS, iter_chunks, iter_export_records
+from .importer import (
+    DEFAULT_IMPORT_MAX_SLOTS,
+    IMPORT_FORMATS,
+    ImportRowError,
+    detect_import_format,
+    import_time_blocks,
+)
 from apps.core.utils import (
     safe_date_parse,
+    parse_date_or_none,
     serialize_for_js,
     calculate_time_statistics,
+    get_week_date_range,
+    get_month_date_range,
     success_response,
     error_response,
+    MAX_MEMO_LENGTH,
     TOTAL_SLOTS_PER_DAY,
-    get_time_from_slot,
+)
+
+# 기간 그리드 화면: 기간 종류 → (화면 제목, 기준 날짜가 포함된 기간을 구하는 함수)
+RANGE_VIEW_SPANS = {
+    "week": ("주간 그리드", get_week_date_range),
+    "month": ("월간 그리드", get_month_date_range),
+}
+
+# 기간 조회 API: 최대 조회 일수, 이보다 긴 기간은 스트리밍 응답
+MAX_RANGE_DAYS = 366
+RANGE_STREAMING_DAYS = 31
+
+# 시간 블록 API 저장량 (/metrics)
+slot_write_counter = get_counter(
+    "time_block_api_slots",
+    "시간 블록 API(일괄 편집 포함)로 생성/수정/삭제한 슬롯 수",
+    labels=("operation",),
 )
 
 
 @login_required
 @require_GET
+@conditional_on_data_version
 def dashboard_view(request):
     """
     메인 대시보드 - Django 템플릿 기반으로 초기 데이터 렌더링
     """
     selected_date = safe_date_parse(request.GET.get("date"))
 
-    # 시간 블록 데이터 조회
-    time_blocks = TimeBlock.objects.filter(
-        user=request.user, date=selected_date
-    ).select_related("tag")
-    slot_data = {
-        block.slot_index: {"tag": block.tag, "memo": block.memo, "id": block.id}
-        for block in time_blocks
-    }
-
-    # 144개 슬롯 생성 (00:00 ~ 23:50, 10분 단위)
-    slots = []
-    for i in range(TOTAL_SLOTS_PER_DAY):
-        hour, minute = get_time_from_slot(i)
-        slots.append(
-            {
-                "index": i,
-                "hour": hour,
-                "minute": minute,
-                "time_str": f"{hour:02d}:{minute:02d}",
-                "data": slot_data.get(i),
-            }
-        )
+    # 시간 블록 데이터 조회 후 고정 그리드와 합침
+    entries = get_timeblock_storage().get_day(request.user, selected_date)
+    slots, grid_key = build_day_grid(entries)
 
-    # 사용자의 모든 태그 + 공용 기본 태그 조회 (기본 태그 우선)
-    user_tags = Tag.objects.filter(Q(user=request.user) | Q(is_default=True)).order_by(
-        "-is_default", "name"
-    )
+    # 사용자의 모든 태그 + 공용 기본 태그 (기본 태그 우선, 캐시 사용)
+    available_tags = get_available_tags(request.user)
 
     # 통계 계산 (core 유틸리티 사용)
-    stats = calculate_time_statistics(len(slot_data))
-
-    # 시간 헤더 (1분, 11분, 21분, 31분, 41분, 51분)
-    time_headers = [f"{(i * 10 - 1) % 60 + 1}분" for i in range(1, 13)]
+    stats = calculate_time_statistics(len(entries))
 
     context = {
         "page_title": "대시보드",
         "selected_date": selected_date,
         "slots": slots,
-        "user_tags": user_tags,
+        "grid_key": grid_key,
+        "grid_timeout": GRID_FRAGMENT_TIMEOUT,
+        "user_tags": available_tags.tags,
         "total_slots": len(slots),
-        "filled_slots": len(slot_data),
+        "filled_slots": len(entries),
         "fill_percentage": stats["fill_percentage"],
         "total_hours": stats["hours"],
         "remaining_minutes": stats["remaining_minutes"],
-        "time_headers": time_headers,
-        # JavaScript에서 사용할 데이터 (core 직렬화 함수 사용)
-        "tags_json": serialize_for_js(
-            [
-                {
-                    "id": tag.id,
-                    "name": tag.name,
-                    "color": tag.color,
-                    "is_default": tag.is_default,
-                }
-                for tag in user_tags
-            ]
-        ),
+        "time_headers": TIME_HEADERS,
+        # JavaScript에서 사용할 데이터 (캐시에 미리 직렬화된 값)
+        "tags_json": available_tags.tags_json,
     }
 
     return render(request, "dashboard/index.html", context)
 
 
 @login_required
-@require_http_methods(["POST", "DELETE"])
+@require_GET
+@conditional_on_data_version
+def dashboard_day_data(request):
+    """
+    대시보드 날짜 이동용 하루치 기록 (GET /dashboard/day/?date=YYYY-MM-DD)
+    - 기간 조회 API와 같은 압축 형식 (태그 사전 + 144칸 슬롯 배열)
+    - 데이터 버전 기반 ETag/Last-Modified로 바뀌지 않은 날은 304 응답
+    """
+    selected_date = safe_date_parse(request.GET.get("date"))
+    return success_response(
+        f"{selected_date.isoformat()}의 시간 블록입니다.",
+        encode_single_day(request.user, selected_date),
+    )
+
+
+@login_required
+@require_GET
+@conditional_on_data_version
+def dashboard_range_view(request, span):
+    """
+    주간/월간 시간 그리드
+    - 기간 내 기록을 한 번의 기간 조회로 읽어 기간 조회 API와 같은 압축 형식
+      (태그 사전 + 날짜별 슬롯 배열, apps.dashboard.encoding)으로 페이지에 포함
+    - 그리드는 클라이언트에서 그리고, 여러 날짜에 걸친 편집은 일괄 편집 API로 저장
+    """
+    page_title, get_date_range = RANGE_VIEW_SPANS[span]
+    selected_date = safe_date_parse(request.GET.get("date"))
+    start_date, end_date = get_date_range(selected_date)
+    day_count = (end_date - start_date).days + 1
+
+    tags, tag_index = build_tag_dictionary(request.user)
+    days = list(iter_encoded_days(request.user, start_date, end_date, tag_index))
+    filled_slots = sum(slot is not None for day in days for slot in day["slots"])
+    stats = calculate_time_statistics(filled_slots)
+    total_slots = TOTAL_SLOTS_PER_DAY * day_count
+
+    context = {
+        "page_title": page_title,
+        "span": span,
+        "selected_date": selected_date,
+        "start_date": start_date,
+        "end_date": end_date,
+        "prev_date": start_date - timedelta(days=1),
+        "next_date": end_date + timedelta(days=1),
+        "dates": [start_date + timedelta(days=offset) for offset in range(day_count)],
+        "user_tags": get_available_tags(request.user).tags,
+        "total_slots": total_slots,
+        "filled_slots": filled_slots,
+        "fill_percentage": round(filled_slots / total_slots * 100, 1),
+        "total_hours": stats["hours"],
+        "remaining_minutes": stats["remaining_minutes"],
+        "range_json": serialize_for_js(
+            {
+                "from": start_date.isoformat(),
+                "to": end_date.isoformat(),
+                "tags": tags,
+                "days": days,
+            }
+        ),
+    }
+    return render(request, "dashboard/range.html", context)
+
+
+@login_required
+@require_http_methods(["GET", "POST", "DELETE"])
+@conditional_on_data_version
 def time_block_api(request):
     """
     RESTful 시간 블록 API (core 유틸리티 사용)
+    GET: 기간 내 시간 블록 조회 (?from=YYYY-MM-DD&to=YYYY-MM-DD)
     POST: 시간 블록 생성/수정
     DELETE: 시간 블록 삭제
 
     외부 프론트엔드(React 등)에서도 사용 가능한 표준 API
     """
+    if request.method == "GET":
+        return _handle_time_block_range(request)
+
     try:
         data = json.loads(request.body)
         slot_indexes = data.get("slot_indexes", [])
@@ -107,6 +193,18 @@ def time_block_api(request):
         if not slot_indexes:
             return error_response("슬롯 인덱스가 누락되었습니다.", "MISSING_SLOTS")
 
+        if not all(
+            isinstance(slot_index, int) and 0 <= slot_index < TOTAL_SLOTS_PER_DAY
+            for slot_index in slot_indexes
+        ):
+            return error_response(
+                f"슬롯 인덱스는 0~{TOTAL_SLOTS_PER_DAY - 1} 사이의 정수여야 합니다.",
+                "INVALID_SLOT_INDEX",
+            )
+
+        # 중복 슬롯은 한 번만 처리 (저장소도 중복을 제거하므로 응답의 슬롯 수와 일치)
+        slot_indexes = list(dict.fromkeys(slot_indexes))
+
         if not selected_date_str:
             return error_response("날짜가 누락되었습니다.", "MISSING_DATE")
 
@@ -128,6 +226,103 @@ def time_block_api(request):
         return _handle_time_block_delete(request, slot_indexes, selected_date)
 
 
+@login_required
+@require_http_methods(["POST"])
+def time_block_batch_api(request):
+    """
+    여러 날짜의 시간 블록 일괄 편집 API (apps.dashboard.batch 참고)
+    POST: {"operations": [{"op": "set" | "clear" | "copy", "date", "slots", ...}]}
+
+    모든 작업을 한 트랜잭션으로 적용하고 작업별 결과를 반환
+    """
+    try:
+        data = json.loads(request.body)
+    except json.JSONDecodeError:
+        return error_response("올바른 JSON 형식이 아닙니다.", "INVALID_JSON")
+    if not isinstance(data, dict):
+        return error_response("올바른 JSON 형식이 아닙니다.", "INVALID_JSON")
+
+    try:
+        operations = parse_operations(request.user, data.get("operations"))
+    except BatchOperationError as e:
+        return error_response(e.message, e.error_code)
+
+    try:
+        results = apply_operations(request.user, operations)
+    except Exception as e:
+        return error_response(
+            f"저장 중 오류가 발생했습니다: {str(e)}", "SERVER_ERROR", 500
+        )
+
+    for operation in ("created", "updated", "deleted"):
+        slot_write_counter.inc(
+            sum(result[f"{operation}_count"] for result in results),
+            operation=operation,
+        )
+
+    return success_response(
+        f"{len(results)}개의 작업이 적용되었습니다.",
+        {"results": results},
+    )
+
+
+@login_required
+@require_GET
+def time_block_changes_api(request):
+    """
+    시간 블록 변경 피드 API (apps.dashboard.changes 참고)
+    GET: ?since=<cursor> 이후 생성/수정/삭제된 슬롯 목록과 다음 커서
+    """
+    cursor = request.GET.get("since")
+    try:
+        since = decode_cursor(cursor) if cursor else None
+        changes = get_changes(request.user, since)
+    except ValueError:
+        return error_response("올바르지 않은 커서입니다.", "INVALID_CURSOR")
+    except ResyncRequired:
+        return error_response(
+            "변경 내역이 너무 오래되었거나 많습니다. 전체 데이터를 다시 불러와주세요.",
+            "RESYNC_REQUIRED",
+            410,
+        )
+
+    return success_response(f"{len(changes['changes'])}개의 변경 사항입니다.", changes)
+
+
+def _handle_time_block_range(request):
+    """
+    기간 내 시간 블록 조회 (응답 형식은 apps.dashboard.encoding 참고)
+    - RANGE_STREAMING_DAYS일보다 긴 기간은 날짜 단위로 스트리밍
+    """
+    start_date = parse_date_or_none(request.GET.get("from"))
+    end_date = parse_date_or_none(request.GET.get("to"))
+    if not start_date or not end_date:
+        return error_response(
+            "from, to 날짜를 YYYY-MM-DD 형식으로 입력해주세요.", "INVALID_DATE_FORMAT"
+        )
+    if start_date > end_date:
+        return error_response(
+            "from 날짜는 to 날짜보다 늦을 수 없습니다.", "INVALID_DATE_RANGE"
+        )
+    range_days = (end_date - start_date).days + 1
+    if range_days > MAX_RANGE_DAYS:
+        return error_response(
+            f"한 번에 최대 {MAX_RANGE_DAYS}일까지 조회할 수 있습니다.",
+            "RANGE_TOO_LONG",
+        )
+
+    tags, tag_index = build_tag_dictionary(request.user)
+    header = {"from": start_date.isoformat(), "to": end_date.isoformat(), "tags": tags}
+    days = iter_encoded_days(request.user, start_date, end_date, tag_index)
+    message = f"{range_days}일간의 시간 블록입니다."
+
+    if range_days > RANGE_STREAMING_DAYS:
+        return StreamingHttpResponse(
+            iter_range_json(message, header, days), content_type="application/json"
+        )
+    return success_response(message, {**header, "days": list(days)})
+
+
 def _handle_time_block_create_update(request, data, slot_indexes, selected_date):
     """시간 블록 생성/수정 처리 (core 유틸리티 사용)"""
     try:
@@ -137,56 +332,34 @@ def _handle_time_block_create_update(request, data, slot_indexes, selected_date)
         if not tag_id:
             return error_response("태그가 선택되지 않았습니다.", "MISSING_TAG")
 
+        if not isinstance(memo, str) or len(memo) > MAX_MEMO_LENGTH:
+            return error_response(
+                f"메모는 최대 {MAX_MEMO_LENGTH}자의 문자열이어야 합니다.",
+                "INVALID_MEMO",
+            )
+
         # 태그 존재 확인 (사용자 태그 + 기본 태그)
+        # 태그 캐시는 무효화가 늦게 반영될 수 있으므로 저장할 때는 DB에서 확인
         try:
-            tag = Tag.objects.get(
-                Q(id=tag_id, user=request.user) | Q(id=tag_id, is_default=True)
-            )
-        except Tag.DoesNotExist:
+            tag = Tag.objects.filter(
+                Q(user=request.user) | Q(is_default=True), id=int(tag_id)
+            ).first()
+        except (TypeError, ValueError):
+            tag = None
+        if tag is None:
             return error_response(
                 "존재하지 않는 태그이거나 접근 권한이 없습니다.", "TAG_NOT_FOUND", 404
             )
 
-        # 기존 블록 조회
-        existing_blocks = TimeBlock.objects.filter(
-            user=request.user, date=selected_date, slot_index__in=slot_indexes
-        )
-        existing_slots = {block.slot_index: block for block in existing_blocks}
-
-        # 생성/수정할 블록 분류
-        time_blocks_to_create = []
-        time_blocks_to_update = []
-
-        for slot_index in slot_indexes:
-            if slot_index in existing_slots:
-                # 기존 블록 수정
-                block = existing_slots[slot_index]
-                block.tag = tag
-                block.memo = memo
-                time_blocks_to_update.append(block)
-            else:
-                # 새 블록 생성
-                time_blocks_to_create.append(
-                    TimeBlock(
-                        user=request.user,
-                        date=selected_date,
-                        slot_index=slot_index,
-                        tag=tag,
-                        memo=memo,
-                    )
-                )
-
-        # 데이터베이스 업데이트
-        created_count = 0
-        updated_count = 0
-
-        if time_blocks_to_create:
-            TimeBlock.objects.bulk_create(time_blocks_to_create)
-            created_count = len(time_blocks_to_create)
-
-        if time_blocks_to_update:
-            TimeBlock.objects.bulk_update(time_blocks_to_update, ["tag", "memo"])
-            updated_count = len(time_blocks_to_update)
+        # 저장소에 반영 (일별 태그 집계도 같은 트랜잭션에서 갱신)
+        with transaction.atomic():
+            created_count, updated_count = get_timeblock_storage().save_slots(
+                request.user, selected_date, slot_indexes, tag, memo
+            )
+            refresh_daily_rollups(request.user.id, [selected_date])
+            bump_data_version(request.user.id)
+        slot_write_counter.inc(created_count, operation="created")
+        slot_write_counter.inc(updated_count, operation="updated")
 
         return success_response(
             f"{len(slot_indexes)}개의 슬롯이 저장되었습니다.",
@@ -208,9 +381,14 @@ def _handle_time_block_create_update(request, data, slot_indexes, selected_date)
 def _handle_time_block_delete(request, slot_indexes, selected_date):
     """시간 블록 삭제 처리 (core 유틸리티 사용)"""
     try:
-        deleted_count, _ = TimeBlock.objects.filter(
-            user=request.user, date=selected_date, slot_index__in=slot_indexes
-        ).delete()
+        with transaction.atomic():
+            deleted_count = get_timeblock_storage().delete_slots(
+                request.user, selected_date, slot_indexes
+            )
+            if deleted_count:
+                refresh_daily_rollups(request.user.id, [selected_date])
+                bump_data_version(request.user.id)
+        slot_write_counter.inc(deleted_count, operation="deleted")
 
         if deleted_count == 0 and len(slot_indexes) > 0:
             return error_response("삭제할 기록이 없습니다.", "NO_BLOCKS_FOUND", 404)
@@ -224,3 +402,86 @@ def _handle_time_block_delete(request, slot_indexes, selected_date):
         return error_response(
             f"삭제 중 오류가 발생했습니다: {str(e)}", "SERVER_ERROR", 500
         )
+
+
+@login_required
+@require_GET
+def export_api(request):
+    """
+    본인 시간 기록 내보내기 (apps.dashboard.export 참고)
+    GET: ?format=csv|jsonl&from=YYYY-MM-DD&to=YYYY-MM-DD&merge=1
+    - from/to를 생략하면 전체 기간, merge=1이면 같은 태그/메모의 연속 슬롯을 구간으로 합침
+    """
+    export_format = request.GET.get("format", "csv")
+    if export_format not in EXPORT_FORMATS:
+        return error_response(
+            f"format은 {', '.join(EXPORT_FORMATS)} 중 하나여야 합니다.",
+            "INVALID_FORMAT",
+        )
+
+    dates = {}
+    for param in ("from", "to"):
+        value = request.GET.get(param)
+        dates[param] = parse_date_or_none(value) if value else None
+        if value and dates[param] is None:
+            return error_response(
+                f"{param} 날짜는 YYYY-MM-DD 형식이어야 합니다.", "INVALID_DATE_FORMAT"
+            )
+
+    iter_lines, content_type, extension = EXPORT_FORMATS[export_format]
+    records = iter_export_records(
+        [(request.user.id, request.user.username)],
+        dates["from"],
+        dates["to"],
+        merge=request.GET.get("merge") in ("1", "true"),
+    )
+    lines = iter_lines(records)
+    if export_format == "csv":
+        # Excel에서 한글이 깨지지 않도록 UTF-8 BOM 추가
+        lines = itertools.chain(["\ufeff"], lines)
+
+    response = StreamingHttpResponse(iter_chunks(lines), content_type=content_type)
+    response["Content-Disposition"] = (
+        f'attachment; filename="lifediary-{request.user.id}.{extension}"'
+    )
+    return response
+
+
+@login_required
+@require_http_methods(["POST"])
+def import_api(request):
+    """
+    시간 기록 가져오기 (apps.dashboard.importer 참고)
+    POST (multipart): file=<CSV 또는 ICS 파일>, format=csv|ics (생략하면 확장자로 판단)
+    - 큰 파일은 임시 파일로 받아 한 줄씩 읽으며 청크 단위로 저장
+    """
+    upload = request.FILES.get("file")
+    if not upload:
+        return error_response("가져올 파일이 누락되었습니다.", "MISSING_FILE")
+
+    import_format = request.POST.get("format") or detect_import_format(upload.name)
+    if import_format not in IMPORT_FORMATS:
+        return error_response(
+            f"format은 {', '.join(IMPORT_FORMATS)} 중 하나여야 합니다.",
+            "INVALID_FORMAT",
+        )
+
+    max_slots = getattr(settings, "IMPORT_MAX_SLOTS", DEFAULT_IMPORT_MAX_SLOTS)
+    lines = io.TextIOWrapper(upload.file, encoding="utf-8-sig", newline="")
+    try:
+        report = import_time_blocks(
+            request.user, lines, import_format, max_slots=max_slots
+        )
+    except ImportRowError as e:
+        return error_response(str(e), "INVALID_FILE")
+    except UnicodeDecodeError:
+        return error_response("UTF-8 인코딩 파일만 가져올 수 있습니다.", "INVALID_FILE")
+    except Exception as e:
+        return error_response(
+            f"가져오는 중 오류가 발생했습니다: {str(e)}", "SERVER_ERROR", 500
+        )
+
+    message = f"{report['slots']}개의 슬롯을 가져왔습니다."
+    if report["truncated"]:
+        message += f" 한 번에 가져올 수 있는 {max_slots}개를 넘어 나머지는 가져오지 않았습니다."
+    return success_response(message, report)
@@ -0,0 +1,203 @@
+"""
+=================================================================================
+통계 집계 백엔드
+- 기간 내 시간 블록을 날짜별 DaySummary로 집계하는 방식들을 모아둔 모듈
+- settings.STATS_AGGREGATION_BACKEND로 선택 (기본값: "rollup")
+  - rollup: 일별 태그 집계(DailyTagRollup) 조회
+  - python: 원본 시간 기록을 블록 단위로 순회
+  - numpy: 원본 (date, slot_index, tag_id)를 NumPy 배열로 벡터 집계 (numpy 필요)
+  - sql: 원본 TimeBlock을 DB에서 (date, tag_id)로 GROUP BY 하여 집계 행만 전송
+    (슬롯당 한 행 저장소(TIMEBLOCK_STORAGE="rows")에서만 사용 가능)
+- python/numpy는 시간 블록 저장소(apps.dashboard.storage)를 통해 원본을 읽음
+=================================================================================
+"""
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db.models import Count, Min
+
+from apps.dashboard.models import TimeBlock
+from apps.dashboard.storage import get_timeblock_storage
+from apps.tags.models import Tag
+from apps.core.utils import TOTAL_SLOTS_PER_DAY, UNCLASSIFIED_TAG_COLOR
+from .models import DailyTagRollup
+
+DEFAULT_AGGREGATION_BACKEND = "rollup"
+
+
+class DaySummary:
+    """
+    하루치 시간 블록 집계
+    - recorded_blocks: 기록된 슬롯 수 (태그가 삭제된 블록 포함)
+    - tag_blocks: 태그명별 {"name", "color", "blocks"} (첫 슬롯 순서 유지)
+    """
+
+    __slots__ = ("date", "recorded_blocks", "tag_blocks")
+
+    def __init__(self, date):
+        self.date = date
+        self.recorded_blocks = 0
+        self.tag_blocks = {}
+
+    def add(self, tag_info, count=1):
+        self.recorded_blocks += count
+        if not tag_info:
+            return
+        tag_name = tag_info["name"]
+        if tag_name not in self.tag_blocks:
+            self.tag_blocks[tag_name] = {
+                "name": tag_name,
+                "color": tag_info["color"],
+                "blocks": 0,
+            }
+        self.tag_blocks[tag_name]["blocks"] += count
+
+
+def get_tag_info(tag):
+    """통계에 표시할 태그 정보 (태그가 없거나 이름이 비어 있으면 None)"""
+    if tag and tag.name:
+        return {"name": tag.name, "color": tag.color or UNCLASSIFIED_TAG_COLOR}
+    return None
+
+
+def empty_day_summaries(start_date, end_date):
+    """기간 내 모든 날짜의 빈 DaySummary dict (날짜 순)"""
+    total_days = (end_date - start_date).days + 1
+    summaries = {}
+    for day_index in range(total_days):
+        date_item = start_date + timedelta(days=day_index)
+        summaries[date_item] = DaySummary(date_item)
+    return summaries
+
+
+def rollup_day_summaries(user, start_date, end_date):
+    """일별 태그 집계(DailyTagRollup)에서 DaySummary 생성 (최대 일수×태그 수 행)"""
+    summaries = empty_day_summaries(start_date, end_date)
+    rollups = DailyTagRollup.objects.filter(
+        user=user, date__range=[start_date, end_date]
+    ).select_related("tag")
+    for rollup in rollups:
+        summaries[rollup.date].add(get_tag_info(rollup.tag), rollup.slot_count)
+    return summaries
+
+
+def python_day_summaries(user, start_date, end_date):
+    """원본 시간 기록을 블록 단위로 순회하여 DaySummary 생성"""
+    summaries = empty_day_summaries(start_date, end_date)
+    rows = list(get_timeblock_storage().iter_rows(user.id, start_date, end_date))
+    tags = Tag.objects.in_bulk({tag_id for _, _, tag_id in rows if tag_id})
+    for date_item, _, tag_id in rows:
+        summaries[date_item].add(get_tag_info(tags.get(tag_id)))
+    return summaries
+
+
+def numpy_day_summaries(user, start_date, end_date):
+    """
+    원본 (date, slot_index, tag_id)를 NumPy 배열로 받아 벡터 연산으로 DaySummary 생성
+    - 날짜×태그 슬롯 수: bincount
+    - 날짜×태그 첫 슬롯: minimum.at (표시 순서 유지용)
+    """
+    try:
+        import numpy as np
+    except ImportError as exc:
+        raise ImproperlyConfigured(
+            "numpy 집계 백엔드를 사용하려면 numpy를 설치해야 합니다."
+        ) from exc
+
+    summaries = empty_day_summaries(start_date, end_date)
+    rows = list(get_timeblock_storage().iter_rows(user.id, start_date, end_date))
+    if not rows:
+        return summaries
+
+    dates, slot_indexes, tag_ids = zip(*rows)
+    total_days = len(summaries)
+    day_index = (
+        np.array(dates, dtype="datetime64[D]") - np.datetime64(start_date, "D")
+    ).astype(np.int64)
+    slot_indexes = np.array(slot_indexes, dtype=np.int64)
+    # 삭제된 태그(None)는 NaN으로 변환되어 태그 집계에서 제외
+    tag_ids = np.array(tag_ids, dtype=np.float64)
+    tagged = ~np.isnan(tag_ids)
+
+    recorded = np.bincount(day_index, minlength=total_days)
+    unique_tag_ids, tag_index = np.unique(
+        tag_ids[tagged].astype(np.int64), return_inverse=True
+    )
+    tag_count = len(unique_tag_ids)
+    cells = day_index[tagged] * tag_count + tag_index
+    counts = np.bincount(cells, minlength=total_days * tag_count)
+    first_slots = np.full(total_days * tag_count, TOTAL_SLOTS_PER_DAY, dtype=np.int64)
+    np.minimum.at(first_slots, cells, slot_indexes[tagged])
+
+    tag_infos = {
+        tag.id: get_tag_info(tag)
+        for tag in Tag.objects.filter(id__in=unique_tag_ids.tolist())
+    }
+    filled_cells = np.flatnonzero(counts)
+    filled_cells = filled_cells[
+        np.lexsort((first_slots[filled_cells], filled_cells // max(tag_count, 1)))
+    ]
+    date_list = list(summaries)
+    for cell in filled_cells.tolist():
+        day, tag = divmod(cell, tag_count)
+        summaries[date_list[day]].add(
+            tag_infos.get(int(unique_tag_ids[tag])), int(counts[cell])
+        )
+
+    # 태그가 삭제된 블록은 기록 슬롯 수에만 반영
+    tagged_per_day = np.bincount(day_index[tagged], minlength=total_days)
+    for day in np.flatnonzero(recorded - tagged_per_day).tolist():
+        summaries[date_list[day]].add(None, int(recorded[day] - tagged_per_day[day]))
+    return summaries
+
+
+def sql_day_summaries(user, start_date, end_date):
+    """
+    DB에서 (date, tag_id)별 슬롯 수/첫 슬롯을 GROUP BY로 집계하여 DaySummary 생성
+    - 전송 행 수: 블록 수(하루 최대 144) → 날짜×태그 수
+    - 태그가 삭제된 블록(tag_id가 NULL)도 한 그룹으로 집계되어 기록 슬롯 수에 반영
+    """
+    if get_timeblock_storage().name != "rows":
+        raise ImproperlyConfigured(
+            "sql 집계 백엔드는 TIMEBLOCK_STORAGE가 rows일 때만 사용할 수 있습니다."
+        )
+    summaries = empty_day_summaries(start_date, end_date)
+    rows = (
+        TimeBlock.objects.filter(user=user, date__range=[start_date, end_date])
+        .values("date", "tag_id", "tag__name", "tag__color")
+        .annotate(blocks=Count("id"), first_slot=Min("slot_index"))
+        .order_by("date", "first_slot")
+    )
+    for row in rows:
+        tag_info = None
+        if row["tag__name"]:
+            tag_info = {
+                "name": row["tag__name"],
+                "color": row["tag__color"] or UNCLASSIFIED_TAG_COLOR,
+            }
+        summaries[row["date"]].add(tag_info, row["blocks"])
+    return summaries
+
+
+AGGREGATION_BACKENDS = {
+    "rollup": rollup_day_summaries,
+    "python": python_day_summaries,
+    "numpy": numpy_day_summaries,
+    "sql": sql_day_summaries,
+}
+
+
+def get_aggregation_backend(name=None):
+    """이름(기본값: settings.STATS_AGGREGATION_BACKEND)에 해당하는 집계 함수 반환"""
+    name = name or getattr(
+        settings, "STATS_AGGREGATION_BACKEND", DEFAULT_AGGREGATION_BACKEND
+    )
+    try:
+        return AGGREGATION_BACKENDS[name]
+    except KeyError:
+        raise ImproperlyConfigured(
+            f"알 수 없는 통계 집계 백엔드입니다: {name} "
+            f"(사용 가능: {', '.join(AGGREGATION_BACKENDS)})"
+        )
@@ -0,0 +1,10 @@
+from django.urls import path
+from . import views
+
+app_name = "stats_api"
+
+urlpatterns = [
+    # 통계 탭 API (탭을 열 때 불러옴)
+    path("stats/feedback/", views.stats_feedback_api, name="stats_feedback_api"),
+    path("stats/<slug:tab>/", views.stats_section_api, name="stats_section_api"),
+]
@@ -0,0 +1,82 @@
+"""
+통계 벤치마크 (manage.py benchmark stats_backends)
+- 합성 사용자(1년/5년)에 대해 집계 백엔드별 통계 계산 시간과 DB 전송 행 수 비교
+"""
+
+from datetime import date, timedelta
+
+from apps.core.synthetic import create_synthetic_user, measure, rolled_back
+from apps.dashboard.models import TimeBlock
+from .models import DailyTagRollup
+from .aggregation import AGGREGATION_BACKENDS, get_aggregation_backend
+from .logic import (
+    StatsCalculator,
+    get_weekly_stats_data,
+    get_monthly_stats_data,
+    get_tag_analysis_data,
+)
+
+
+def _available_backends():
+    backends = list(AGGREGATION_BACKENDS)
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        backends.remove("numpy")
+    return backends
+
+
+def _transferred_rows(backend, user, start_date, end_date):
+    """집계 백엔드가 기간 집계를 위해 DB에서 받아오는 행 수"""
+    if backend == "rollup":
+        return DailyTagRollup.objects.filter(
+            user=user, date__range=[start_date, end_date]
+        ).count()
+    blocks = TimeBlock.objects.filter(user=user, date__range=[start_date, end_date])
+    if backend == "sql":
+        return blocks.values("date", "tag_id").order_by().distinct().count()
+    return blocks.count()
+
+
+def stats_backends(options):
+    """
+    집계 백엔드별로 두 가지 작업을 측정
+    - month: 통계 페이지의 주간/월간/태그 분석 계산
+    - history: 전체 기록 기간의 일별 집계
+    rows는 각 작업의 집계 범위에서 DB가 전송하는 행 수
+    """
+    results = []
+    end_date = date.today()
+    for years in options["years"]:
+        with rolled_back():
+            user = create_synthetic_user(f"bench_stats_{years}y", years, end_date)
+            start_date = end_date - timedelta(days=int(365 * years) - 1)
+            for backend in _available_backends():
+
+                def month_stats():
+                    calculator = StatsCalculator(user, end_date, backend=backend)
+                    get_weekly_stats_data(user, end_date, calculator)
+                    get_monthly_stats_data(user, end_date, calculator)
+                    get_tag_analysis_data(user, end_date, calculator)
+
+                calculator = StatsCalculator(user, end_date)
+                month_range = (calculator.start_of_range, calculator.end_of_range)
+                aggregate_days = get_aggregation_backend(backend)
+                for task, func, task_range in (
+                    ("month", month_stats, month_range),
+                    (
+                        "history",
+                        lambda: aggregate_days(user, start_date, end_date),
+                        (start_date, end_date),
+                    ),
+                ):
+                    results.append(
+                        {
+                            "years": years,
+                            "backend": backend,
+                            "task": task,
+                            "rows": _transferred_rows(backend, user, *task_range),
+                            **measure(func, repeat=options["repeat"]),
+                        }
+                    )
+    return results
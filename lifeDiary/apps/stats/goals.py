@@ -0,0 +1,85 @@
+"""
+목표 달성률 계산
+- 사용자의 목표에서 (태그, 기간) 쌍을 모아 기간마다 한 번의 그룹 집계 쿼리로 실제 시간 계산
+- 통계 섹션 전체를 만들지 않고 일별 태그 집계(DailyTagRollup)의 슬롯 수만 합산
+"""
+
+from django.db.models import Sum
+
+from apps.core.utils import (
+    MINUTES_PER_SLOT,
+    get_week_date_range,
+    get_month_date_range,
+)
+from .models import DailyTagRollup
+
+
+class GoalProgressService:
+    """
+    기준 날짜의 목표 달성률 계산
+
+    Args:
+        user: 사용자
+        selected_date (date): 기준 날짜 (일간: 당일, 주간: 해당 주, 월간: 해당 월)
+    """
+
+    def __init__(self, user, selected_date):
+        self.user = user
+        self.selected_date = selected_date
+
+    def get_period_range(self, period):
+        """기간 종류("daily", "weekly", "monthly")의 (시작일, 종료일)"""
+        if period == "weekly":
+            return get_week_date_range(self.selected_date)
+        if period == "monthly":
+            return get_month_date_range(self.selected_date)
+        return self.selected_date, self.selected_date
+
+    def get_actual_hours(self, goals):
+        """
+        목표들의 실제 기록 시간
+
+        Returns:
+            dict: (태그 ID, 기간 종류) → 시간 (소수점 첫째 자리)
+        """
+        tag_ids_by_period = {}
+        for goal in goals:
+            tag_ids_by_period.setdefault(goal.period, set()).add(goal.tag_id)
+
+        actual_hours = {}
+        for period, tag_ids in tag_ids_by_period.items():
+            slot_counts = (
+                DailyTagRollup.objects.filter(
+                    user=self.user,
+                    date__range=self.get_period_range(period),
+                    tag_id__in=tag_ids,
+                )
+                .order_by()
+                .values("tag_id")
+                .annotate(slots=Sum("slot_count"))
+            )
+            for row in slot_counts:
+                actual_hours[(row["tag_id"], period)] = round(
+                    row["slots"] * MINUTES_PER_SLOT / 60, 1
+                )
+        return actual_hours
+
+    def apply(self, goals):
+        """
+        목표마다 actual(실제 시간)과 percent(달성률, 목표 시간이 0이면 None) 설정
+
+        Returns:
+            list: 달성률이 설정된 목표 목록
+        """
+        goals = list(goals)
+        actual_hours = self.get_actual_hours(goals)
+        for goal in goals:
+            actual = actual_hours.get((goal.tag_id, goal.period), 0)
+            # 사용자가 입력한 목표 시간을 그대로 사용 (기간 총 시간)
+            goal.percent = (
+                int((actual / goal.target_hours) * 100)
+                if goal.target_hours > 0
+                else None
+            )
+            goal.actual = actual
+        return goals
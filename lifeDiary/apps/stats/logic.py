@@ -1,5 +1,10 @@
+import logging
+import time
+from collections.abc import MutableMapping
 from datetime import timedelta
-from apps.dashboard.models import TimeBlock
+from functools import partial
+
+from apps.dashboard.storage import get_timeblock_storage
 from apps.core.utils import (
     serialize_for_js,
     get_week_date_range,
@@ -11,21 +16,62 @@ from apps.core.utils import (
     SLOTS_PER_HOUR,
     MINUTES_PER_SLOT,
 )
+from apps.core.cache import stats_cache
+from apps.core.metrics import get_histogram
 from apps.users.models import UserGoal, UserNote
+from .aggregation import get_aggregation_backend, get_tag_info
+from .goals import GoalProgressService
+
+logger = logging.getLogger(__name__)
+
+# 통계 섹션 계산 시간 (캐시에 없어 새로 계산한 경우만, /metrics)
+section_timing_histogram = get_histogram(
+    "stats_section_compute", "통계 섹션 계산 시간", labels=("section",)
+)
 
 
 # --- 통계 계산기 ---
 class StatsCalculator:
-    def __init__(self, user, selected_date):
+    def __init__(self, user, selected_date, backend=None):
         self.user = user
         self.selected_date = selected_date
+        # 일별 집계 백엔드 (기본값: settings.STATS_AGGREGATION_BACKEND)
+        self.aggregate_days = get_aggregation_backend(backend)
         self.start_of_month, self.end_of_month = get_month_date_range(selected_date)
         self.start_of_week, self.end_of_week = get_week_date_range(selected_date)
+        # 주간/월간 통계가 함께 쓰는 조회 범위 (월 경계에 걸친 주 포함)
+        self.start_of_range = min(self.start_of_week, self.start_of_month)
+        self.end_of_range = max(self.end_of_week, self.end_of_month)
+        self._day_summaries = None
+
+    def get_blocks(self, date_item):
+        """해당 날짜의 원본 시간 기록 목록 (최대 144개, slot_index/tag를 가진 SlotEntry)"""
+        return get_timeblock_storage().get_day(self.user, date_item)
+
+    def load_day_summaries(self, start_date, end_date):
+        """기간 내 날짜별 DaySummary를 집계 백엔드로 한 번에 조회"""
+        return self.aggregate_days(self.user, start_date, end_date)
+
+    def get_day_summary(self, date_item):
+        """해당 날짜의 DaySummary (주간+월간 범위는 한 번에 조회)"""
+        if not self.start_of_range <= date_item <= self.end_of_range:
+            return self.load_day_summaries(date_item, date_item)[date_item]
+        if self._day_summaries is None:
+            self._day_summaries = self.load_day_summaries(
+                self.start_of_range, self.end_of_range
+            )
+        return self._day_summaries[date_item]
+
+    def get_day_summaries(self, start_date, end_date):
+        """기간 내 날짜별 DaySummary 목록 (기록 없는 날 포함)"""
+        total_days = (end_date - start_date).days + 1
+        return [
+            self.get_day_summary(start_date + timedelta(days=day_index))
+            for day_index in range(total_days)
+        ]
 
     def get_tag_info(self, block):
-        if block.tag and block.tag.name:
-            return {"name": block.tag.name, "color": block.tag.color or "#808080"}
-        return None
+        return get_tag_info(block.tag)
 
     def process_blocks_without_tag(self, blocks, process_func):
         for block in blocks:
@@ -94,10 +140,9 @@ class StatsCalculator:
                 self.add_unclassified_to_hourly_stats(hourly_stats, hour, empty_minutes)
 
     def fill_empty_slots_weekly(
-        self, daily_blocks, daily_tag_stats, tag_weekly_stats, date_item
+        self, day_summary, daily_tag_stats, tag_weekly_stats, date_item
     ):
-        recorded_blocks = len(daily_blocks)
-        empty_blocks = TOTAL_SLOTS_PER_DAY - recorded_blocks
+        empty_blocks = TOTAL_SLOTS_PER_DAY - day_summary.recorded_blocks
         empty_minutes = empty_blocks * MINUTES_PER_SLOT
         if empty_minutes > 0:
             self.add_unclassified_data(
@@ -108,13 +153,10 @@ class StatsCalculator:
                 tag_weekly_stats, empty_minutes, day_index, data_type="weekly"
             )
 
-    def fill_empty_slots_monthly(self, user, daily_tag_stats, daily_totals, total_days):
-        for day_index in range(total_days):
-            current_date = self.start_of_month + timedelta(days=day_index)
-            recorded_blocks = TimeBlock.objects.filter(
-                user=user, date=current_date
-            ).count()
-            empty_blocks = TOTAL_SLOTS_PER_DAY - recorded_blocks
+    def fill_empty_slots_monthly(self, day_summaries, daily_tag_stats, daily_totals):
+        total_days = len(day_summaries)
+        for day_index, day_summary in enumerate(day_summaries):
+            empty_blocks = TOTAL_SLOTS_PER_DAY - day_summary.recorded_blocks
             if empty_blocks > 0:
                 empty_hours = empty_blocks * MINUTES_PER_SLOT / 60
                 if UNCLASSIFIED_TAG_NAME not in daily_tag_stats:
@@ -130,14 +172,9 @@ class StatsCalculator:
                 daily_tag_stats[UNCLASSIFIED_TAG_NAME]["total_hours"] += empty_hours
                 daily_totals[day_index] += empty_hours
 
-    def fill_empty_slots_analysis(self, user, tag_analysis_data):
-        total_days = (self.end_of_month - self.start_of_month).days + 1
-        for day_index in range(total_days):
-            current_date = self.start_of_month + timedelta(days=day_index)
-            recorded_blocks = TimeBlock.objects.filter(
-                user=user, date=current_date
-            ).count()
-            empty_blocks = TOTAL_SLOTS_PER_DAY - recorded_blocks
+    def fill_empty_slots_analysis(self, day_summaries, tag_analysis_data):
+        for day_summary in day_summaries:
+            empty_blocks = TOTAL_SLOTS_PER_DAY - day_summary.recorded_blocks
             if empty_blocks > 0:
                 empty_minutes = empty_blocks * MINUTES_PER_SLOT
                 self.add_unclassified_data(
@@ -146,9 +183,7 @@ class StatsCalculator:
 
 
 def get_daily_stats_data(user, selected_date, calculator):
-    time_blocks = TimeBlock.objects.filter(
-        user=user, date=selected_date
-    ).select_related("tag")
+    time_blocks = calculator.get_blocks(selected_date)
     tag_stats = {}
     hourly_stats = [{} for _ in range(24)]
     active_blocks_count = 0
@@ -205,40 +240,32 @@ def get_daily_stats_data(user, selected_date, calculator):
 
 
 def get_weekly_stats_data(user, selected_date, calculator):
-    week_dates = [calculator.start_of_week + timedelta(days=i) for i in range(7)]
+    week_summaries = calculator.get_day_summaries(
+        calculator.start_of_week, calculator.end_of_week
+    )
+    week_dates = [summary.date for summary in week_summaries]
     weekly_data = []
     tag_weekly_stats = {}
     excluded_tags = {SLEEP_TAG_NAME, UNCLASSIFIED_TAG_NAME}
-    for date_item in week_dates:
-        daily_blocks = TimeBlock.objects.filter(
-            user=user, date=date_item
-        ).select_related("tag")
+    for day_index, day_summary in enumerate(week_summaries):
+        date_item = day_summary.date
         daily_tag_stats = {}
         active_blocks_count = 0
-        active_minutes = 0
-
-        def process_block(block, tag_info):
-            nonlocal active_blocks_count, active_minutes
-            tag_name = tag_info["name"]
-            tag_color = tag_info["color"]
-            if tag_name not in daily_tag_stats:
-                daily_tag_stats[tag_name] = 0
-            daily_tag_stats[tag_name] += MINUTES_PER_SLOT
+        for tag_name, tag_data in day_summary.tag_blocks.items():
+            minutes = tag_data["blocks"] * MINUTES_PER_SLOT
+            daily_tag_stats[tag_name] = minutes
             if tag_name not in excluded_tags:
-                active_blocks_count += 1
-                active_minutes += 10
+                active_blocks_count += tag_data["blocks"]
             if tag_name not in tag_weekly_stats:
                 tag_weekly_stats[tag_name] = {
                     "name": tag_name,
-                    "color": tag_color,
+                    "color": tag_data["color"],
                     "daily_minutes": [0] * 7,
                 }
-            day_index = (date_item - calculator.start_of_week).days
-            tag_weekly_stats[tag_name]["daily_minutes"][day_index] += 10
-
-        calculator.process_blocks_without_tag(daily_blocks, process_block)
+            tag_weekly_stats[tag_name]["daily_minutes"][day_index] += minutes
+        active_minutes = active_blocks_count * MINUTES_PER_SLOT
         calculator.fill_empty_slots_weekly(
-            daily_blocks, daily_tag_stats, tag_weekly_stats, date_item
+            day_summary, daily_tag_stats, tag_weekly_stats, date_item
         )
         weekly_data.append(
             {
@@ -250,7 +277,9 @@ def get_weekly_stats_data(user, selected_date, calculator):
                 "total_blocks": active_blocks_count,
                 "total_minutes": active_minutes,
                 "total_hours": round(active_minutes / 60, 1),
-                "fill_percentage": round((len(daily_blocks) / 144) * 100, 1),
+                "fill_percentage": round(
+                    (day_summary.recorded_blocks / TOTAL_SLOTS_PER_DAY) * 100, 1
+                ),
                 "tag_stats": daily_tag_stats,
             }
         )
@@ -275,31 +304,27 @@ def get_weekly_stats_data(user, selected_date, calculator):
 
 
 def get_monthly_stats_data(user, selected_date, calculator):
-    monthly_blocks = TimeBlock.objects.filter(
-        user=user, date__range=[calculator.start_of_month, calculator.end_of_month]
-    ).select_related("tag")
-    total_days = (calculator.end_of_month - calculator.start_of_month).days + 1
+    month_summaries = calculator.get_day_summaries(
+        calculator.start_of_month, calculator.end_of_month
+    )
+    total_days = len(month_summaries)
     daily_tag_stats = {}
     daily_totals = [0] * total_days
-
-    def process_block(block, tag_info):
-        tag_name = tag_info["name"]
-        tag_color = tag_info["color"]
-        day_index = (block.date - calculator.start_of_month).days
-        if tag_name not in daily_tag_stats:
-            daily_tag_stats[tag_name] = {
-                "name": tag_name,
-                "color": tag_color,
-                "daily_hours": [0] * total_days,
-                "total_hours": 0,
-            }
-        hours_increment = MINUTES_PER_SLOT / 60
-        daily_tag_stats[tag_name]["daily_hours"][day_index] += hours_increment
-        daily_tag_stats[tag_name]["total_hours"] += hours_increment
-        daily_totals[day_index] += hours_increment
-
-    calculator.process_blocks_without_tag(monthly_blocks, process_block)
-    calculator.fill_empty_slots_monthly(user, daily_tag_stats, daily_totals, total_days)
+    hours_per_block = MINUTES_PER_SLOT / 60
+    for day_index, day_summary in enumerate(month_summaries):
+        for tag_name, tag_data in day_summary.tag_blocks.items():
+            if tag_name not in daily_tag_stats:
+                daily_tag_stats[tag_name] = {
+                    "name": tag_name,
+                    "color": tag_data["color"],
+                    "daily_hours": [0] * total_days,
+                    "total_hours": 0,
+                }
+            hours = tag_data["blocks"] * hours_per_block
+            daily_tag_stats[tag_name]["daily_hours"][day_index] += hours
+            daily_tag_stats[tag_name]["total_hours"] += hours
+            daily_totals[day_index] += hours
+    calculator.fill_empty_slots_monthly(month_summaries, daily_tag_stats, daily_totals)
     for tag_data in daily_tag_stats.values():
         tag_data["daily_hours"] = [round(h, 1) for h in tag_data["daily_hours"]]
         tag_data["total_hours"] = round(tag_data["total_hours"], 1)
@@ -336,26 +361,24 @@ def get_monthly_stats_data(user, selected_date, calculator):
 
 
 def get_tag_analysis_data(user, selected_date, calculator):
-    monthly_blocks = TimeBlock.objects.filter(
-        user=user, date__range=[calculator.start_of_month, calculator.end_of_month]
-    ).select_related("tag")
+    month_summaries = calculator.get_day_summaries(
+        calculator.start_of_month, calculator.end_of_month
+    )
     tag_analysis_data = {}
-
-    def process_block(block, tag_info):
-        tag_name = tag_info["name"]
-        tag_color = tag_info["color"]
-        if tag_name not in tag_analysis_data:
-            tag_analysis_data[tag_name] = {
-                "name": tag_name,
-                "color": tag_color,
-                "total_minutes": 0,
-                "total_blocks": 0,
-            }
-        tag_analysis_data[tag_name]["total_minutes"] += MINUTES_PER_SLOT
-        tag_analysis_data[tag_name]["total_blocks"] += 1
-
-    calculator.process_blocks_without_tag(monthly_blocks, process_block)
-    calculator.fill_empty_slots_analysis(user, tag_analysis_data)
+    for day_summary in month_summaries:
+        for tag_name, tag_data in day_summary.tag_blocks.items():
+            if tag_name not in tag_analysis_data:
+                tag_analysis_data[tag_name] = {
+                    "name": tag_name,
+                    "color": tag_data["color"],
+                    "total_minutes": 0,
+                    "total_blocks": 0,
+                }
+            tag_analysis_data[tag_name]["total_minutes"] += (
+                tag_data["blocks"] * MINUTES_PER_SLOT
+            )
+            tag_analysis_data[tag_name]["total_blocks"] += tag_data["blocks"]
+    calculator.fill_empty_slots_analysis(month_summaries, tag_analysis_data)
     analysis_list = []
     for tag_name, data in tag_analysis_data.items():
         analysis_list.append(
@@ -372,90 +395,177 @@ def get_tag_analysis_data(user, selected_date, calculator):
     return sorted(analysis_list, key=lambda x: x["total_hours"], reverse=True)
 
 
-def get_stats_context(user, selected_date):
-    # --- 통계 계산기 ---
-    calculator = StatsCalculator(user, selected_date)
-    daily_stats = get_daily_stats_data(user, selected_date, calculator)
-    weekly_stats = get_weekly_stats_data(user, selected_date, calculator)
-    monthly_stats = get_monthly_stats_data(user, selected_date, calculator)
-    tag_analysis = get_tag_analysis_data(user, selected_date, calculator)
-    daily_stats_for_js = {
-        "tag_stats": daily_stats["tag_stats"],
-        "hourly_stats": daily_stats["hourly_stats"],
-    }
-    weekly_stats_for_js = {
-        "weekly_data": [
-            {"day_korean": day["day_korean"], "total_hours": day["total_hours"]}
-            for day in weekly_stats["weekly_data"]
-        ],
-        "tag_weekly_stats": weekly_stats["tag_weekly_stats"],
-    }
-    context = {
-        "page_title": "통계",
-        "selected_date": selected_date,
-        "total_blocks": len(daily_stats["tag_stats"]),
-        "total_days": monthly_stats["total_days"],
-        "total_hours": monthly_stats["total_hours"],
-        "daily_stats": daily_stats,
-        "weekly_stats": weekly_stats,
-        "monthly_stats": monthly_stats,
-        "tag_analysis": tag_analysis,
-        "daily_stats_json": serialize_for_js(daily_stats_for_js),
-        "weekly_stats_json": serialize_for_js(weekly_stats_for_js),
-        "tag_analysis_json": serialize_for_js(tag_analysis),
-        "monthly_stats_json": serialize_for_js(
-            {
-                "day_labels": monthly_stats["day_labels"],
-                "tag_stats": monthly_stats["tag_stats"],
-                "daily_totals": monthly_stats["daily_totals"],
-            }
-        ),
+# 통계 섹션 → (계산 함수, 캐시 기간 시작일 속성)
+STATS_SECTIONS = {
+    "daily": (get_daily_stats_data, "selected_date"),
+    "weekly": (get_weekly_stats_data, "start_of_week"),
+    "monthly": (get_monthly_stats_data, "start_of_month"),
+    "analysis": (get_tag_analysis_data, "start_of_month"),
+}
+
+
+def get_stats_sections(
+    user, selected_date, sections=tuple(STATS_SECTIONS), calculator=None
+):
+    """
+    통계 섹션들을 사용자별 버전 캐시에서 조회 (없거나 데이터가 바뀐 섹션만 계산)
+
+    Args:
+        user: 사용자
+        selected_date (date): 기준 날짜
+        sections (iterable): 조회할 섹션 이름 ("daily", "weekly", "monthly", "analysis")
+        calculator (StatsCalculator): 여러 번 호출할 때 일별 집계를 공유할 계산기
+
+    Returns:
+        dict: 섹션 이름 → 통계 데이터
+    """
+    calculator = calculator or StatsCalculator(user, selected_date)
+
+    def compute(section):
+        stats_func, _ = STATS_SECTIONS[section]
+        started = time.perf_counter()
+        try:
+            return stats_func(user, selected_date, calculator)
+        finally:
+            section_timing_histogram.observe(
+                (time.perf_counter() - started) * 1000, section=section
+            )
+
+    periods = {
+        section: getattr(calculator, STATS_SECTIONS[section][1]) for section in sections
     }
-    user_goals_daily = UserGoal.objects.filter(
-        user=user, period="daily"
-    ).select_related("tag")
-    user_goals_weekly = UserGoal.objects.filter(
-        user=user, period="weekly"
-    ).select_related("tag")
-    user_goals_monthly = UserGoal.objects.filter(
-        user=user, period="monthly"
-    ).select_related("tag")
-    context["user_goals_daily"] = user_goals_daily
-    context["user_goals_weekly"] = user_goals_weekly
-    context["user_goals_monthly"] = user_goals_monthly
-    today = selected_date
-    for goal in user_goals_daily:
-        actual = 0
-        for tag_stat in daily_stats["tag_stats"]:
-            if tag_stat["name"] == goal.tag.name:
-                actual = tag_stat["hours"]
-        percent = (
-            int((actual / goal.target_hours) * 100) if goal.target_hours > 0 else None
-        )
-        goal.percent = percent
-        goal.actual = actual
-    for goal in user_goals_weekly:
-        actual = 0
-        for tag_stat in weekly_stats["tag_weekly_stats"]:
-            if tag_stat["name"] == goal.tag.name:
-                actual = tag_stat["total_hours"]
-        # 사용자가 입력한 목표 시간을 그대로 사용 (주간 총 시간)
-        percent = (
-            int((actual / goal.target_hours) * 100) if goal.target_hours > 0 else None
-        )
-        goal.percent = percent
-        goal.actual = actual
-    for goal in user_goals_monthly:
-        actual = 0
-        for tag_stat in monthly_stats["tag_stats"]:
-            if tag_stat["name"] == goal.tag.name:
-                actual = tag_stat["total_hours"]
-        # 사용자가 입력한 목표 시간을 그대로 사용 (월간 총 시간)
-        percent = (
-            int((actual / goal.target_hours) * 100) if goal.target_hours > 0 else None
-        )
-        goal.percent = percent
-        goal.actual = actual
-    user_note = UserNote.objects.filter(user=user).order_by("-created_at").first()
-    context["user_note"] = user_note
-    return context
+    return stats_cache.get_or_compute(user.id, periods, compute)
+
+
+# 통계 페이지 탭 → (통계 섹션, 템플릿 컨텍스트 이름)
+STATS_TABS = {
+    "daily": ("daily", "daily_stats"),
+    "weekly": ("weekly", "weekly_stats"),
+    "monthly": ("monthly", "monthly_stats"),
+    "tags": ("analysis", "tag_analysis"),
+}
+
+
+def get_section_js_data(section, data):
+    """차트 렌더링에 필요한 부분만 추린 섹션 데이터 (JS 전달용)"""
+    if section == "daily":
+        return {
+            "tag_stats": data["tag_stats"],
+            "hourly_stats": data["hourly_stats"],
+        }
+    if section == "weekly":
+        return {
+            "weekly_data": [
+                {"day_korean": day["day_korean"], "total_hours": day["total_hours"]}
+                for day in data["weekly_data"]
+            ],
+            "tag_weekly_stats": data["tag_weekly_stats"],
+        }
+    if section == "monthly":
+        return {
+            "day_labels": data["day_labels"],
+            "tag_stats": data["tag_stats"],
+            "daily_totals": data["daily_totals"],
+        }
+    return data
+
+
+class LazyStatsContext(MutableMapping):
+    """
+    통계 컨텍스트 - 키에 처음 접근할 때 계산하고 결과를 보관 (memoize)
+    - 템플릿 분기나 generate_feedback이 실제로 읽는 섹션/목표/특이사항만 계산
+    - 키별 계산 시간(ms)을 timings에 기록 (의존하는 키의 계산 시간은 제외)
+    - 템플릿에는 as_template_context()로 전달 (Django 템플릿은 dict만 허용)
+    """
+
+    def __init__(self, user, selected_date, **values):
+        self.user = user
+        self.selected_date = selected_date
+        self.calculator = StatsCalculator(user, selected_date)
+        self.timings = {}
+        self._values = {"page_title": "통계", "selected_date": selected_date}
+        self._values.update(values)
+
+        # 키 → (먼저 계산할 키 목록, 계산 함수)
+        self._loaders = {
+            "total_blocks": (["daily_stats"], lambda daily: len(daily["tag_stats"])),
+            "total_days": (["monthly_stats"], lambda monthly: monthly["total_days"]),
+            "total_hours": (["monthly_stats"], lambda monthly: monthly["total_hours"]),
+            "user_note": ([], self._load_user_note),
+        }
+        for section, context_name in STATS_TABS.values():
+            self._loaders[context_name] = ([], partial(self._load_section, section))
+            self._loaders[f"{context_name}_json"] = (
+                [context_name],
+                partial(self._load_section_json, section),
+            )
+        # 목표는 한 번에 조회/계산한 뒤 기간별로 나눔
+        self._loaders["user_goals"] = ([], self._load_goals)
+        for period in ("daily", "weekly", "monthly"):
+            self._loaders[f"user_goals_{period}"] = (
+                ["user_goals"],
+                partial(self._filter_goals, period),
+            )
+
+    def _load_section(self, section):
+        return get_stats_sections(
+            self.user, self.selected_date, [section], self.calculator
+        )[section]
+
+    def _load_section_json(self, section, data):
+        return serialize_for_js(get_section_js_data(section, data))
+
+    def _load_goals(self):
+        goals = UserGoal.objects.filter(user=self.user).select_related("tag")
+        return GoalProgressService(self.user, self.selected_date).apply(goals)
+
+    def _filter_goals(self, period, goals):
+        return [goal for goal in goals if goal.period == period]
+
+    def _load_user_note(self):
+        return UserNote.objects.filter(user=self.user).order_by("-created_at").first()
+
+    def __getitem__(self, key):
+        if key in self._values:
+            return self._values[key]
+        if key not in self._loaders:
+            raise KeyError(key)
+        dependencies, loader = self._loaders[key]
+        args = [self[dependency] for dependency in dependencies]
+        started = time.perf_counter()
+        value = loader(*args)
+        self.timings[key] = round((time.perf_counter() - started) * 1000, 2)
+        logger.debug("stats context %s: %.2fms", key, self.timings[key])
+        self._values[key] = value
+        return value
+
+    def __setitem__(self, key, value):
+        self._values[key] = value
+
+    def __delitem__(self, key):
+        del self._values[key]
+
+    def __iter__(self):
+        return iter(dict.fromkeys([*self._values, *self._loaders]))
+
+    def __len__(self):
+        return len(set(self._values) | set(self._loaders))
+
+    def as_template_context(self):
+        """
+        템플릿용 dict - 아직 계산하지 않은 키는 인자 없는 callable로 전달
+        (Django 템플릿은 변수를 참조할 때 callable을 호출하므로 사용한 키만 계산됨)
+        """
+        return {
+            key: (
+                self._values[key]
+                if key in self._values
+                else partial(self.__getitem__, key)
+            )
+            for key in self
+        }
+
+
+def get_stats_context(user, selected_date):
+    """통계 페이지/AI 피드백용 LazyStatsContext"""
+    return LazyStatsContext(user, selected_date)
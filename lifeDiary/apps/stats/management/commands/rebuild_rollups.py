@@ -0,0 +1,99 @@
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from apps.core.cache import bump_data_version
+from apps.dashboard.storage import get_timeblock_storage
+from apps.stats.models import DailyTagRollup
+from apps.stats.rollups import build_rollup_rows, iter_blocks_by_date
+
+
+class Command(BaseCommand):
+    help = "원본 시간 기록으로부터 일별 태그 집계(DailyTagRollup)를 다시 만들고 검증합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--user",
+            action="append",
+            dest="usernames",
+            help="대상 사용자명 (반복 가능)",
+        )
+        parser.add_argument(
+            "--verify",
+            action="store_true",
+            help="다시 만들지 않고 저장된 집계와 원본 데이터의 일치 여부만 검사",
+        )
+        parser.add_argument(
+            "--batch-size", type=int, default=1000, help="bulk_create 배치 크기"
+        )
+
+    def handle(self, *args, **options):
+        users = User.objects.order_by("id")
+        if options["usernames"]:
+            users = users.filter(username__in=options["usernames"])
+            missing = set(options["usernames"]) - set(
+                users.values_list("username", flat=True)
+            )
+            if missing:
+                raise CommandError(
+                    f"존재하지 않는 사용자: {', '.join(sorted(missing))}"
+                )
+
+        total_mismatches = 0
+        for user in users.iterator():
+            if not options["verify"]:
+                created = self.rebuild_user(user.id, options["batch_size"])
+                self.stdout.write(f"{user.username}: 집계 {created}건 생성")
+            mismatches = self.verify_user(user.id)
+            if mismatches:
+                total_mismatches += mismatches
+                self.stdout.write(
+                    self.style.WARNING(f"{user.username}: 불일치 {mismatches}건")
+                )
+
+        if total_mismatches:
+            raise CommandError(
+                f"원본 데이터와 불일치하는 집계가 {total_mismatches}건 있습니다."
+            )
+        self.stdout.write(
+            self.style.SUCCESS("일별 태그 집계가 원본 데이터와 일치합니다.")
+        )
+
+    def iter_expected_rows(self, user_id):
+        """원본 시간 기록을 날짜 순으로 읽으며 날짜별 집계 행 생성"""
+        blocks = get_timeblock_storage().iter_rows(user_id)
+        for _, day_blocks in iter_blocks_by_date(blocks):
+            yield from build_rollup_rows(day_blocks)
+
+    @transaction.atomic
+    def rebuild_user(self, user_id, batch_size):
+        DailyTagRollup.objects.filter(user_id=user_id).delete()
+        created = 0
+        batch = []
+        for row in self.iter_expected_rows(user_id):
+            batch.append(DailyTagRollup(user_id=user_id, **row))
+            if len(batch) >= batch_size:
+                DailyTagRollup.objects.bulk_create(batch)
+                created += len(batch)
+                batch = []
+        DailyTagRollup.objects.bulk_create(batch)
+        # 캐시된 통계가 다시 만든 집계로 계산되도록 데이터 버전 갱신 (커밋 후)
+        bump_data_version(user_id)
+        return created + len(batch)
+
+    def verify_user(self, user_id):
+        """저장된 집계와 원본 기준 집계를 비교하여 불일치 건수 반환"""
+        stored = {}
+        mismatches = 0
+        for rollup in DailyTagRollup.objects.filter(user_id=user_id):
+            key = (rollup.date, rollup.tag_id)
+            if key in stored:
+                # 태그 삭제 등으로 같은 (날짜, 태그) 행이 중복된 경우
+                mismatches += 1
+            stored[key] = (rollup.slot_count, rollup.first_slot, rollup.hourly_counts)
+        for row in self.iter_expected_rows(user_id):
+            key = (row["date"], row["tag_id"])
+            expected = (row["slot_count"], row["first_slot"], row["hourly_counts"])
+            if stored.pop(key, None) != expected:
+                mismatches += 1
+        return mismatches + len(stored)
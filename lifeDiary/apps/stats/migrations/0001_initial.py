@@ -0,0 +1,126 @@
+# Generated by Django 5.2.4 on 2026-10-17 22:29
+
+from itertools import groupby
+from operator import itemgetter
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+# 마이그레이션 시점의 값 (이후 앱 코드가 바뀌어도 이 마이그레이션의 동작은 고정)
+SLOTS_PER_HOUR = 6
+HOURS_PER_DAY = 24
+
+
+def build_rollup_rows(day_blocks):
+    """하루치 (date, slot_index, tag_id) 튜플(슬롯 순) → 태그별 집계 dict 목록"""
+    rows = {}
+    for date_item, slot_index, tag_id in day_blocks:
+        if tag_id not in rows:
+            rows[tag_id] = {
+                "date": date_item,
+                "tag_id": tag_id,
+                "slot_count": 0,
+                "first_slot": slot_index,
+                "hourly_counts": [0] * HOURS_PER_DAY,
+            }
+        rows[tag_id]["slot_count"] += 1
+        rows[tag_id]["hourly_counts"][slot_index // SLOTS_PER_HOUR] += 1
+    return rows.values()
+
+
+def backfill_rollups(apps, schema_editor):
+    """기존 TimeBlock으로부터 일별 태그 집계 생성"""
+    TimeBlock = apps.get_model("dashboard", "TimeBlock")
+    DailyTagRollup = apps.get_model("stats", "DailyTagRollup")
+    user_ids = TimeBlock.objects.order_by().values_list("user_id", flat=True).distinct()
+    for user_id in user_ids:
+        blocks = (
+            TimeBlock.objects.filter(user_id=user_id)
+            .order_by("date", "slot_index")
+            .values_list("date", "slot_index", "tag_id")
+            .iterator(chunk_size=5000)
+        )
+        rollups = []
+        for _, day_blocks in groupby(blocks, key=itemgetter(0)):
+            rollups.extend(
+                DailyTagRollup(user_id=user_id, **row)
+                for row in build_rollup_rows(day_blocks)
+            )
+            if len(rollups) >= 1000:
+                DailyTagRollup.objects.bulk_create(rollups)
+                rollups = []
+        DailyTagRollup.objects.bulk_create(rollups)
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ("dashboard", "0005_remove_timeblock_deleted_tag_name"),
+        ("tags", "0003_remove_tag_unique_user_tag_name_tag_is_default_and_more"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DailyTagRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("date", models.DateField(verbose_name="날짜")),
+                (
+                    "slot_count",
+                    models.PositiveSmallIntegerField(verbose_name="슬롯 수"),
+                ),
+                (
+                    "first_slot",
+                    models.PositiveSmallIntegerField(verbose_name="첫 슬롯"),
+                ),
+                (
+                    "hourly_counts",
+                    models.JSONField(default=list, verbose_name="시간대별 슬롯 수"),
+                ),
+                (
+                    "tag",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        to="tags.tag",
+                        verbose_name="태그",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="사용자",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "일별 태그 집계",
+                "verbose_name_plural": "일별 태그 집계들",
+                "ordering": ["date", "first_slot"],
+                "indexes": [
+                    models.Index(fields=["user", "date"], name="idx_rollup_user_date")
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("user", "date", "tag"),
+                        name="unique_user_date_tag_rollup",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(backfill_rollups, migrations.RunPython.noop),
+    ]
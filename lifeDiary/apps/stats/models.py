@@ -1,3 +1,42 @@
 from django.db import models
+from django.contrib.auth.models import User
+from apps.tags.models import Tag
 
 # Create your models here.
+
+
+class DailyTagRollup(models.Model):
+    """
+    사용자·날짜·태그별 슬롯 집계
+    - TimeBlock 생성/수정/삭제 및 태그 삭제 시 같은 트랜잭션에서 갱신
+    - tag가 null이면 태그가 삭제된 블록 (기록은 되어 있으나 태그 없음)
+    - first_slot: 해당 날짜에서 태그가 처음 등장한 슬롯 (통계 표시 순서 유지용)
+    - hourly_counts: 시간대(0~23)별 슬롯 수
+    """
+
+    user = models.ForeignKey(User, on_delete=models.CASCADE, verbose_name="사용자")
+    date = models.DateField(verbose_name="날짜")
+    tag = models.ForeignKey(
+        Tag, on_delete=models.SET_NULL, null=True, verbose_name="태그"
+    )
+    slot_count = models.PositiveSmallIntegerField(verbose_name="슬롯 수")
+    first_slot = models.PositiveSmallIntegerField(verbose_name="첫 슬롯")
+    hourly_counts = models.JSONField(default=list, verbose_name="시간대별 슬롯 수")
+
+    class Meta:
+        verbose_name = "일별 태그 집계"
+        verbose_name_plural = "일별 태그 집계들"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "date", "tag"],
+                name="unique_user_date_tag_rollup",
+            )
+        ]
+        ordering = ["date", "first_slot"]
+        indexes = [
+            models.Index(fields=["user", "date"], name="idx_rollup_user_date"),
+        ]
+
+    def __str__(self):
+        tag_name = self.tag.name if self.tag else "-"
+        return f"{self.user_id} - {self.date} {tag_name}: {self.slot_count}"
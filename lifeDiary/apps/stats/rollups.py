@@ -0,0 +1,78 @@
+"""
+일별 태그 집계(DailyTagRollup) 관리
+- 원본 시간 기록(apps.dashboard.storage)으로부터 집계 행을 계산하고 날짜 단위로 교체
+- 쓰기 경로(time_block_api, 태그 삭제)에서 같은 트랜잭션 안에서 호출
+"""
+
+from apps.dashboard.storage import get_timeblock_storage
+from apps.core.utils import BULK_WRITE_BATCH_SIZE, SLOTS_PER_HOUR, HOURS_PER_DAY
+from .models import DailyTagRollup
+
+
+def build_rollup_rows(blocks):
+    """
+    (date, slot_index, tag_id) 튜플을 날짜/태그별 집계로 변환
+
+    Args:
+        blocks: (date, slot_index, tag_id) 튜플 iterable (date, slot_index 순 정렬)
+
+    Returns:
+        list: {"date", "tag_id", "slot_count", "first_slot", "hourly_counts"} 목록
+    """
+    rows = {}
+    for date_item, slot_index, tag_id in blocks:
+        key = (date_item, tag_id)
+        if key not in rows:
+            rows[key] = {
+                "date": date_item,
+                "tag_id": tag_id,
+                "slot_count": 0,
+                "first_slot": slot_index,
+                "hourly_counts": [0] * HOURS_PER_DAY,
+            }
+        rows[key]["slot_count"] += 1
+        rows[key]["hourly_counts"][slot_index // SLOTS_PER_HOUR] += 1
+    return list(rows.values())
+
+
+def iter_blocks_by_date(blocks):
+    """정렬된 (date, slot_index, tag_id) 튜플을 날짜별 묶음으로 나눔"""
+    current_date = None
+    day_blocks = []
+    for block in blocks:
+        if block[0] != current_date and day_blocks:
+            yield current_date, day_blocks
+            day_blocks = []
+        current_date = block[0]
+        day_blocks.append(block)
+    if day_blocks:
+        yield current_date, day_blocks
+
+
+def refresh_daily_rollups(user_id, dates):
+    """
+    지정한 날짜들의 집계를 원본 시간 기록으로부터 다시 계산하여 교체
+
+    Args:
+        user_id (int): 사용자 ID
+        dates (iterable): 갱신할 날짜 목록
+    """
+    dates = set(dates)
+    if not dates:
+        return
+    blocks = get_timeblock_storage().iter_rows(user_id, dates=dates)
+    DailyTagRollup.objects.filter(user_id=user_id, date__in=dates).delete()
+    DailyTagRollup.objects.bulk_create(
+        [DailyTagRollup(user_id=user_id, **row) for row in build_rollup_rows(blocks)],
+        batch_size=BULK_WRITE_BATCH_SIZE,
+    )
+
+
+def get_rollup_days_for_tag(tag):
+    """태그를 사용 중인 (user_id, date) 목록을 사용자별로 묶어 반환"""
+    days_by_user = {}
+    for user_id, date_item in DailyTagRollup.objects.filter(tag=tag).values_list(
+        "user_id", "date"
+    ):
+        days_by_user.setdefault(user_id, set()).add(date_item)
+    return days_by_user
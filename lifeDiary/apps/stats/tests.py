@@ -0,0 +1,64 @@
+from datetime import date
+
+from django.test import TestCase, override_settings
+
+from apps.core.synthetic import create_synthetic_user
+from apps.core.cache import get_cache
+from apps.dashboard.storage import copy_rows_to_day_logs, get_timeblock_storage
+from .logic import STATS_SECTIONS, StatsCalculator, get_stats_sections
+
+
+class PerDayStatsCalculator(StatsCalculator):
+    """섹션/날짜마다 원본 시간 블록을 따로 조회하던 이전 방식 (비교 기준)"""
+
+    def __init__(self, user, selected_date):
+        super().__init__(user, selected_date, backend="python")
+
+    def get_day_summary(self, date_item):
+        return self.load_day_summaries(date_item, date_item)[date_item]
+
+
+@override_settings(STATS_AGGREGATION_BACKEND="rollup")
+class StatsSectionsTests(TestCase):
+    # 2025-03-01(토)의 주는 2025-02-24(월) ~ 2025-03-02(일)로 월 경계에 걸침
+    MONTH_BOUNDARY_DATE = date(2025, 3, 1)
+    MID_MONTH_DATE = date(2025, 3, 12)
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_synthetic_user("stats_test", 0.2, end_date=date(2025, 3, 31))
+        # 합성 데이터는 TimeBlock으로 생성하므로 daylog 저장소면 변환하여 저장
+        if get_timeblock_storage().name == "daylog":
+            copy_rows_to_day_logs(cls.user.id)
+
+    def setUp(self):
+        get_cache().clear()
+
+    def test_query_count(self):
+        for selected_date in (self.MONTH_BOUNDARY_DATE, self.MID_MONTH_DATE):
+            with self.subTest(selected_date=selected_date):
+                storage = get_timeblock_storage()
+                # 일간: 하루치 시간 블록 1회, 주간/월간/태그 분석: 주+월 범위 집계 1회
+                # (daylog 저장소는 기록이 있는 날이면 슬롯의 태그 조회 1회 추가)
+                expected = 2
+                if storage.name == "daylog" and storage.get_day(
+                    self.user, selected_date
+                ):
+                    expected += 1
+                get_cache().clear()
+                with self.assertNumQueries(expected):
+                    get_stats_sections(self.user, selected_date)
+                # 데이터가 바뀌지 않았으면 캐시에서 조회
+                with self.assertNumQueries(0):
+                    get_stats_sections(self.user, selected_date)
+
+    def test_sections_match_per_day_queries(self):
+        for selected_date in (self.MONTH_BOUNDARY_DATE, self.MID_MONTH_DATE):
+            with self.subTest(selected_date=selected_date):
+                get_cache().clear()
+                calculator = PerDayStatsCalculator(self.user, selected_date)
+                expected = {
+                    section: stats_func(self.user, selected_date, calculator)
+                    for section, (stats_func, _) in STATS_SECTIONS.items()
+                }
+                self.assertEqual(get_stats_sections(self.user, selected_date), expected)
@@ -1,10 +1,21 @@
 from django.shortcuts import render
 from django.contrib.auth.decorators import login_required
+from django.template.loader import render_to_string
+from django.views.decorators.http import require_GET
 
+from apps.core.conditional import conditional_on_data_version
 from apps.core.utils import (
     safe_date_parse,
+    serialize_for_js,
+    success_response,
+    error_response,
+)
+from .logic import (
+    STATS_TABS,
+    get_section_js_data,
+    get_stats_context,
+    get_stats_sections,
 )
-from .logic import get_stats_context
 from .feedback import generate_feedback
 from itertools import islice
 
@@ -22,9 +33,72 @@ def chunked_iterable(iterable, n):
 
 
 @login_required
+@conditional_on_data_version
 def index(request):
+    """
+    통계 페이지 - 활성 탭(?tab=)과 상단 요약에 필요한 일별 통계만 서버에서 계산
+    (LazyStatsContext이므로 템플릿이 참조한 섹션만 계산됨)
+    나머지 탭과 AI 피드백은 페이지 로드 후 API로 불러옴
+    """
+    selected_date = safe_date_parse(request.GET.get("date"))
+    active_tab = request.GET.get("tab")
+    if active_tab not in STATS_TABS:
+        active_tab = "daily"
+    section, context_name = STATS_TABS[active_tab]
+
+    context = get_stats_context(request.user, selected_date)
+    context["active_tab"] = active_tab
+    context["active_stats_json"] = serialize_for_js(
+        get_section_js_data(section, context[context_name])
+    )
+    return render(request, "stats/index.html", context.as_template_context())
+
+
+@login_required
+@require_GET
+@conditional_on_data_version
+def stats_section_api(request, tab):
+    """
+    통계 탭 API - 탭 하나의 요약 HTML과 차트 데이터 반환
+
+    GET /api/stats/<daily|weekly|monthly|tags>/?date=YYYY-MM-DD
+    """
+    if tab not in STATS_TABS:
+        return error_response("알 수 없는 통계 탭입니다.", "UNKNOWN_TAB", 404)
+
+    selected_date = safe_date_parse(request.GET.get("date"))
+    section, context_name = STATS_TABS[tab]
+    data = get_stats_sections(request.user, selected_date, [section])[section]
+
+    response_data = {
+        "tab": tab,
+        "date": selected_date.strftime("%Y-%m-%d"),
+        "html": render_to_string(
+            f"stats/_tab_{tab}.html", {context_name: data}, request=request
+        ),
+        "chart": get_section_js_data(section, data),
+    }
+    if section == "monthly":
+        response_data["summary"] = {
+            "total_hours": data["total_hours"],
+            "active_days": data["active_days"],
+        }
+    return success_response("통계를 조회했습니다.", response_data)
+
+
+@login_required
+@require_GET
+@conditional_on_data_version
+def stats_feedback_api(request):
+    """
+    AI 피드백/목표 달성률 API - 통계 페이지 하단에 삽입할 HTML 반환
+
+    GET /api/stats/feedback/?date=YYYY-MM-DD
+    """
     selected_date = safe_date_parse(request.GET.get("date"))
     context = get_stats_context(request.user, selected_date)
-    feedback_msgs = generate_feedback(context)
-    context["ai_feedback_msgs"] = feedback_msgs
-    return render(request, "stats/index.html", context)
+    context["ai_feedback_msgs"] = generate_feedback(context)
+    html = render_to_string(
+        "stats/ai_feedback.html", context.as_template_context(), request=request
+    )
+    return success_response("AI 피드백을 조회했습니다.", {"html": html})
@@ -1,5 +1,8 @@
 from django.contrib import admin
+from django.db import transaction
 from django.utils.html import format_html
+from apps.core.cache import bump_data_version
+from apps.stats.rollups import get_rollup_days_for_tag, refresh_daily_rollups
 from .models import Tag
 
 # Register your models here.
@@ -44,3 +47,38 @@ class TagAdmin(admin.ModelAdmin):
     def get_queryset(self, request):
         """쿼리 최적화"""
         return super().get_queryset(request).select_related("user")
+
+    def save_model(self, request, obj, form, change):
+        """태그 변경 시 통계 캐시 무효화 (기본 태그는 모든 사용자)"""
+        super().save_model(request, obj, form, change)
+        affects_all_users = obj.is_default or form.initial.get("is_default")
+        bump_data_version(None if affects_all_users else obj.user_id)
+
+    def _delete_with_rollups(self, tags, delete):
+        """
+        태그 삭제와 해당 태그를 쓰던 날짜의 일별 태그 집계 갱신을 같은 트랜잭션에서 처리
+        (태그 API의 삭제와 동일)
+        """
+        with transaction.atomic():
+            rollup_days = {}
+            for tag in tags:
+                for user_id, dates in get_rollup_days_for_tag(tag).items():
+                    rollup_days.setdefault(user_id, set()).update(dates)
+            delete()
+            for user_id, dates in rollup_days.items():
+                refresh_daily_rollups(user_id, dates)
+                bump_data_version(user_id)
+
+    def delete_model(self, request, obj):
+        self._delete_with_rollups(
+            [obj], lambda: super(TagAdmin, self).delete_model(request, obj)
+        )
+        bump_data_version(None if obj.is_default else obj.user_id)
+
+    def delete_queryset(self, request, queryset):
+        tags = list(queryset)
+        self._delete_with_rollups(
+            tags, lambda: super(TagAdmin, self).delete_queryset(request, queryset)
+        )
+        for user_id in {tag.user_id for tag in tags}:
+            bump_data_version(user_id)
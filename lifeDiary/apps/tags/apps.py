@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class TagsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.tags"
+
+    def ready(self):
+        # 태그 변경 시 사용 가능 태그 캐시 무효화
+        from . import signals  # noqa: F401
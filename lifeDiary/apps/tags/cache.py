@@ -0,0 +1,128 @@
+"""
+=================================================================================
+사용자별 사용 가능 태그 캐시
+- 사용자 태그 목록과 화면용 tags_json을 공유 캐시에 함께 저장
+- 기본 태그는 관리자 화면에서만 바뀌므로 프로세스 메모리에 보관
+  (공유 캐시의 기본 태그 버전이 바뀌면 각 프로세스가 다시 조회)
+- Tag 저장/삭제 시그널(signals.py)에서 버전을 갱신하여 무효화
+  → 캐시가 채워진 뒤에는 태그 조회 쿼리 없이 캐시 한 번 조회로 처리
+- 화면 표시용 (시간 블록 저장 등 쓰기에서는 태그 소유/존재를 DB에서 다시 확인)
+=================================================================================
+"""
+
+import time
+from collections import namedtuple
+
+from django.db import transaction
+
+from apps.core.cache import get_cache, get_cache_counter
+from apps.core.utils import serialize_for_js
+from .models import Tag
+
+DEFAULT_TAGS_VERSION_KEY = "tags:version:default"
+USER_TAGS_TIMEOUT = 60 * 60 * 24 * 7  # 7일
+
+# tags: 기본 태그 → 사용자 태그 순 (각각 이름순)
+AvailableTags = namedtuple(
+    "AvailableTags", ["tags", "default_tags", "user_tags", "by_id", "tags_json"]
+)
+
+# 프로세스 메모리의 기본 태그: (기본 태그 버전, 태그 튜플)
+_default_tags = (None, ())
+
+_counter = get_cache_counter("tags")
+
+
+def _user_tags_key(user_id):
+    return f"tags:user:{user_id}"
+
+
+def _user_version_key(user_id):
+    return f"tags:version:user:{user_id}"
+
+
+def _set_version_on_commit(key):
+    transaction.on_commit(lambda: get_cache().set(key, time.time_ns(), None))
+
+
+def invalidate_user_tags(user_id):
+    """사용자 태그 캐시 무효화 (트랜잭션 안이면 커밋 후)"""
+    _set_version_on_commit(_user_version_key(user_id))
+
+
+def expire_user_tags(user_id):
+    """사용자 태그 캐시를 즉시 삭제 (커밋을 기다리지 않음, 벤치마크의 cold 측정용)"""
+    get_cache().delete(_user_tags_key(user_id))
+
+
+def invalidate_default_tags():
+    """기본 태그 캐시 무효화 (모든 프로세스의 기본 태그와 모든 사용자의 tags_json)"""
+    _set_version_on_commit(DEFAULT_TAGS_VERSION_KEY)
+
+
+def _get_default_tags(version):
+    global _default_tags
+    cached_version, tags = _default_tags
+    if cached_version != version:
+        tags = tuple(Tag.objects.filter(is_default=True).order_by("name"))
+        _default_tags = (version, tags)
+    return tags
+
+
+def _build_tags_json(tags):
+    return serialize_for_js(
+        [
+            {
+                "id": tag.id,
+                "name": tag.name,
+                "color": tag.color,
+                "is_default": tag.is_default,
+            }
+            for tag in tags
+        ]
+    )
+
+
+def get_available_tags(user):
+    """
+    사용자가 사용할 수 있는 태그 (사용자 태그 + 기본 태그)
+
+    Returns:
+        AvailableTags: 태그 목록, ID → 태그 사전, tags_json
+    """
+    cache = get_cache()
+    key = _user_tags_key(user.id)
+    version_keys = [_user_version_key(user.id), DEFAULT_TAGS_VERSION_KEY]
+    found = cache.get_many([key, *version_keys])
+
+    versions = []
+    for version_key in version_keys:
+        if version_key not in found:
+            found[version_key] = time.time_ns()
+            cache.add(version_key, found[version_key], None)
+        versions.append(found[version_key])
+    version = tuple(versions)
+
+    default_tags = _get_default_tags(version[1])
+    entry = found.get(key)
+    if entry is not None and entry[0] == version:
+        _counter.record(hits=1)
+        user_tags, tags_json = entry[1], entry[2]
+    else:
+        _counter.record(misses=1)
+        user_tags = tuple(Tag.objects.filter(user=user).order_by("name"))
+        tags_json = _build_tags_json(default_tags + user_tags)
+        cache.set(key, (version, user_tags, tags_json), USER_TAGS_TIMEOUT)
+
+    # 태그 라벨(Tag.__str__)이 사용자명을 참조하므로 조회 없이 연결 (캐시 저장 후)
+    for tag in user_tags:
+        tag.user = user
+
+    tags = default_tags + user_tags
+    return AvailableTags(
+        tags=tags,
+        default_tags=default_tags,
+        user_tags=user_tags,
+        by_id={tag.id: tag for tag in tags},
+        tags_json=tags_json,
+    )
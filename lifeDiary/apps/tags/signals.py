@@ -0,0 +1,39 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from apps.core.cache import bump_data_version
+from .cache import invalidate_default_tags, invalidate_user_tags
+from .models import Tag
+
+
+def _invalidate_owner(user_id, is_default):
+    # 태그 목록이 포함된 화면의 ETag도 바뀌도록 데이터 버전 갱신 (기본 태그는 전역)
+    if is_default or user_id is None:
+        invalidate_default_tags()
+        bump_data_version(None)
+    else:
+        invalidate_user_tags(user_id)
+        bump_data_version(user_id)
+
+
+@receiver(pre_save, sender=Tag)
+def remember_previous_owner(sender, instance, **kwargs):
+    """수정 전 소유자 기록 (사용자 태그 ↔ 기본 태그 전환 시 이전 쪽 캐시도 무효화)"""
+    instance._previous_owner = None
+    if instance.pk is not None and not instance._state.adding:
+        instance._previous_owner = (
+            Tag.objects.filter(pk=instance.pk)
+            .values_list("user_id", "is_default")
+            .first()
+        )
+
+
+@receiver(post_save, sender=Tag)
+@receiver(post_delete, sender=Tag)
+def invalidate_tag_cache(sender, instance, **kwargs):
+    owners = {(instance.user_id, instance.is_default)}
+    previous = getattr(instance, "_previous_owner", None)
+    if previous:
+        owners.add(previous)
+    for user_id, is_default in owners:
+        _invalidate_owner(user_id, is_default)
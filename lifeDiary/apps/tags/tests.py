@@ -0,0 +1,62 @@
+from datetime import date
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+
+from apps.dashboard.storage import get_timeblock_storage
+from apps.stats.models import DailyTagRollup
+from apps.stats.rollups import refresh_daily_rollups
+from .models import Tag
+
+WRITE_DATE = date(2025, 1, 6)
+
+
+class TagAdminDeleteTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("tag_owner")
+        self.tags = [
+            Tag.objects.create(user=self.user, name=name, color="#123456")
+            for name in ("업무", "운동", "독서")
+        ]
+        storage = get_timeblock_storage()
+        for index, tag in enumerate(self.tags):
+            slots = range(index * 6, index * 6 + 6)
+            storage.save_slots(self.user, WRITE_DATE, slots, tag, "")
+        refresh_daily_rollups(self.user.id, [WRITE_DATE])
+
+        admin_user = User.objects.create_superuser("admin", password="password")
+        self.client.force_login(admin_user)
+
+    def assert_rollups_match_storage(self):
+        # 태그가 삭제된 슬롯은 (날짜, 태그 없음) 집계 하나로 합쳐져야 함
+        call_command("rebuild_rollups", "--verify", verbosity=0)
+        self.assertEqual(
+            DailyTagRollup.objects.filter(user=self.user, tag=None).count(), 1
+        )
+
+    def test_delete_model_refreshes_rollups(self):
+        # 두 번째 삭제에서 이미 있는 (날짜, 태그 없음) 집계와 합쳐져야 함
+        for tag in self.tags[:2]:
+            response = self.client.post(
+                reverse("admin:tags_tag_delete", args=[tag.id]), {"post": "yes"}
+            )
+            self.assertEqual(response.status_code, 302)
+
+        self.assertEqual(Tag.objects.filter(user=self.user).count(), 1)
+        self.assert_rollups_match_storage()
+
+    def test_delete_queryset_refreshes_rollups(self):
+        response = self.client.post(
+            reverse("admin:tags_tag_changelist"),
+            {
+                "action": "delete_selected",
+                "_selected_action": [tag.id for tag in self.tags[:2]],
+                "post": "yes",
+            },
+        )
+
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(Tag.objects.filter(user=self.user).count(), 1)
+        self.assert_rollups_match_storage()
@@ -2,41 +2,34 @@ from django.shortcuts import render, get_object_or_404
 from django.contrib.auth.decorators import login_required
 from django.http import JsonResponse
 from django.views.decorators.http import require_http_methods, require_GET, require_POST
-from django.db import models
+from django.db import models, transaction
 from django.db.models import Q
 import json
 
 from .models import Tag
-from apps.dashboard.models import TimeBlock
-from apps.core.utils import serialize_for_js
+from .cache import get_available_tags
+from apps.stats.models import DailyTagRollup
+from apps.stats.rollups import refresh_daily_rollups, get_rollup_days_for_tag
+from apps.core.cache import bump_data_version
+from apps.core.conditional import conditional_on_data_version
 
 # Create your views here.
 
 
 @login_required
+@conditional_on_data_version
 def index(request):
-    tags = Tag.objects.filter(Q(user=request.user) | Q(is_default=True)).order_by(
-        "-is_default", "name"
-    )
+    available_tags = get_available_tags(request.user)
     context = {
-        "tags": tags,
-        "tags_json": serialize_for_js(
-            [
-                {
-                    "id": tag.id,
-                    "name": tag.name,
-                    "color": tag.color,
-                    "is_default": tag.is_default,
-                }
-                for tag in tags
-            ]
-        ),
+        "tags": available_tags.tags,
+        "tags_json": available_tags.tags_json,
     }
     return render(request, "tags/index.html", context)
 
 
 @login_required
 @require_http_methods(["GET", "POST"])
+@conditional_on_data_version
 def tag_list_create(request):
     """
     태그 목록 조회 (GET) 또는 새 태그 생성 (POST)
@@ -44,9 +37,9 @@ def tag_list_create(request):
     if request.method == "GET":
         # 사용자가 사용 가능한 모든 태그 조회 (기존 get_tags 로직)
         try:
-            tags = Tag.objects.filter(
-                Q(is_default=True) | Q(user=request.user)
-            ).order_by("is_default", "name")
+            # 사용자 태그 → 기본 태그 순
+            available_tags = get_available_tags(request.user)
+            tags = available_tags.user_tags + available_tags.default_tags
 
             tag_list = [
                 {
@@ -183,11 +176,14 @@ def tag_detail_update_delete(request, tag_id):
                     status=400,
                 )
 
+            # 기본 태그 변경은 모든 사용자의 통계에 영향
+            affects_all_users = tag.is_default or is_default
             tag.name = name
             tag.color = color
             tag.is_default = is_default
             tag.user = None if is_default else request.user
             tag.save()
+            bump_data_version(None if affects_all_users else request.user.id)
 
             return JsonResponse(
                 {
@@ -214,7 +210,7 @@ def tag_detail_update_delete(request, tag_id):
         # 태그 삭제 (기존 delete_tag 로직)
         try:
             # 기본 태그는 사용 중이면 삭제 불가
-            if tag.is_default and TimeBlock.objects.filter(tag=tag).exists():
+            if tag.is_default and DailyTagRollup.objects.filter(tag=tag).exists():
                 return JsonResponse(
                     {
                         "success": False,
@@ -224,7 +220,13 @@ def tag_detail_update_delete(request, tag_id):
                 )
 
             tag_name = tag.name
-            tag.delete()
+            # 태그 삭제와 일별 태그 집계 갱신을 같은 트랜잭션에서 처리
+            with transaction.atomic():
+                rollup_days = get_rollup_days_for_tag(tag)
+                tag.delete()
+                for user_id, dates in rollup_days.items():
+                    refresh_daily_rollups(user_id, dates)
+                    bump_data_version(user_id)
 
             return JsonResponse(
                 {"success": True, "message": f'"{tag_name}" 태그가 삭제되었습니다.'}
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class UsersConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.users"
+
+    def ready(self):
+        # 목표/메모 변경 시 데이터 버전 갱신
+        from . import signals  # noqa: F401
@@ -1,5 +1,6 @@
 from django import forms
 from django.core.exceptions import ValidationError
+from apps.tags.models import Tag
 from .models import UserGoal, UserNote
 
 
@@ -47,6 +48,19 @@ class UserGoalForm(forms.ModelForm):
                 {"onchange": "updateTargetHoursMax()"}
             )
 
+    def set_available_tags(self, tags):
+        """
+        태그 선택지를 사용 가능 태그 목록(apps.tags.cache)으로 설정
+        - 선택지 렌더링에는 목록을 그대로 사용하므로 태그 조회 없음
+        - 제출값 검증만 해당 태그로 제한한 queryset으로 조회
+        """
+        field = self.fields["tag"]
+        field.queryset = Tag.objects.filter(pk__in=[tag.pk for tag in tags])
+        choices = [(tag.pk, str(tag)) for tag in tags]
+        if field.empty_label is not None:
+            choices.insert(0, ("", field.empty_label))
+        field.choices = choices
+
 
 class UserNoteForm(forms.ModelForm):
     class Meta:
@@ -0,0 +1,14 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.core.cache import bump_data_version
+from .models import UserGoal, UserNote
+
+
+@receiver(post_save, sender=UserGoal)
+@receiver(post_delete, sender=UserGoal)
+@receiver(post_save, sender=UserNote)
+@receiver(post_delete, sender=UserNote)
+def bump_user_data_version(sender, instance, **kwargs):
+    """목표/메모 변경 시 데이터 버전 갱신 (마이페이지 등의 ETag 무효화)"""
+    bump_data_version(instance.user_id)
@@ -6,12 +6,9 @@ from django.contrib import messages
 from django.contrib.auth.decorators import login_required
 from .models import UserGoal, UserNote
 from .forms import UserGoalForm, UserNoteForm
-from apps.tags.models import Tag
-from apps.stats.logic import (
-    get_weekly_stats_data,
-    get_monthly_stats_data,
-    StatsCalculator,
-)
+from apps.tags.cache import get_available_tags
+from apps.stats.goals import GoalProgressService
+from apps.core.conditional import conditional_on_data_version
 
 import datetime
 
@@ -73,12 +70,14 @@ def login_view(request):
 
 
 @login_required
+@conditional_on_data_version
 def usergoal_list(request):
     goals = UserGoal.objects.filter(user=request.user).select_related("tag")
     return render(request, "users/usergoal_list.html", {"goals": goals})
 
 
 @login_required
+@conditional_on_data_version
 def usergoal_create(request):
     if request.method == "POST":
         form = UserGoalForm(request.POST)
@@ -89,13 +88,12 @@ def usergoal_create(request):
             return redirect("users:mypage")
     else:
         form = UserGoalForm()
-    form.fields["tag"].queryset = Tag.objects.filter(
-        user=request.user
-    ) | Tag.objects.filter(is_default=True)
+    form.set_available_tags(get_available_tags(request.user).tags)
     return render(request, "users/usergoal_form.html", {"form": form, "mode": "create"})
 
 
 @login_required
+@conditional_on_data_version
 def usergoal_update(request, pk):
     goal = UserGoal.objects.get(pk=pk, user=request.user)
     if request.method == "POST":
@@ -105,9 +103,7 @@ def usergoal_update(request, pk):
             return redirect("users:mypage")
     else:
         form = UserGoalForm(instance=goal)
-    form.fields["tag"].queryset = Tag.objects.filter(
-        user=request.user
-    ) | Tag.objects.filter(is_default=True)
+    form.set_available_tags(get_available_tags(request.user).tags)
     return render(request, "users/usergoal_form.html", {"form": form, "mode": "update"})
 
 
@@ -121,12 +117,14 @@ def usergoal_delete(request, pk):
 
 
 @login_required
+@conditional_on_data_version
 def usernote_list(request):
     notes = UserNote.objects.filter(user=request.user).order_by("-created_at")
     return render(request, "users/usernote_list.html", {"notes": notes})
 
 
 @login_required
+@conditional_on_data_version
 def usernote_create(request):
     if request.method == "POST":
         form = UserNoteForm(request.POST)
@@ -141,6 +139,7 @@ def usernote_create(request):
 
 
 @login_required
+@conditional_on_data_version
 def usernote_update(request, pk):
     note = UserNote.objects.get(pk=pk, user=request.user)
     if request.method == "POST":
@@ -163,60 +162,12 @@ def usernote_delete(request, pk):
 
 
 @login_required
+@conditional_on_data_version
 def mypage(request):
     user = request.user
     goals = UserGoal.objects.filter(user=user).select_related("tag")
-    # 통계 데이터 가져오기
-    today = datetime.date.today()
-    calculator = StatsCalculator(user, today)
-    weekly_stats = get_weekly_stats_data(user, today, calculator)
-    monthly_stats = get_monthly_stats_data(user, today, calculator)
-    # 목표별 달성률 계산
-    for goal in goals:
-        if goal.period == "daily":
-            # 일간: 오늘 해당 태그 실제 시간
-            actual = 0
-            for tag_stat in weekly_stats["tag_weekly_stats"]:
-                if tag_stat["name"] == goal.tag.name:
-                    # 오늘이 week_dates[?]에 해당하는 인덱스
-                    day_index = (today - calculator.start_of_week).days
-                    if 0 <= day_index < 7:
-                        actual = tag_stat["daily_hours"][day_index]
-            percent = (
-                int((actual / goal.target_hours) * 100)
-                if goal.target_hours > 0
-                else None
-            )
-            goal.percent = percent
-            goal.actual = actual
-        elif goal.period == "weekly":
-            # 주간: 해당 태그 주간 총합
-            actual = 0
-            for tag_stat in weekly_stats["tag_weekly_stats"]:
-                if tag_stat["name"] == goal.tag.name:
-                    actual = tag_stat["total_hours"]
-            # 사용자가 입력한 목표 시간을 그대로 사용 (주간 총 시간)
-            percent = (
-                int((actual / goal.target_hours) * 100)
-                if goal.target_hours > 0
-                else None
-            )
-            goal.percent = percent
-            goal.actual = actual
-        elif goal.period == "monthly":
-            # 월간: 해당 태그 월간 총합
-            actual = 0
-            for tag_stat in monthly_stats["tag_stats"]:
-                if tag_stat["name"] == goal.tag.name:
-                    actual = tag_stat["total_hours"]
-            # 사용자가 입력한 목표 시간을 그대로 사용 (월간 총 시간)
-            percent = (
-                int((actual / goal.target_hours) * 100)
-                if goal.target_hours > 0
-                else None
-            )
-            goal.percent = percent
-            goal.actual = actual
+    # 목표별 달성률 계산 (기간별 그룹 집계)
+    goals = GoalProgressService(user, datetime.date.today()).apply(goals)
     if request.method == "POST":
         form = UserGoalForm(request.POST)
         if form.is_valid():
@@ -227,7 +178,5 @@ def mypage(request):
     else:
         form = UserGoalForm()
         form.fields["period"].initial = "monthly"
-    form.fields["tag"].queryset = Tag.objects.filter(user=user) | Tag.objects.filter(
-        is_default=True
-    )
+    form.set_available_tags(get_available_tags(user).tags)
     return render(request, "users/mypage.html", {"goals": goals, "form": form})
@@ -51,11 +51,13 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     "whitenoise.middleware.WhiteNoiseMiddleware",
+    "apps.core.middleware.RequestMetricsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "apps.core.middleware.ProfilingMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
@@ -136,3 +138,76 @@ STATIC_ROOT = os.path.join(BASE_DIR, "staticfiles")
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
+
+# 시간 기록 저장 방식 (apps.dashboard.storage)
+# - rows: 슬롯당 한 행 (TimeBlock, 기본값)
+# - daylog: 사용자·날짜당 한 행 (DayLog, 144개 태그 ID를 바이트로 저장)
+# 변경 전에 manage.py convert_timeblock_storage --to <저장 방식> 실행
+TIMEBLOCK_STORAGE = os.getenv("TIMEBLOCK_STORAGE", "rows")
+
+# 변경 피드(/api/time-blocks/changes/)용 삭제 기록 보관 기간 (일)
+# 이보다 오래된 커서로 요청하면 전체 다시 불러오기(RESYNC_REQUIRED) 응답
+TIMEBLOCK_TOMBSTONE_RETENTION_DAYS = 30
+
+# 통계 집계 백엔드 (apps.stats.aggregation)
+# - rollup: 일별 태그 집계 테이블 조회 (기본값)
+# - python: 원본 시간 블록 순회
+# - numpy: 원본 시간 블록 벡터 집계 (numpy 설치 필요)
+# - sql: 원본 시간 블록을 DB에서 날짜/태그별 GROUP BY 집계
+STATS_AGGREGATION_BACKEND = os.getenv("STATS_AGGREGATION_BACKEND", "rollup")
+
+# 캐시 (통계 캐시 등 apps.core.cache에서 사용)
+# CACHE_BACKEND: locmem(기본값, 프로세스별) | file | redis (redis 패키지 필요)
+# 여러 워커 프로세스로 운영할 때는 버전 정보가 공유되도록 file 또는 redis 사용
+CACHE_BACKENDS = {
+    "locmem": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "lifediary",
+    },
+    "file": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": os.getenv("CACHE_LOCATION", os.path.join(BASE_DIR, ".cache")),
+    },
+    "redis": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": os.getenv("CACHE_LOCATION", "redis://127.0.0.1:6379"),
+    },
+}
+CACHE_BACKEND = os.getenv("CACHE_BACKEND", "locmem")
+CACHES = {"default": CACHE_BACKENDS[CACHE_BACKEND]}
+STATS_CACHE_ALIAS = "default"
+STATS_CACHE_TIMEOUT = 60 * 60 * 24 * 7  # 7일
+
+# 배포 버전 (apps.core.conditional의 ETag에 포함, 배포 후 이전 화면이 304로 재사용되지 않도록)
+# Render에서는 RENDER_GIT_COMMIT이 자동으로 설정됨
+RELEASE_VERSION = os.getenv("RELEASE_VERSION", os.getenv("RENDER_GIT_COMMIT", ""))
+
+# 요청 계측 (apps.core.middleware.RequestMetricsMiddleware)
+# 계측할 요청 비율 (0~1, 0이면 계측하지 않음)
+REQUEST_METRICS_SAMPLE_RATE = float(os.getenv("REQUEST_METRICS_SAMPLE_RATE", "1.0"))
+
+# Prometheus 지표 (/metrics, apps.core.views.metrics_view)
+# 요청에 Authorization: Bearer <METRICS_TOKEN> 헤더 필요, 비어 있으면 /metrics 비활성화(404)
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
+
+# 관리자 요청 프로파일링 (apps.core.middleware.ProfilingMiddleware)
+# ?_profile=1 (또는 text)을 붙인 관리자 요청의 보고서 저장 위치와 보관 개수
+PROFILING_QUERY_PARAM = "_profile"
+PROFILING_DIR = os.getenv("PROFILING_DIR", os.path.join(BASE_DIR, ".profiles"))
+PROFILING_MAX_REPORTS = int(os.getenv("PROFILING_MAX_REPORTS", "20"))
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {
+        "console": {"class": "logging.StreamHandler"},
+    },
+    "loggers": {
+        # 요청별 계측 결과 (한 줄에 JSON 하나)
+        "apps.core.middleware": {
+            "handlers": ["console"],
+            "level": os.getenv("REQUEST_METRICS_LOG_LEVEL", "INFO"),
+            "propagate": False,
+        },
+    },
+}
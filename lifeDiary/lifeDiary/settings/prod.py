@@ -9,6 +9,8 @@ For more information on this file, see
 https://docs.djangoproject.com/en/5.2/topics/settings/
 """
 
+from django.core.exceptions import ImproperlyConfigured
+
 from .dev import *
 
 # 프로덕션 환경 오버라이드
@@ -19,3 +21,16 @@ ALLOWED_HOSTS = ["lifediary.onrender.com"]
 SESSION_COOKIE_AGE = 3600  # 1시간 (초 단위)
 SESSION_EXPIRE_AT_BROWSER_CLOSE = True  # 브라우저 종료 시 세션 만료
 SESSION_SAVE_EVERY_REQUEST = True  # 매 요청마다 세션 저장 (활성화 시간 갱신)
+
+# 요청 계측은 일부 요청만 샘플링 (apps.core.middleware)
+REQUEST_METRICS_SAMPLE_RATE = float(os.getenv("REQUEST_METRICS_SAMPLE_RATE", "0.1"))
+
+# 캐시: 데이터 버전(apps.core.cache)을 gunicorn 워커들이 공유해야 하므로
+# 프로세스별 캐시(locmem)는 사용할 수 없음 (한 워커의 갱신이 다른 워커에 보이지 않음)
+# - file(기본값): 같은 서버의 워커끼리 공유, 서버가 여러 대면 redis 사용
+CACHE_BACKEND = os.getenv("CACHE_BACKEND", "file")
+if CACHE_BACKEND == "locmem":
+    raise ImproperlyConfigured(
+        "프로덕션에서는 워커 간에 공유되는 캐시(CACHE_BACKEND=file 또는 redis)가 필요합니다."
+    )
+CACHES = {"default": CACHE_BACKENDS[CACHE_BACKEND]}
@@ -18,6 +18,7 @@ Including another URLconf
 from django.contrib import admin
 from django.urls import path, include
 from django.contrib.auth.decorators import user_passes_test
+from apps.core.views import metrics_view
 from . import views
 
 # 관리자만 admin 패널 접근 가능하도록 제한
@@ -36,4 +37,7 @@ urlpatterns = [
     # API URLs
     path("api/", include("apps.dashboard.api_urls")),
     path("api/", include("apps.tags.api_urls")),
+    path("api/", include("apps.stats.api_urls")),
+    # Prometheus 지표 (METRICS_TOKEN 필요)
+    path("metrics", metrics_view, name="metrics"),
 ]